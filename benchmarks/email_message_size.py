@@ -0,0 +1,70 @@
+"""
+Email Message Size Benchmark
+
+Compares building a fresh MIMEMultipart message per recipient (the previous
+send path) against the prepared message built once per digest, in bytes on
+the wire per message and CPU time per send.
+
+Usage:
+    python benchmarks/email_message_size.py --articles 15 --recipients 1000
+"""
+
+import argparse
+import sys
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.agent.ai_agent import AINewsAgent
+from src.agent.message_builder import build_message
+from sentiment_throughput import make_articles
+
+SENDER = 'digest@example.com'
+SUBJECT = 'AI News Digest'
+
+
+def mime_per_send(html: str, recipient: str) -> bytes:
+    """The previous send path: one MIMEMultipart with a single HTML part per recipient"""
+    msg = MIMEMultipart()
+    msg['From'] = SENDER
+    msg['To'] = recipient
+    msg['Subject'] = SUBJECT
+    msg.attach(MIMEText(html, 'html'))
+    return msg.as_string().encode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark digest email size and per-send cost")
+    parser.add_argument('--articles', type=int, default=15)
+    parser.add_argument('--recipients', type=int, default=1_000)
+    args = parser.parse_args()
+    
+    agent = AINewsAgent('benchmark', {'smtp_server': 'localhost', 'smtp_port': 25,
+                                      'email': SENDER, 'password': ''})
+    articles = agent.tagger.annotate(make_articles(args.articles))
+    for article in articles:
+        article.update(source='Benchmark Feed', published='Mon, 01 Jan 2024 00:00:00 GMT')
+    html = agent._create_html_digest(articles)
+    recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+    
+    start = time.perf_counter()
+    old_bytes = sum(len(mime_per_send(html, recipient)) for recipient in recipients)
+    old_seconds = time.perf_counter() - start
+    
+    build_message.cache_clear()
+    start = time.perf_counter()
+    new_bytes = sum(len(build_message(SENDER, SUBJECT, html).for_recipient(recipient)) for recipient in recipients)
+    new_seconds = time.perf_counter() - start
+    
+    n = len(recipients)
+    print(f"Per-send MIMEMultipart: {old_bytes / n:9,.0f} bytes/message  {old_seconds / n * 1e6:8.1f} µs/send")
+    print(f"Prepared message:       {new_bytes / n:9,.0f} bytes/message  {new_seconds / n * 1e6:8.1f} µs/send "
+          f"(includes a plain-text alternative)")
+    print(f"Size: {new_bytes / old_bytes:.1%} of previous, CPU: {old_seconds / new_seconds:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
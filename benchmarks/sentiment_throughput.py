@@ -0,0 +1,69 @@
+"""
+Sentiment Throughput Benchmark
+
+Compares batch sentiment scoring and tagging against scoring one article at a
+time on synthetic articles.
+
+Usage:
+    python benchmarks/sentiment_throughput.py --articles 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.agent.sentiment import SentimentTagger, POSITIVE_TERMS, NEGATIVE_TERMS, TOPIC_TERMS
+
+FILLER = ("the a new model company said on with for its and this week users data team "
+          "announced system more than about into after report people").split()
+
+
+def make_articles(count: int, seed: int = 0):
+    """Build synthetic articles mixing filler words with lexicon terms"""
+    rng = random.Random(seed)
+    lexicon = list(POSITIVE_TERMS) + list(NEGATIVE_TERMS) + [t for terms in TOPIC_TERMS.values() for t in terms]
+    articles = []
+    for i in range(count):
+        words = rng.choices(FILLER, k=45) + rng.choices(lexicon, k=5)
+        rng.shuffle(words)
+        articles.append({
+            'title': ' '.join(words[:10]).capitalize(),
+            'summary': f"<p>{' '.join(words[10:])}.</p>",
+            'link': f"https://example.com/{i}"
+        })
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch sentiment scoring")
+    parser.add_argument('--articles', type=int, default=100_000)
+    parser.add_argument('--per-article', type=int, default=2_000,
+                        help="Articles to score one at a time for comparison")
+    args = parser.parse_args()
+    
+    tagger = SentimentTagger()
+    articles = make_articles(args.articles)
+    
+    start = time.perf_counter()
+    tagger.annotate(articles)
+    batch_seconds = time.perf_counter() - start
+    
+    sample = articles[:args.per_article]
+    start = time.perf_counter()
+    for article in sample:
+        tagger.annotate([article])
+    single_seconds = (time.perf_counter() - start) / len(sample) * len(articles)
+    
+    print(f"Batch:       {args.articles:,} articles in {batch_seconds:.2f} s "
+          f"({args.articles / batch_seconds:,.0f} articles/s)")
+    print(f"Per article: {args.articles:,} articles in {single_seconds:.2f} s (extrapolated) "
+          f"({args.articles / single_seconds:,.0f} articles/s)")
+    print(f"Speedup:     {single_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
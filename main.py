@@ -4,69 +4,302 @@ AI News Agent - Main Entry Point
 This is the main script to run the AI News Agent application.
 """
 
+import os
 import time
+import argparse
+import multiprocessing
 import schedule
+from dataclasses import asdict
 from datetime import datetime
+from typing import Sequence
 
 from src.agent.ai_agent import AINewsAgent
-from src.config.settings import get_settings, validate_config, print_config_help
+from src.agent.news_searcher import AINewsSearcher
+from src.agent.ingest_worker import run_ingest_worker
+from src.config.settings import Settings, get_settings, validate_config, print_config_help
+from src.config.reloader import SettingsReloader, changed_settings
+from src.storage.article_store import ArticleStore
+from src.storage.lease_coordinator import SourceLeaseCoordinator
+from src.storage.digest_archive import DigestArchive
+from src.storage.snapshot_store import SnapshotStore
+from src.storage.llm_budget import LLMBudget
+from src.storage.checkpoint_store import CheckpointStore
+from src.server.digest_server import DigestServer
+from src.utils.profiling import RunProfiler
 
+# Seconds between checks of the config file for changes
+RELOAD_POLL_SECONDS = 5
 
-def send_daily_digest(agent: AINewsAgent, recipient_email: str):
+# Settings applied to the running agent on reload
+AGENT_SETTINGS = ['max_articles', 'summary_mode', 'enrich_content', 'sentiment_analysis']
+AGENT_CONFIGS = ['email_config', 'delivery_config', 'llm_config']
+
+# Settings that only take effect after a restart
+RESTART_REQUIRED = ['gemini_api_key', 'run_mode', 'data_dir', 'ingest_workers', 'use_article_store',
+                    'archive_digests', 'publish_snapshots', 'checkpoint_runs', 'checkpoint_max_age_hours',
+                    'llm_budget', 'http_config']
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="AI News Agent")
+    parser.add_argument('--profile', action='store_true',
+                        help='Run one digest with CPU and memory profiling, then exit')
+    parser.add_argument('--profile-dir', help='Directory for profiling artifacts (default: DATA_DIR/profiles/<timestamp>)')
+    parser.add_argument('--flamegraph', action='store_true',
+                        help='With --profile, also sample stacks to a folded file for flame graphs')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue the latest unfinished digest run from its last completed stage')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    search = subparsers.add_parser('search', help='Search the archive of past digests')
+    search.add_argument('query', help='Search terms; wrap words in double quotes to match a phrase')
+    search.add_argument('--phrase', action='store_true', help='Match the whole query as one phrase')
+    search.add_argument('--since', help='Only digests sent on or after this date (YYYY-MM-DD)')
+    search.add_argument('--until', help='Only digests sent on or before this date (YYYY-MM-DD)')
+    search.add_argument('--limit', type=int, default=20, help='Maximum number of results')
+    
+    serve = subparsers.add_parser('serve', help='Serve published digests over HTTP')
+    serve.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    serve.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    
+    return parser.parse_args(argv)
+
+
+def search_archive(settings: Settings, args: argparse.Namespace):
+    """Print archived articles matching a search query"""
+    archive = DigestArchive(os.path.join(settings.data_dir, 'archive.db'))
+    
+    start = time.perf_counter()
+    try:
+        results = archive.search(args.query, phrase=args.phrase, since=args.since,
+                                 until=args.until, limit=args.limit)
+    except ValueError as e:
+        print(f"❌ Invalid search: {e}")
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    for result in results:
+        if result['type'] == 'digest':
+            print(f"[{result['sent']}] Digest #{result['digest_id']}: {result['title']}")
+            print(f"    {result['snippet']}")
+            continue
+        print(f"[{result['sent']}] {result['title']} ({result['source']})")
+        print(f"    {result['snippet']}")
+        print(f"    {result['link']}")
+    
+    print(f"🔎 {len(results)} results in {elapsed_ms:.1f} ms")
+
+
+def serve_digests(settings: Settings, args: argparse.Namespace):
+    """Serve precomputed digest snapshots over HTTP"""
+    server = DigestServer(SnapshotStore(os.path.join(settings.data_dir, 'snapshots')), args.host, args.port)
+    host, port = server.address
+    
+    print(f"🌐 Serving digests on http://{host}:{port}/digests")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Digest server stopped by user")
+    finally:
+        server.shutdown()
+
+
+def run_profiled_digest(agent: AINewsAgent, recipient_email: Sequence[str], settings: Settings, args: argparse.Namespace):
+    """Run a single digest with per-stage profiling and print a hot-spot report"""
+    run_dir = args.profile_dir or os.path.join(
+        settings.data_dir, 'profiles', datetime.now().strftime('%Y%m%dT%H%M%S')
+    )
+    profiler = RunProfiler(run_dir, sample_interval=0.005 if args.flamegraph else None)
+    
+    print(f"🔬 Profiling digest run, writing artifacts to {run_dir}")
+    agent.profiler = profiler
+    profiler.start()
+    try:
+        agent.generate_and_send_digest(recipient_email)
+    finally:
+        profiler.stop()
+        agent.profiler = None
+    
+    print(profiler.report())
+
+
+def send_daily_digest(agent: AINewsAgent, reloader: SettingsReloader):
     """Send daily digest wrapper function"""
     try:
         print(f"🌅 Daily digest triggered at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        agent.generate_and_send_digest(recipient_email)
+        # Recipients are read at send time so reloaded lists apply to the next digest
+        agent.generate_and_send_digest(reloader.current.recipients)
     except Exception as e:
         print(f"❌ Error in scheduled digest: {e}")
 
 
+def schedule_digest(agent: AINewsAgent, reloader: SettingsReloader):
+    """(Re)schedule the daily digest at the configured time"""
+    schedule_time = reloader.current.schedule_time
+    schedule.clear('digest')
+    schedule.every().day.at(schedule_time).do(send_daily_digest, agent, reloader).tag('digest')
+    print(f"⏰ AI News Agent scheduled to run daily at {schedule_time}")
+
+
+def apply_settings(agent: AINewsAgent, reloader: SettingsReloader, old: Settings, new: Settings):
+    """Apply reloaded settings to the running agent and scheduler"""
+    changed = changed_settings(old, new)
+    
+    agent.reconfigure(
+        **{name: getattr(new, name) for name in AGENT_SETTINGS if name in changed},
+        **{name: asdict(getattr(new, name)) for name in AGENT_CONFIGS if name in changed}
+    )
+    
+    if 'schedule_time' in changed:
+        schedule_digest(agent, reloader)
+    
+    needs_restart = [name for name in changed if name in RESTART_REQUIRED]
+    if needs_restart:
+        print(f"⚠️ Restart to apply: {', '.join(needs_restart)}")
+
+
+def run_ingest(settings: Settings):
+    """Run sharded feed ingestion across several worker processes"""
+    db_path = os.path.join(settings.data_dir, 'news.db')
+    
+    # Register every source once; workers lease them from the shared database
+    searcher = AINewsSearcher()
+    coordinator = SourceLeaseCoordinator(db_path)
+    coordinator.register_sources({**searcher.news_sources, 'Google News': searcher.google_news_url()})
+    coordinator.close()
+    
+    stop_event = multiprocessing.Event()
+    workers = [
+        multiprocessing.Process(
+            target=run_ingest_worker,
+            args=(db_path, asdict(settings.http_config)),
+            kwargs={'stop_event': stop_event}
+        )
+        for _ in range(settings.ingest_workers)
+    ]
+    
+    print(f"📥 Starting {len(workers)} ingest workers on {db_path}")
+    for worker in workers:
+        worker.start()
+    
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping ingest workers...")
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+
+
 def main():
     """Main function to set up and run the AI news agent"""
     
+    args = parse_args()
+    try:
+        settings = get_settings()
+    except (OSError, ValueError) as e:
+        print(f"❌ Configuration Error: {e}")
+        return
+    
+    if args.command == 'search':
+        search_archive(settings, args)
+        return
+    
+    if args.command == 'serve':
+        serve_digests(settings, args)
+        return
+    
     print("🤖 Starting AI News Agent...")
     
     # Get and validate configuration
-    settings = get_settings()
-    is_valid, error_msg = validate_config()
+    is_valid, error_msg = validate_config(settings)
     
     if not is_valid:
         print_config_help()
         print(f"\n❌ Configuration Error: {error_msg}")
         return
     
-    print(f"📧 Will send digest to: {settings['recipient_email']}")
+    if settings.run_mode == 'ingest':
+        run_ingest(settings)
+        return
+    
+    print(f"📧 Will send digest to: {', '.join(settings.recipients)}")
+    
+    # Read articles collected by ingest workers instead of fetching feeds directly
+    article_store = None
+    if settings.use_article_store:
+        article_store = ArticleStore(os.path.join(settings.data_dir, 'news.db'))
+    
+    # Keep every sent digest searchable with `python main.py search`
+    digest_archive = None
+    if settings.archive_digests:
+        digest_archive = DigestArchive(os.path.join(settings.data_dir, 'archive.db'))
+    
+    # Precompute snapshots for `python main.py serve`
+    snapshot_store = None
+    if settings.publish_snapshots:
+        snapshot_store = SnapshotStore(os.path.join(settings.data_dir, 'snapshots'))
+    
+    # Checkpoint each stage so failed runs can be resumed with --resume
+    checkpoint_store = None
+    if settings.checkpoint_runs:
+        checkpoint_store = CheckpointStore(os.path.join(settings.data_dir, 'checkpoints'),
+                                           max_age_hours=settings.checkpoint_max_age_hours)
+    
+    # Rate limits and daily budgets for Gemini, shared with other runs and processes
+    llm_budget = LLMBudget(os.path.join(settings.data_dir, 'llm.db'), **asdict(settings.llm_budget))
     
     # Create AI agent
     try:
         agent = AINewsAgent(
-            gemini_api_key=settings['gemini_api_key'],
-            email_config=settings['email_config']
+            gemini_api_key=settings.gemini_api_key,
+            email_config=asdict(settings.email_config),
+            summary_mode=settings.summary_mode,
+            enrich_content=settings.enrich_content,
+            http_config=asdict(settings.http_config),
+            article_store=article_store,
+            digest_archive=digest_archive,
+            snapshot_store=snapshot_store,
+            delivery_config=asdict(settings.delivery_config),
+            sentiment_analysis=settings.sentiment_analysis,
+            llm_budget=llm_budget,
+            llm_config=asdict(settings.llm_config),
+            checkpoint_store=checkpoint_store,
+            max_articles=settings.max_articles
         )
         
-        if settings['run_mode'] == 'once':
+        if args.profile:
+            run_profiled_digest(agent, settings.recipients, settings, args)
+        
+        elif settings.run_mode == 'once':
             # Option 1: Run once (for testing)
             print("📰 Generating AI news digest (one-time run)...")
-            agent.generate_and_send_digest(settings['recipient_email'])
-            
+            agent.generate_and_send_digest(settings.recipients, resume=args.resume)
+        
         else:
             # Option 2: Schedule daily emails
-            schedule_time = settings['schedule_time']
+            if args.resume:
+                print("📰 Resuming the latest unfinished digest run...")
+                agent.generate_and_send_digest(settings.recipients, resume=True)
             
-            def scheduled_digest():
-                send_daily_digest(agent, settings['recipient_email'])
+            # Apply config file edits and SIGHUP reloads without restarting
+            reloader = SettingsReloader(settings)
+            reloader.install_signal_handler()
+            reloader.subscribe(lambda old, new: apply_settings(agent, reloader, old, new))
             
             # Schedule daily digest
-            schedule.every().day.at(schedule_time).do(scheduled_digest)
+            schedule_digest(agent, reloader)
             
-            print(f"⏰ AI News Agent scheduled to run daily at {schedule_time}")
             print("🔄 Service is running... Press Ctrl+C to stop")
             
             # Keep the script running
             while True:
                 try:
                     schedule.run_pending()
-                    time.sleep(60)  # Check every minute
+                    reloader.wait(RELOAD_POLL_SECONDS)
+                    reloader.check()
                 except KeyboardInterrupt:
                     print("\n👋 AI News Agent stopped by user")
                     break
@@ -74,7 +307,7 @@ def main():
                     print(f"❌ Scheduler error: {e}")
                     print("🔄 Continuing...")
                     time.sleep(300)  # Wait 5 minutes before retrying
-        
+    
     except Exception as e:
         print(f"❌ Error initializing AI agent: {e}")
         return
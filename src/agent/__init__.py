@@ -5,14 +5,33 @@ This module contains the main components of the AI News Agent:
 - AINewsSearcher: News aggregation from multiple sources
 - EmailSender: Email delivery functionality  
 - AINewsAgent: Main orchestrator class
+- ExtractiveSummarizer: Local extractive summaries
+- ArticleContentExtractor: Full-article text extraction
+- HTTPTransport: Shared keep-alive HTTP client
+- DeliveryDispatcher: Concurrent fan-out to email and webhook channels
+- SentimentTagger: Batch sentiment scoring and topic tagging
 """
 
 from .ai_agent import AINewsAgent
 from .news_searcher import AINewsSearcher
 from .email_sender import EmailSender
+from .summarizer import ExtractiveSummarizer
+from .content_extractor import ArticleContentExtractor
+from .http_transport import HTTPTransport
+from .delivery import DeliveryDispatcher, EmailChannel, WebhookChannel, SlackChannel, DiscordChannel
+from .sentiment import SentimentTagger
 
 __all__ = [
     "AINewsAgent",
     "AINewsSearcher",
-    "EmailSender"
+    "EmailSender",
+    "ExtractiveSummarizer",
+    "ArticleContentExtractor",
+    "HTTPTransport",
+    "DeliveryDispatcher",
+    "EmailChannel",
+    "WebhookChannel",
+    "SlackChannel",
+    "DiscordChannel",
+    "SentimentTagger"
 ] 
\ No newline at end of file
@@ -4,23 +4,51 @@ AI Agent Module
 Main orchestrator class that coordinates news searching and email sending.
 """
 
+import asyncio
+import hashlib
 import json
+import sqlite3
+from contextlib import nullcontext
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Union
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.schema import HumanMessage
 from langchain.tools import Tool
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain import hub
 
 from .news_searcher import AINewsSearcher
 from .email_sender import EmailSender
+from .summarizer import ExtractiveSummarizer
+from .content_extractor import ArticleContentExtractor
+from .http_transport import HTTPTransport
+from .delivery import EmailChannel, DeliveryDispatcher, build_channels
+from .sentiment import SentimentTagger
+from .llm_client import GuardedLLM
+from ..storage.article_store import ArticleStore
+from ..storage.digest_archive import DigestArchive
+from ..storage.snapshot_store import SnapshotStore
+from ..storage.llm_budget import LLMBudget
+from ..storage.checkpoint_store import CheckpointStore
+from ..utils.profiling import RunProfiler
+
+DEFAULT_SUMMARY = "Latest developments in AI technology and research."
+
+# Candidates read from the article store per digest article; deduplication is quadratic in this
+STORE_CANDIDATES_PER_ARTICLE = 5
 
 
 class AINewsAgent:
     """Main AI agent that coordinates news searching and email sending"""
     
-    def __init__(self, gemini_api_key: str, email_config: Dict):
+    def __init__(self, gemini_api_key: str, email_config: Dict, summary_mode: str = "llm",
+                 prompt_sentences: int = 12, enrich_content: bool = False,
+                 http_config: Optional[Dict] = None, article_store: Optional[ArticleStore] = None,
+                 digest_archive: Optional[DigestArchive] = None,
+                 snapshot_store: Optional[SnapshotStore] = None,
+                 delivery_config: Optional[Dict[str, List[str]]] = None,
+                 sentiment_analysis: bool = True, llm_budget: Optional[LLMBudget] = None,
+                 llm_config: Optional[Dict] = None,
+                 checkpoint_store: Optional[CheckpointStore] = None, max_articles: int = 10):
         # Initialize Gemini model
         self.llm = ChatGoogleGenerativeAI(
             model="gemini-2.0-flash",
@@ -28,9 +56,27 @@ class AINewsAgent:
             temperature=0.3
         )
         
-        # Initialize tools
-        self.news_searcher = AINewsSearcher()
+        # Budgeted, time-bounded access to the model, shared with other processes via llm_budget
+        self.llm_budget = llm_budget
+        self.llm_client = GuardedLLM(self.llm, budget=llm_budget, **(llm_config or {}))
+        
+        # Initialize tools (sharing one pooled HTTP transport)
+        self.transport = HTTPTransport(**(http_config or {}))
+        # Feeds are parsed with the same threading rule as the other CPU-bound stages
+        self.news_searcher = AINewsSearcher(transport=self.transport, run_blocking=self._arun_blocking)
         self.email_sender = EmailSender(**email_config)
+        self.summarizer = ExtractiveSummarizer()
+        self.summary_mode = summary_mode
+        self.prompt_sentences = prompt_sentences
+        self.max_articles = max_articles
+        self.article_store = article_store
+        self.digest_archive = digest_archive
+        self.snapshot_store = snapshot_store
+        self.checkpoint_store = checkpoint_store
+        self.channels = build_channels(delivery_config or {}, session=self.transport.session)
+        self.profiler: Optional[RunProfiler] = None
+        self.content_extractor = ArticleContentExtractor(session=self.transport.session) if enrich_content else None
+        self.tagger = SentimentTagger() if sentiment_analysis else None
         
         # Create LangChain tools
         self.tools = [
@@ -49,15 +95,63 @@ class AINewsAgent:
         # Create agent
         self.agent = self._create_agent()
     
+    def reconfigure(self, max_articles: Optional[int] = None, summary_mode: Optional[str] = None,
+                    enrich_content: Optional[bool] = None, sentiment_analysis: Optional[bool] = None,
+                    email_config: Optional[Dict] = None, delivery_config: Optional[Dict[str, List[str]]] = None,
+                    llm_config: Optional[Dict] = None):
+        """Apply changed settings in place, keeping the HTTP pools, stores and caches"""
+        if max_articles is not None:
+            self.max_articles = max_articles
+        if summary_mode is not None:
+            self.summary_mode = summary_mode
+        if enrich_content is not None and enrich_content != bool(self.content_extractor):
+            self.content_extractor = ArticleContentExtractor(session=self.transport.session) if enrich_content else None
+        if sentiment_analysis is not None and sentiment_analysis != bool(self.tagger):
+            self.tagger = SentimentTagger() if sentiment_analysis else None
+        if email_config is not None:
+            self.email_sender = EmailSender(**email_config)
+        if delivery_config is not None:
+            self.channels = build_channels(delivery_config, session=self.transport.session)
+        if llm_config is not None:
+            # Keep the client; only its limits change
+            for key, value in llm_config.items():
+                setattr(self.llm_client, key, value)
+    
     def _search_news_tool(self, query: str) -> str:
         """Tool wrapper for news searching"""
-        articles = self.news_searcher.search_rss_feeds(max_articles=10)
+        unique_articles = self._deduplicate(self._fetch_articles())
+        return json.dumps(unique_articles[:self.max_articles])
+    
+    def _store_limit(self) -> int:
+        """Most candidate articles to read from the shared store for one digest"""
+        return self.max_articles * STORE_CANDIDATES_PER_ARTICLE
+    
+    def _fetch_articles(self) -> List[Dict]:
+        """Get candidate articles from the shared article store or directly from the feeds"""
+        if self.article_store:
+            return self.article_store.recent_articles(max_age_hours=24, limit=self._store_limit())
+        
+        articles = self.news_searcher.search_rss_feeds(max_articles=self.max_articles)
         google_articles = self.news_searcher.search_google_news(max_results=5)
-        all_articles = articles + google_articles
+        return articles + google_articles
+    
+    async def _afetch_articles(self) -> List[Dict]:
+        """Async version of _fetch_articles; RSS feeds and Google News are fetched concurrently"""
+        if self.article_store:
+            return await asyncio.to_thread(
+                self.article_store.recent_articles, max_age_hours=24, limit=self._store_limit()
+            )
         
-        # Remove duplicates based on title similarity
+        articles, google_articles = await asyncio.gather(
+            self.news_searcher.asearch_rss_feeds(max_articles=self.max_articles),
+            self.news_searcher.asearch_google_news(max_results=5)
+        )
+        return articles + google_articles
+    
+    def _deduplicate(self, articles: List[Dict]) -> List[Dict]:
+        """Remove duplicates based on title similarity"""
         unique_articles = []
-        for article in all_articles:
+        for article in articles:
             is_duplicate = False
             for existing in unique_articles:
                 if self.news_searcher.is_similar_title(article['title'], existing['title']):
@@ -66,7 +160,7 @@ class AINewsAgent:
             if not is_duplicate:
                 unique_articles.append(article)
         
-        return json.dumps(unique_articles[:10])
+        return unique_articles
     
     def _format_digest_tool(self, articles_str: str) -> str:
         """Tool wrapper for formatting news digest"""
@@ -105,6 +199,9 @@ class AINewsAgent:
                 .meta {{ color: #7f8c8d; font-size: 12px; margin-bottom: 10px; }}
                 .summary {{ line-height: 1.6; }}
                 .link {{ color: #3498db; text-decoration: none; }}
+                .tag {{ display: inline-block; margin-left: 6px; padding: 1px 6px; border-radius: 8px; background-color: #dfe6e9; }}
+                .positive {{ color: #27ae60; }}
+                .negative {{ color: #c0392b; }}
                 .footer {{ margin-top: 30px; padding: 20px; background-color: #ecf0f1; text-align: center; }}
             </style>
         </head>
@@ -116,10 +213,16 @@ class AINewsAgent:
         """
         
         for i, article in enumerate(articles, 1):
+            # Sentiment and topic tags are present when the tagging stage ran
+            labels = ""
+            if 'sentiment_label' in article:
+                labels += f' | Sentiment: <span class="{article["sentiment_label"]}">{article["sentiment_label"]}</span>'
+            labels += "".join(f'<span class="tag">{tag}</span>' for tag in article.get('tags', []))
+            
             html_content += f"""
             <div class="article">
                 <div class="title">{i}. {article['title']}</div>
-                <div class="meta">Source: {article['source']} | Published: {article['published']}</div>
+                <div class="meta">Source: {article['source']} | Published: {article['published']}{labels}</div>
                 <div class="summary">{article['summary']}</div>
                 <p><a href="{article['link']}" class="link">Read full article →</a></p>
             </div>
@@ -136,70 +239,259 @@ class AINewsAgent:
         
         return html_content
     
-    def generate_and_send_digest(self, recipient_email: str):
+    async def _agenerate_summary(self, articles: List[Dict]) -> str:
+        """Generate the executive summary, falling back to a cached or local extractive one"""
+        if self.summary_mode == "extractive":
+            print("Generated extractive summary")
+            return self.summarizer.summarize(articles) or DEFAULT_SUMMARY
+        
+        # Condense titles and summaries to their most salient sentences to keep the prompt small
+        condensed = self.summarizer.condense(articles, self.prompt_sentences)
+        articles_text = "\n".join(f"- {sentence}" for sentence in condensed)
+        
+        summary_prompt = f"""
+        Based on these AI news articles, create a brief executive summary (2-3 sentences) 
+        highlighting the most important trends and developments:
+        
+        {articles_text}
+        """
+        
+        # Reuse the summary of an identical earlier prompt instead of spending budget again
+        prompt_key = hashlib.sha256(summary_prompt.encode('utf-8')).hexdigest()
+        if self.llm_budget:
+            try:
+                cached = await asyncio.to_thread(self.llm_budget.cached_summary, prompt_key)
+            except sqlite3.Error as e:
+                print(f"Could not read summary cache: {e}")
+                cached = None
+            if cached:
+                print("Reused cached AI summary")
+                return cached
+        
+        summary = await self.llm_client.ainvoke(summary_prompt)
+        if summary:
+            print("Generated AI summary")
+            if self.llm_budget:
+                try:
+                    await asyncio.to_thread(self.llm_budget.store_summary, prompt_key, summary)
+                except sqlite3.Error as e:
+                    print(f"Could not cache AI summary: {e}")
+            return summary
+        
+        print("Could not generate AI summary; using extractive summary")
+        return self.summarizer.summarize(articles) or DEFAULT_SUMMARY
+    
+    def _archive_digest(self, articles: List[Dict], summary: str, subject: str):
+        """Persist the sent digest so it can be searched later"""
+        if not self.digest_archive:
+            return
+        try:
+            digest_id = self.digest_archive.save_digest(articles, summary=summary, subject=subject)
+            print(f"Archived digest #{digest_id}")
+        except Exception as e:
+            print(f"Could not archive digest: {e}")
+    
+    def _publish_snapshot(self, articles: List[Dict], summary: str, html: str, subject: str):
+        """Store the rendered digest as an immutable snapshot for the HTTP API"""
+        if not self.snapshot_store:
+            return
+        try:
+            snapshot_id = self.snapshot_store.publish(articles, summary, html, subject=subject)
+            print(f"Published digest snapshot {snapshot_id}")
+        except Exception as e:
+            print(f"Could not publish digest snapshot: {e}")
+    
+    def _add_summary(self, html_digest: str, ai_summary: str) -> str:
+        """Insert the executive summary into the header of a rendered digest"""
+        # Add AI summary to the beginning
+        if ai_summary:
+            html_digest = html_digest.replace(
+                '</div>',
+                f'<div class="summary" style="margin-top: 15px; font-style: italic; background-color: rgba(255,255,255,0.2); padding: 10px; border-radius: 5px;">{ai_summary}</div></div>',
+                1  # Replace only the first occurrence
+            )
+        
+        return html_digest
+    
+    def _stage(self, name: str):
+        """Context for one pipeline stage; profiled when a profiler is attached"""
+        return self.profiler.stage(name) if self.profiler else nullcontext()
+    
+    def _begin_run(self, resume: bool) -> Optional[str]:
+        """Pick the run ID for checkpoints: the latest unfinished run when resuming, else a new one"""
+        if not self.checkpoint_store:
+            return None
+        
+        removed = self.checkpoint_store.cleanup()
+        if removed:
+            print(f"Removed {removed} expired checkpointed runs")
+        
+        run_id = self.checkpoint_store.latest_run() if resume else None
+        if run_id:
+            print(f"Resuming digest run {run_id}")
+        else:
+            run_id = self.checkpoint_store.new_run_id()
+        return run_id
+    
+    async def _arun_blocking(self, func, *args):
+        """Run CPU-bound work in a worker thread so the event loop stays responsive
+        
+        Profiled runs keep it on the calling thread, the only one cProfile records.
+        """
+        if self.profiler:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+    
+    async def _aload_checkpoint(self, run_id: Optional[str], stage: str):
+        """Get the saved output of a completed stage of this run, if any"""
+        if not run_id:
+            return None
+        data = await asyncio.to_thread(self.checkpoint_store.load, run_id, stage)
+        if data is not None:
+            print(f"Using checkpointed {stage} stage")
+        return data
+    
+    async def _asave_checkpoint(self, run_id: Optional[str], stage: str, data):
+        """Save the output of a completed stage; a failed save only costs resumability"""
+        if not run_id:
+            return
+        try:
+            await asyncio.to_thread(self.checkpoint_store.save, run_id, stage, data)
+        except Exception as e:
+            print(f"Could not checkpoint {stage} stage: {e}")
+    
+    def generate_and_send_digest(self, recipient_email: Union[str, Sequence[str]], resume: bool = False):
         """Main function to generate and send news digest"""
+        async def run():
+            try:
+                await self.agenerate_and_send_digest(recipient_email, resume=resume)
+            finally:
+                # The aiohttp session belongs to this event loop, which asyncio.run closes
+                await self.transport.aclose()
+        
+        asyncio.run(run())
+    
+    async def agenerate_and_send_digest(self, recipient_email: Union[str, Sequence[str]], resume: bool = False):
+        """Generate and send the news digest from asyncio code
+        
+        Feeds are fetched concurrently, the article list is rendered while the
+        summary request is in flight, and all channels deliver concurrently.
+        With a checkpoint store, each stage's output is saved under a run ID and
+        `resume=True` continues the latest unfinished run from its last
+        completed stage. `recipient_email` may be one address or a list.
+        """
+        recipients = [recipient_email] if isinstance(recipient_email, str) else list(recipient_email)
+        # Read once so a configuration reload cannot change the limit mid-run
+        max_articles = self.max_articles
+        run_id = None
         try:
-            # Get news articles directly (simplified approach)
-            print("Searching for AI news...")
-            articles = self.news_searcher.search_rss_feeds(max_articles=10)
-            google_articles = self.news_searcher.search_google_news(max_results=5)
-            all_articles = articles + google_articles
+            run_id = self._begin_run(resume)
+            
+            # Get news articles and remove duplicates
+            all_articles = await self._aload_checkpoint(run_id, 'fetch')
+            if all_articles is None:
+                print("Searching for AI news...")
+                with self._stage('fetch'):
+                    all_articles = await self._afetch_articles()
+                await self._asave_checkpoint(run_id, 'fetch', all_articles)
             
-            # Remove duplicates
-            unique_articles = []
-            for article in all_articles:
-                is_duplicate = False
-                for existing in unique_articles:
-                    if self.news_searcher.is_similar_title(article['title'], existing['title']):
-                        is_duplicate = True
-                        break
-                if not is_duplicate:
-                    unique_articles.append(article)
+            unique_articles = await self._aload_checkpoint(run_id, 'dedup')
+            if unique_articles is None:
+                with self._stage('dedup'):
+                    unique_articles = await self._arun_blocking(self._deduplicate, all_articles)
+                await self._asave_checkpoint(run_id, 'dedup', unique_articles)
             
             if not unique_articles:
                 print("No new AI news found")
+                if run_id:
+                    self.checkpoint_store.discard(run_id)
                 return
             
             print(f"Found {len(unique_articles)} unique articles")
             
-            # Generate summary using Gemini (if available)
-            ai_summary = ""
-            try:
-                articles_text = "\n".join([f"- {art['title']}: {art['summary']}" for art in unique_articles[:10]])
-                
-                summary_prompt = f"""
-                Based on these AI news articles, create a brief executive summary (2-3 sentences) 
-                highlighting the most important trends and developments:
+            # Optionally replace RSS snippets with full-article extracts
+            if self.content_extractor:
+                enriched = await self._aload_checkpoint(run_id, 'enrich')
+                if enriched is None:
+                    with self._stage('enrich'):
+                        enriched = await asyncio.to_thread(
+                            self.content_extractor.enrich_articles, unique_articles[:max_articles]
+                        )
+                    await self._asave_checkpoint(run_id, 'enrich', enriched)
+                unique_articles[:max_articles] = enriched
+                print("Enriched articles with full content")
+            
+            # Score sentiment and tag topics for all candidates in one batch, using the full-article text where enriched
+            if self.tagger:
+                with self._stage('tag'):
+                    unique_articles = await self._arun_blocking(self.tagger.annotate, unique_articles)
+            
+            rendered = await self._aload_checkpoint(run_id, 'render')
+            ai_summary = await self._aload_checkpoint(run_id, 'summary')
+            if rendered is None:
+                top_articles = unique_articles[:max_articles]
+                # Render the articles in a worker thread while the executive summary is generated; cProfile
+                # only records the calling thread, so profiled runs render on this thread in the render stage
+                render_task = None
+                if not self.profiler:
+                    render_task = asyncio.create_task(asyncio.to_thread(self._create_html_digest, top_articles))
                 
-                {articles_text}
-                """
+                # Generate executive summary (Gemini or local extractive)
+                with self._stage('summarize'):
+                    if ai_summary is None:
+                        ai_summary = await self._agenerate_summary(top_articles)
+                        await self._asave_checkpoint(run_id, 'summary', ai_summary)
                 
-                summary_response = self.llm.invoke([HumanMessage(content=summary_prompt)])
-                ai_summary = summary_response.content
-                print("Generated AI summary")
-            except Exception as e:
-                print(f"Could not generate AI summary: {e}")
-                ai_summary = "Latest developments in AI technology and research."
+                # Create HTML digest
+                with self._stage('render'):
+                    html_digest = await render_task if render_task else self._create_html_digest(top_articles)
+                    rendered = {
+                        'subject': f"🤖 AI News Digest - {datetime.now().strftime('%B %d, %Y')}",
+                        'html': self._add_summary(html_digest, ai_summary)
+                    }
+                await self._asave_checkpoint(run_id, 'render', rendered)
+            subject, html_digest = rendered['subject'], rendered['html']
             
-            # Create HTML digest
-            html_digest = self._create_html_digest(unique_articles[:10])
+            if not await self._aload_checkpoint(run_id, 'publish'):
+                with self._stage('publish'):
+                    await asyncio.to_thread(self._publish_snapshot, unique_articles[:max_articles], ai_summary, html_digest, subject)
+                await self._asave_checkpoint(run_id, 'publish', True)
             
-            # Add AI summary to the beginning
-            if ai_summary:
-                html_digest = html_digest.replace(
-                    '</div>',
-                    f'<div class="summary" style="margin-top: 15px; font-style: italic; background-color: rgba(255,255,255,0.2); padding: 10px; border-radius: 5px;">{ai_summary}</div></div>',
-                    1  # Replace only the first occurrence
-                )
-            
-            # Send email
-            subject = f"🤖 AI News Digest - {datetime.now().strftime('%B %d, %Y')}"
-            success = self.email_sender.send_email(recipient_email, subject, html_digest)
+            # Deliver by email and to any webhook channels concurrently; a resumed run skips channels
+            # and email recipients already delivered
+            digest = {
+                'subject': subject,
+                'summary': ai_summary,
+                'articles': unique_articles[:max_articles],
+                'html': html_digest
+            }
+            delivered = await self._aload_checkpoint(run_id, 'deliver') or {}
+            sent_to = delivered.get('email_recipients', {})
+            email_channel = EmailChannel(self.email_sender, [r for r in recipients if not sent_to.get(r)])
+            channels = [email_channel] + self.channels
+            channels = [channel for channel in channels if not delivered.get(channel.name)]
+            with self._stage('deliver'):
+                delivered.update(await DeliveryDispatcher(channels).adispatch(digest))
+            if email_channel in channels:
+                sent_to.update({recipient: email_channel.results.get(recipient, False)
+                                for recipient in email_channel.recipients})
+                delivered['email_recipients'] = sent_to
+                delivered['email'] = all(sent_to.get(recipient) for recipient in recipients)
+            await self._asave_checkpoint(run_id, 'deliver', delivered)
+            success = delivered['email']
             
             if success:
-                print(f"News digest sent successfully to {recipient_email}")
+                print(f"News digest sent successfully to {', '.join(recipients)}")
+                with self._stage('archive'):
+                    await asyncio.to_thread(self._archive_digest, unique_articles[:max_articles], ai_summary, subject)
+                if run_id:
+                    self.checkpoint_store.discard(run_id)
             else:
                 print("Failed to send news digest")
-                
+                if run_id:
+                    print(f"Checkpoints kept; rerun with --resume to continue run {run_id}")
+        
         except Exception as e:
-            print(f"Error generating digest: {e}") 
\ No newline at end of file
+            print(f"Error generating digest: {e}")
+            if run_id:
+                print(f"Checkpoints kept; rerun with --resume to continue run {run_id}")
\ No newline at end of file
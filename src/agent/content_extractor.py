@@ -0,0 +1,128 @@
+"""
+Content Extractor Module
+
+Fetches linked article pages concurrently and extracts their main text.
+"""
+
+import threading
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+import requests
+from bs4 import BeautifulSoup
+
+from ..utils.helpers import truncate_text
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'iframe']
+
+
+class ArticleContentExtractor:
+    """Concurrent full-article text extraction with per-host limits and a URL cache"""
+    
+    def __init__(self, session: Optional[requests.Session] = None, max_workers: int = 8,
+                 per_host_limit: int = 2, max_bytes: int = 1_000_000, timeout: float = 10.0,
+                 cache_size: int = 512, parser: str = DEFAULT_PARSER):
+        self.session = session or requests.Session()
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.parser = parser
+        
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+    
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Get the concurrency semaphore for the URL's host"""
+        host = urllib.parse.urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+    
+    def _cache_get(self, url: str) -> Optional[str]:
+        with self._lock:
+            if url in self._cache:
+                self._cache.move_to_end(url)
+                return self._cache[url]
+        return None
+    
+    def _cache_put(self, url: str, text: str):
+        with self._lock:
+            self._cache[url] = text
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _download(self, url: str) -> Optional[bytes]:
+        """Download an HTML page, reading at most max_bytes"""
+        with self._host_slot(url):
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                if 'html' not in response.headers.get('Content-Type', 'text/html'):
+                    return None
+                
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=16384):
+                    body.extend(chunk)
+                    if len(body) >= self.max_bytes:
+                        del body[self.max_bytes:]
+                        break
+                return bytes(body)
+    
+    def extract_text(self, html: bytes) -> str:
+        """Extract the main article text from an HTML page"""
+        soup = BeautifulSoup(html, self.parser)
+        for tag in soup(BOILERPLATE_TAGS):
+            tag.decompose()
+        
+        root = soup.find('article') or soup.find('main') or soup.body or soup
+        paragraphs = [p.get_text(' ', strip=True) for p in root.find_all('p')]
+        paragraphs = [p for p in paragraphs if len(p) > 40]
+        
+        if not paragraphs:
+            return root.get_text(' ', strip=True)
+        return '\n'.join(paragraphs)
+    
+    def fetch_text(self, url: str) -> str:
+        """Fetch and extract the article text for a URL (cached)"""
+        cached = self._cache_get(url)
+        if cached is not None:
+            return cached
+        
+        try:
+            html = self._download(url)
+            text = self.extract_text(html) if html else ""
+        except Exception as e:
+            print(f"Error extracting content from {url}: {e}")
+            return ""
+        
+        self._cache_put(url, text)
+        return text
+    
+    def enrich_articles(self, articles: List[Dict], summary_length: int = 500) -> List[Dict]:
+        """Replace RSS summaries with extracts of the full article text"""
+        if not articles:
+            return []
+        
+        urls = [article['link'] for article in articles]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            texts = list(executor.map(self.fetch_text, urls))
+        
+        enriched = []
+        for article, text in zip(articles, texts):
+            if text:
+                article = {**article, 'summary': truncate_text(text, summary_length)}
+            enriched.append(article)
+        
+        return enriched
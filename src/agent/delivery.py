@@ -0,0 +1,311 @@
+"""
+Delivery Module
+
+Delivery channels for generated digests (email, Slack, Discord and generic
+webhooks) and a dispatcher that fans a digest out to all of them concurrently.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional
+
+import requests
+
+from .email_sender import EmailSender
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter that can be paused by Retry-After"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available, then take them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                else:
+                    wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` (e.g. from a Retry-After header)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+
+def escape_mrkdwn(text: str) -> str:
+    """Escape the characters Slack treats as control sequences in mrkdwn text"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+class DeliveryChannel:
+    """Base class for digest delivery channels
+    
+    Subclasses render the digest once into their own payload format and then
+    deliver that payload to every target of the channel.
+    """
+    
+    name = "channel"
+    
+    def render(self, digest: Dict):
+        raise NotImplementedError
+    
+    def deliver(self, payload) -> bool:
+        raise NotImplementedError
+    
+    def send(self, digest: Dict) -> bool:
+        return self.deliver(self.render(digest))
+    
+    async def asend(self, digest: Dict) -> bool:
+        """Send from async code; blocking channels run in a worker thread"""
+        return await asyncio.to_thread(self.send, digest)
+
+
+class EmailChannel(DeliveryChannel):
+    """Deliver the HTML digest by email; per-recipient outcomes are kept in `results`"""
+    
+    name = "email"
+    
+    def __init__(self, email_sender: EmailSender, recipients: List[str]):
+        self.email_sender = email_sender
+        self.recipients = recipients
+        self.results: Dict[str, bool] = {}
+    
+    def render(self, digest: Dict):
+        return digest['subject'], digest['html']
+    
+    def deliver(self, payload) -> bool:
+        subject, html = payload
+        if len(self.recipients) == 1:
+            self.results = {self.recipients[0]: self.email_sender.send_email(self.recipients[0], subject, html)}
+        else:
+            # One SMTP session and one prepared message for the whole list
+            self.results = self.email_sender.send_bulk(self.recipients, subject, html)
+        return all(self.results.values())
+    
+    async def asend(self, digest: Dict) -> bool:
+        subject, html = self.render(digest)
+        if len(self.recipients) == 1:
+            self.results = {self.recipients[0]: await self.email_sender.asend_email(self.recipients[0], subject, html)}
+        else:
+            self.results = await self.email_sender.asend_bulk(self.recipients, subject, html)
+        return all(self.results.values())
+
+
+class WebhookChannel(DeliveryChannel):
+    """Post the digest as JSON to one or more webhook URLs"""
+    
+    name = "webhook"
+    max_articles_per_message = 50
+    
+    def __init__(self, urls: List[str], session: Optional[requests.Session] = None,
+                 rate: float = 1.0, burst: int = 3, timeout: float = 10.0,
+                 max_retries: int = 3, max_workers: int = 4, max_retry_wait: float = 60.0):
+        self.urls = urls
+        self.session = session or requests.Session()
+        self.bucket = TokenBucket(rate, burst)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_workers = max_workers
+        # Longest Retry-After the channel will honor; longer waits give up so other stages are not held up
+        self.max_retry_wait = max_retry_wait
+    
+    def _batches(self, articles: List[Dict]) -> List[List[Dict]]:
+        size = self.max_articles_per_message
+        return [articles[i:i + size] for i in range(0, len(articles), size)] or [[]]
+    
+    def render_message(self, digest: Dict, articles: List[Dict], first: bool) -> Dict:
+        return {
+            'subject': digest['subject'],
+            'summary': digest['summary'] if first else '',
+            'articles': articles,
+        }
+    
+    def render(self, digest: Dict) -> List[bytes]:
+        """Render the digest into one or more JSON request bodies"""
+        return [
+            json.dumps(self.render_message(digest, batch, i == 0)).encode('utf-8')
+            for i, batch in enumerate(self._batches(digest['articles']))
+        ]
+    
+    def _post(self, url: str, body: bytes) -> bool:
+        """Post one message, honoring rate limits and Retry-After up to max_retry_wait"""
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                response = self.session.post(url, data=body, timeout=self.timeout,
+                                             headers={'Content-Type': 'application/json'})
+            except requests.RequestException as e:
+                print(f"Error posting to {self.name} webhook: {e}")
+                time.sleep(min(2 ** attempt, 30))
+                continue
+            
+            if response.status_code < 300:
+                return True
+            if response.status_code == 429 or response.status_code >= 500:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'), default=2 ** attempt)
+                if retry_after > self.max_retry_wait:
+                    print(f"Giving up on {self.name} webhook: asked to retry after {retry_after:.0f}s")
+                    return False
+                self.bucket.pause(retry_after)
+                continue
+            
+            print(f"{self.name} webhook rejected message: HTTP {response.status_code}")
+            return False
+        
+        print(f"Giving up on {self.name} webhook after {self.max_retries + 1} attempts")
+        return False
+    
+    def deliver(self, payload: List[bytes]) -> bool:
+        """Post every message to every URL concurrently; messages keep their order per URL"""
+        def post_all(url: str) -> bool:
+            return all([self._post(url, body) for body in payload])
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(self.urls)))) as executor:
+            return all(executor.map(post_all, self.urls))
+
+
+class SlackChannel(WebhookChannel):
+    """Post the digest to Slack incoming webhooks"""
+    
+    name = "slack"
+    # Slack allows at most 50 blocks per message; each article uses one
+    max_articles_per_message = 45
+    
+    def render_message(self, digest: Dict, articles: List[Dict], first: bool) -> Dict:
+        blocks = []
+        if first:
+            blocks.append({'type': 'header', 'text': {'type': 'plain_text', 'text': digest['subject'][:150]}})
+            if digest['summary']:
+                summary = escape_mrkdwn(digest['summary'])[:3000]
+                blocks.append({'type': 'section', 'text': {'type': 'mrkdwn', 'text': summary}})
+        for article in articles:
+            link, title, source = (escape_mrkdwn(article[key]) for key in ('link', 'title', 'source'))
+            blocks.append({
+                'type': 'section',
+                'text': {
+                    'type': 'mrkdwn',
+                    'text': f"*<{link}|{title}>*\n_{source}_"[:3000]
+                }
+            })
+        return {'text': digest['subject'], 'blocks': blocks}
+
+
+class DiscordChannel(WebhookChannel):
+    """Post the digest to Discord webhooks"""
+    
+    name = "discord"
+    # Discord allows at most 10 embeds per message
+    max_articles_per_message = 10
+    
+    def render_message(self, digest: Dict, articles: List[Dict], first: bool) -> Dict:
+        return {
+            'content': f"**{digest['subject']}**\n{digest['summary']}"[:2000] if first else '',
+            'embeds': [
+                {
+                    'title': article['title'][:256],
+                    'url': article['link'],
+                    'description': article.get('summary', '')[:4096],
+                    'footer': {'text': article['source'][:2048]}
+                }
+                for article in articles
+            ]
+        }
+
+
+CHANNEL_TYPES = {
+    'webhook': WebhookChannel,
+    'slack': SlackChannel,
+    'discord': DiscordChannel,
+}
+
+
+def build_channels(delivery_config: Dict[str, List[str]],
+                   session: Optional[requests.Session] = None) -> List[DeliveryChannel]:
+    """Create webhook channels from a {'slack': [urls], 'discord': [urls], 'webhook': [urls]} config"""
+    return [
+        CHANNEL_TYPES[kind](urls, session=session)
+        for kind, urls in delivery_config.items()
+        if urls
+    ]
+
+
+class DeliveryDispatcher:
+    """Fan a digest out to all channels concurrently"""
+    
+    def __init__(self, channels: List[DeliveryChannel]):
+        self.channels = channels
+    
+    def _report(self, channel: DeliveryChannel, success: bool):
+        print(f"{'✅' if success else '❌'} Delivery via {channel.name} finished")
+    
+    def _send(self, channel: DeliveryChannel, digest: Dict) -> bool:
+        try:
+            return channel.send(digest)
+        except Exception as e:
+            print(f"Error delivering to {channel.name}: {e}")
+            return False
+    
+    def dispatch(self, digest: Dict) -> Dict[str, bool]:
+        """Deliver to every channel; each channel runs in its own thread so a slow one cannot hold up the others"""
+        results = {}
+        if not self.channels:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(self.channels)) as executor:
+            futures = {executor.submit(self._send, channel, digest): channel for channel in self.channels}
+            for future in as_completed(futures):
+                channel = futures[future]
+                results[channel.name] = future.result()
+                self._report(channel, results[channel.name])
+        
+        return results
+    
+    async def _asend(self, channel: DeliveryChannel, digest: Dict) -> bool:
+        try:
+            success = await channel.asend(digest)
+        except Exception as e:
+            print(f"Error delivering to {channel.name}: {e}")
+            success = False
+        self._report(channel, success)
+        return success
+    
+    async def adispatch(self, digest: Dict) -> Dict[str, bool]:
+        """Async version of dispatch; all channels are delivered concurrently"""
+        results = await asyncio.gather(*(self._asend(channel, digest) for channel in self.channels))
+        return {channel.name: success for channel, success in zip(self.channels, results)}
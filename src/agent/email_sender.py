@@ -5,8 +5,11 @@ Handles email sending functionality for news digests.
 """
 
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from typing import Dict, List
+
+import aiosmtplib
+
+from .message_builder import build_message, PreparedMessage
 
 
 class EmailSender:
@@ -18,36 +21,75 @@ class EmailSender:
         self.email = email
         self.password = password
     
+    def _build_message(self, subject: str, body: str, allow_8bit: bool = True) -> PreparedMessage:
+        """Get the serialized message for a digest; built once and reused for every recipient"""
+        return build_message(self.email, subject, body, allow_8bit)
+    
+    @staticmethod
+    def _print_auth_help(error: Exception):
+        print(f"Email authentication failed: {error}")
+        print("\n🔒 Gmail Authentication Help:")
+        print("1. Make sure you're using an App Password, not your regular Gmail password")
+        print("2. Enable 2-Factor Authentication on your Google account")
+        print("3. Generate an App Password: https://myaccount.google.com/apppasswords")
+        print("4. Use the 16-character app password (no spaces) as EMAIL_PASSWORD")
+        print("5. Make sure 'Less secure app access' is enabled if not using 2FA")
+    
     def send_email(self, to_email: str, subject: str, body: str) -> bool:
         """Send email with news digest"""
+        return self.send_bulk([to_email], subject, body)[to_email]
+    
+    def send_bulk(self, recipients: List[str], subject: str, body: str) -> Dict[str, bool]:
+        """Send the digest to every recipient over one SMTP session"""
+        results = {recipient: False for recipient in recipients}
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'html'))
-            
             server = smtplib.SMTP(self.smtp_server, self.smtp_port)
             server.starttls()
             server.login(self.email, self.password)
-            text = msg.as_string()
-            server.sendmail(self.email, to_email, text)
-            server.quit()
-            
-            print(f"Email sent successfully to {to_email}")
-            return True
+            msg = self._build_message(subject, body, allow_8bit=bool(server.has_extn('8bitmime')))
             
+            for to_email in recipients:
+                try:
+                    server.sendmail(self.email, to_email, msg.for_recipient(to_email), mail_options=msg.mail_options)
+                    results[to_email] = True
+                    print(f"Email sent successfully to {to_email}")
+                except smtplib.SMTPRecipientsRefused as e:
+                    print(f"Recipient {to_email} refused: {e}")
+            server.quit()
+        
         except smtplib.SMTPAuthenticationError as e:
-            print(f"Email authentication failed: {e}")
-            print("\n🔒 Gmail Authentication Help:")
-            print("1. Make sure you're using an App Password, not your regular Gmail password")
-            print("2. Enable 2-Factor Authentication on your Google account")
-            print("3. Generate an App Password: https://myaccount.google.com/apppasswords")
-            print("4. Use the 16-character app password (no spaces) as EMAIL_PASSWORD")
-            print("5. Make sure 'Less secure app access' is enabled if not using 2FA")
-            return False
-            
+            self._print_auth_help(e)
+        
+        except Exception as e:
+            print(f"Error sending email: {e}")
+        
+        return results
+    
+    async def asend_email(self, to_email: str, subject: str, body: str) -> bool:
+        """Send email with news digest without blocking the event loop"""
+        return (await self.asend_bulk([to_email], subject, body))[to_email]
+    
+    async def asend_bulk(self, recipients: List[str], subject: str, body: str) -> Dict[str, bool]:
+        """Async version of send_bulk"""
+        results = {recipient: False for recipient in recipients}
+        try:
+            async with aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=True) as server:
+                await server.login(self.email, self.password)
+                msg = self._build_message(subject, body, allow_8bit=server.supports_extension('8bitmime'))
+                
+                for to_email in recipients:
+                    try:
+                        await server.sendmail(self.email, [to_email], msg.for_recipient(to_email),
+                                              mail_options=msg.mail_options)
+                        results[to_email] = True
+                        print(f"Email sent successfully to {to_email}")
+                    except aiosmtplib.SMTPRecipientsRefused as e:
+                        print(f"Recipient {to_email} refused: {e}")
+        
+        except aiosmtplib.SMTPAuthenticationError as e:
+            self._print_auth_help(e)
+        
         except Exception as e:
             print(f"Error sending email: {e}")
-            return False 
\ No newline at end of file
+        
+        return results
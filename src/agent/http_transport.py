@@ -0,0 +1,85 @@
+"""
+HTTP Transport Module
+
+Shared keep-alive HTTP sessions used for feed and article fetches, with a
+blocking (requests) and an asyncio (aiohttp) client.
+"""
+
+import asyncio
+from typing import Optional, Union, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+DEFAULT_USER_AGENT = "AI-News-Agent/1.0 (+https://github.com/GudisaSandeep/AI-News-Agent)"
+FEED_ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.8"
+
+
+class HTTPTransport:
+    """Pooled HTTP client with compression negotiation, timeouts and a user agent"""
+    
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = 15.0,
+                 user_agent: Optional[str] = None, pool_connections: int = 10,
+                 pool_maxsize: int = 10):
+        self.timeout = timeout
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.pool_maxsize = pool_maxsize
+        self.session = requests.Session()
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # One connection pool per host, kept alive across fetches
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # urllib3 advertises br/zstd only when the matching decoder is installed
+        self.session.headers.update({
+            'User-Agent': self.user_agent,
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+    
+    def fetch(self, url: str, accept: str = FEED_ACCEPT) -> bytes:
+        """Fetch a URL and return the decoded response body as bytes"""
+        response = self.session.get(url, timeout=self.timeout, headers={'Accept': accept})
+        response.raise_for_status()
+        return response.content
+    
+    def _client_timeout(self) -> aiohttp.ClientTimeout:
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=self.timeout)
+    
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session for the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._async_session
+        if session is None or session.closed or self._async_loop is not loop:
+            # aiohttp negotiates the encodings it can decode itself
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.pool_maxsize),
+                timeout=self._client_timeout(),
+                headers={'User-Agent': self.user_agent},
+            )
+            self._async_session, self._async_loop = session, loop
+        return session
+    
+    async def afetch(self, url: str, accept: str = FEED_ACCEPT) -> bytes:
+        """Fetch a URL without blocking the event loop and return the decoded body"""
+        session = self._get_async_session()
+        async with session.get(url, headers={'Accept': accept}) as response:
+            response.raise_for_status()
+            return await response.read()
+    
+    async def aclose(self):
+        """Close the aiohttp session of the running event loop"""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = self._async_loop = None
+    
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
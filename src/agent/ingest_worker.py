@@ -0,0 +1,107 @@
+"""
+Ingest Worker Module
+
+Sharded feed ingestion: each worker leases sources from a shared
+coordinator, fetches them and writes the results to the common article store.
+"""
+
+import os
+import socket
+import threading
+import uuid
+from typing import Dict, Optional
+
+from .news_searcher import AINewsSearcher
+from .http_transport import HTTPTransport
+from ..storage.article_store import ArticleStore
+from ..storage.lease_coordinator import SourceLeaseCoordinator
+
+
+class IngestWorker:
+    """Process leased feed sources into the article store"""
+    
+    def __init__(self, searcher: AINewsSearcher, coordinator: SourceLeaseCoordinator,
+                 store: ArticleStore, worker_id: Optional[str] = None, batch_size: int = 2,
+                 articles_per_source: int = 20, retention_hours: float = 168.0):
+        self.searcher = searcher
+        self.coordinator = coordinator
+        self.store = store
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.batch_size = batch_size
+        self.articles_per_source = articles_per_source
+        # Digests only read the last 24 hours; links are kept longer so undated feed
+        # entries are not re-added as new once pruned
+        self.retention_hours = retention_hours
+    
+    def _heartbeat_loop(self, stop: threading.Event):
+        """Keep this worker's leases alive while sources are being fetched"""
+        while not stop.wait(self.coordinator.lease_ttl / 3):
+            try:
+                self.coordinator.heartbeat(self.worker_id)
+            except Exception as e:
+                print(f"Lease heartbeat failed for {self.worker_id}: {e}")
+    
+    def run_once(self, stop_event: Optional[threading.Event] = None) -> int:
+        """Ingest sources until none are due; returns the number of new articles"""
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat_loop, args=(stop_heartbeat,), daemon=True)
+        heartbeat.start()
+        
+        added = 0
+        try:
+            while not (stop_event and stop_event.is_set()):
+                leased = self.coordinator.acquire(self.worker_id, self.batch_size)
+                if not leased:
+                    break
+                
+                for i, (source_name, feed_url) in enumerate(leased):
+                    if stop_event and stop_event.is_set():
+                        # Hand unprocessed sources back to other workers
+                        for name, _ in leased[i:]:
+                            self.coordinator.release(self.worker_id, name)
+                        break
+                    
+                    try:
+                        articles = self.searcher.fetch_source(source_name, feed_url, self.articles_per_source)
+                        added += self.store.add_articles(articles)
+                    except Exception as e:
+                        print(f"Error ingesting {source_name}: {e}")
+                    # Failed sources are retried on the next refresh rather than immediately
+                    self.coordinator.complete(self.worker_id, source_name)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+        
+        try:
+            self.store.prune(self.retention_hours)
+        except Exception as e:
+            print(f"Error pruning article store: {e}")
+        
+        return added
+    
+    def run(self, stop_event: threading.Event, poll_interval: float = 30.0):
+        """Keep ingesting due sources until stop_event is set"""
+        while not stop_event.is_set():
+            added = self.run_once(stop_event)
+            if added:
+                print(f"[{self.worker_id}] Ingested {added} new articles")
+            stop_event.wait(poll_interval)
+
+
+def run_ingest_worker(db_path: str, http_config: Optional[Dict] = None,
+                      lease_ttl: float = 60.0, refresh_interval: float = 900.0, stop_event=None):
+    """Process entry point for a single ingest worker"""
+    searcher = AINewsSearcher(transport=HTTPTransport(**(http_config or {})))
+    
+    coordinator = SourceLeaseCoordinator(db_path, lease_ttl=lease_ttl, refresh_interval=refresh_interval)
+    store = ArticleStore(db_path)
+    worker = IngestWorker(searcher, coordinator, store)
+    
+    print(f"🧵 Ingest worker {worker.worker_id} started")
+    try:
+        worker.run(stop_event or threading.Event())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        coordinator.close()
+        store.close()
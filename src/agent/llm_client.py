@@ -0,0 +1,110 @@
+"""
+LLM Client Module
+
+Budgeted, rate-limited and time-bounded calls to the chat model. Calls that
+would exceed the budget or the latency target return None so callers can
+fall back to cached or local summaries.
+"""
+
+import asyncio
+import sqlite3
+import time
+from typing import Optional
+
+from langchain.schema import HumanMessage
+
+from ..storage.llm_budget import LLMBudget
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return len(text) // 4 + 1
+
+
+class GuardedLLM:
+    """Wrap a LangChain chat model with a shared budget, a timeout and optional hedging
+    
+    With `hedge_after` set, a second request is sent when the first has not
+    answered within that many seconds and the budget allows it; whichever
+    answers first wins. Abandoned requests are cancelled.
+    """
+    
+    def __init__(self, llm, budget: Optional[LLMBudget] = None, timeout: float = 30.0,
+                 hedge_after: Optional[float] = None, max_wait: float = 10.0,
+                 max_output_tokens: int = 256):
+        self.llm = llm
+        self.budget = budget
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.max_wait = max_wait
+        self.max_output_tokens = max_output_tokens
+    
+    async def _aacquire(self, estimated: int, max_wait: float) -> bool:
+        """Wait up to max_wait for the budget to grant a request; SQLite access runs in a worker thread"""
+        if self.budget is None:
+            return True
+        deadline = time.monotonic() + max_wait
+        while True:
+            try:
+                wait_time = await asyncio.to_thread(self.budget.try_acquire, estimated)
+            except sqlite3.Error as e:
+                # Without the shared budget the call cannot be accounted for
+                print(f"Could not check LLM budget: {e}")
+                return False
+            if wait_time == 0.0:
+                return True
+            if wait_time is None or time.monotonic() + wait_time > deadline:
+                return False
+            await asyncio.sleep(wait_time)
+    
+    async def _acall(self, prompt: str) -> str:
+        return (await self.llm.ainvoke([HumanMessage(content=prompt)])).content
+    
+    async def ainvoke(self, prompt: str) -> Optional[str]:
+        """Get the model's reply, or None when over budget, too slow or failing"""
+        estimated = estimate_tokens(prompt) + self.max_output_tokens
+        if not await self._aacquire(estimated, self.max_wait):
+            print("LLM budget exhausted or rate limit wait too long; skipping LLM call")
+            return None
+        
+        start = time.monotonic()
+        deadline = start + self.timeout
+        pending = {asyncio.ensure_future(self._acall(prompt))}
+        hedged = not self.hedge_after
+        
+        try:
+            while pending:
+                now = time.monotonic()
+                if now >= deadline:
+                    print(f"LLM call timed out after {self.timeout:.0f}s")
+                    return None
+                
+                timeout = deadline - now
+                if not hedged:
+                    timeout = min(timeout, max(0.0, start + self.hedge_after - now))
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    try:
+                        content = task.result()
+                    except Exception as e:
+                        print(f"LLM call failed: {e}")
+                        continue
+                    if self.budget:
+                        delta = estimate_tokens(prompt) + estimate_tokens(content) - estimated
+                        try:
+                            await asyncio.to_thread(self.budget.adjust_tokens, delta)
+                        except sqlite3.Error as e:
+                            print(f"Could not record LLM token usage: {e}")
+                    return content
+                
+                if not hedged and pending and time.monotonic() >= start + self.hedge_after:
+                    hedged = True
+                    if await self._aacquire(estimated, 0.0):
+                        print("LLM call is slow; sending a hedged request")
+                        pending.add(asyncio.ensure_future(self._acall(prompt)))
+            
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
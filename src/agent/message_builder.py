@@ -0,0 +1,129 @@
+"""
+Message Builder Module
+
+Builds compact digest emails once per digest: the stylesheet is minified and
+embedded once, layout whitespace is stripped, a plain-text alternative is
+generated, and the multipart/alternative message is encoded and serialized a
+single time. Sending to each recipient only adds a To header to the cached
+bytes.
+"""
+
+import re
+from email.message import EmailMessage
+from email.policy import SMTP
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+
+from .content_extractor import DEFAULT_PARSER
+
+STYLE_BLOCK = re.compile(r'(<style[^>]*>)(.*?)(</style>)', re.S | re.I)
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+CSS_PUNCTUATION = re.compile(r'\s*([{};:,>])\s*')
+LAYOUT_WHITESPACE = re.compile(r'>\s*\n\s*<')
+WHITESPACE_RUN = re.compile(r'[ \t]{2,}')
+STYLE_ATTRIBUTE = re.compile(r'(\sstyle=")([^"]*)(")', re.I)
+QUOTED_CLASS = re.compile(r'(<[a-z][a-z0-9]*\s[^<>]*?class=)"([\w-]+)"', re.I)
+TAG_BOUNDARY = re.compile(r'(?<=>)(?=<)')
+BLOCK_TAGS = ['div', 'p', 'h1', 'h2', 'h3', 'li', 'tr', 'br']
+
+# Digest parts left out of the plain-text alternative; it lists titles and links only
+TEXT_OMITTED = '.article .meta, .article .summary, .footer'
+
+# SMTP limits lines to 998 octets; longer lines need a 7-bit transfer encoding
+MAX_LINE_LENGTH = 998
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and whitespace from a stylesheet"""
+    css = CSS_PUNCTUATION.sub(r'\1', CSS_COMMENT.sub('', css))
+    return ' '.join(css.split()).replace(';}', '}')
+
+
+def fold_markup(html: str, width: int = MAX_LINE_LENGTH) -> str:
+    """Break markup into lines of at most `width` bytes, only between tags"""
+    lines, line, size = [], [], 0
+    for piece in TAG_BOUNDARY.split(html):
+        piece_size = len(piece.encode('utf-8'))
+        if line and size + piece_size > width:
+            lines.append(''.join(line))
+            line, size = [], 0
+        line.append(piece)
+        size += piece_size
+    lines.append(''.join(line))
+    return '\n'.join(lines)
+
+
+def minify_html(html: str) -> str:
+    """Minify stylesheets and style attributes and drop whitespace between tags
+    
+    Simple class attributes are unquoted, and the markup is folded back into
+    lines below the SMTP line limit.
+    """
+    minify = lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3)
+    html = STYLE_ATTRIBUTE.sub(minify, STYLE_BLOCK.sub(minify, html))
+    html = LAYOUT_WHITESPACE.sub('><', html)
+    html = QUOTED_CLASS.sub(r'\1\2', html)
+    return fold_markup(WHITESPACE_RUN.sub(' ', html).strip())
+
+
+def html_to_text(html: str) -> str:
+    """Terse plain-text rendering of a digest: headings, summary, article titles and links"""
+    soup = BeautifulSoup(html, DEFAULT_PARSER)
+    for element in soup(['style', 'script', 'head']):
+        element.decompose()
+    for element in soup.select(TEXT_OMITTED):
+        element.decompose()
+    for link in soup.find_all('a', href=True):
+        link.replace_with(link['href'])
+    for element in soup.find_all(BLOCK_TAGS):
+        element.append('\n')
+    for element in soup.find_all('span'):
+        element.insert_before(' ')
+    
+    lines = (' '.join(line.split()) for line in soup.get_text().splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+class PreparedMessage:
+    """A serialized email whose only per-recipient part is the To header"""
+    
+    def __init__(self, headers: bytes, body: bytes, eight_bit: bool):
+        self.headers = headers
+        self.body = body
+        self.eight_bit = eight_bit
+    
+    @property
+    def mail_options(self):
+        """MAIL FROM options needed to send this message"""
+        return ['BODY=8BITMIME'] if self.eight_bit else []
+    
+    def for_recipient(self, to_email: str) -> bytes:
+        return SMTP.fold_binary('To', to_email) + self.headers + b'\r\n' + self.body
+    
+    def __len__(self) -> int:
+        return len(self.headers) + len(self.body)
+
+
+@lru_cache(maxsize=8)
+def build_message(sender: str, subject: str, html: str, allow_8bit: bool = True) -> PreparedMessage:
+    """Build the multipart/alternative message for a digest, cached per digest
+    
+    Bodies are sent as 8-bit UTF-8 when the server supports 8BITMIME, and as
+    quoted-printable otherwise; base64 would add a third to the size.
+    """
+    compact_html = minify_html(html)
+    text = html_to_text(compact_html)
+    
+    fits = all(len(line.encode('utf-8')) <= MAX_LINE_LENGTH
+               for body in (compact_html, text) for line in body.splitlines())
+    cte = '8bit' if allow_8bit and fits else 'quoted-printable'
+    
+    msg = EmailMessage(policy=SMTP)
+    msg['From'] = sender
+    msg['Subject'] = subject
+    msg.set_content(text, cte=cte)
+    msg.add_alternative(compact_html, subtype='html', cte=cte)
+    
+    headers, body = msg.as_bytes().split(b'\r\n\r\n', 1)
+    return PreparedMessage(headers + b'\r\n', body, eight_bit=cte == '8bit')
@@ -4,16 +4,23 @@ News Searcher Module
 Handles news aggregation from multiple sources including RSS feeds and Google News.
 """
 
+import asyncio
 import urllib.parse
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import Awaitable, Callable, List, Dict, Optional
 import feedparser
 
+from .http_transport import HTTPTransport
+
 
 class AINewsSearcher:
     """Tool for searching AI news from multiple sources"""
     
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None,
+                 run_blocking: Optional[Callable[..., Awaitable]] = None):
+        self.transport = transport or HTTPTransport()
+        # Runs feed parsing for the async methods; defaults to a worker thread
+        self.run_blocking = run_blocking or asyncio.to_thread
         self.news_sources = {
             'techcrunch_ai': 'https://techcrunch.com/category/artificial-intelligence/feed/',
             'ai_news': 'https://artificialintelligence-news.com/feed/',
@@ -21,63 +28,121 @@ class AINewsSearcher:
             'mit_tech_ai': 'https://www.technologyreview.com/topic/artificial-intelligence/feed/',
         }
     
+    def _parse_feed(self, url: str):
+        """Fetch a feed over the shared transport and parse it"""
+        return feedparser.parse(self.transport.fetch(url))
+    
+    async def _aparse_feed(self, url: str):
+        """Fetch a feed without blocking the event loop and parse it via run_blocking"""
+        body = await self.transport.afetch(url)
+        return await self.run_blocking(feedparser.parse, body)
+    
+    def _feed_articles(self, feed, source_name: str, max_articles: int) -> List[Dict]:
+        """Get articles from the last 24 hours from a parsed RSS feed"""
+        articles = []
+        
+        for entry in feed.entries[:max_articles]:
+            # Get articles from last 24 hours
+            if hasattr(entry, 'published_parsed'):
+                pub_date = datetime(*entry.published_parsed[:6])
+                if pub_date > datetime.now() - timedelta(days=1):
+                    articles.append({
+                        'title': entry.title,
+                        'link': entry.link,
+                        'summary': entry.get('summary', '')[:200] + '...',
+                        'source': source_name,
+                        'published': pub_date.strftime('%Y-%m-%d %H:%M')
+                    })
+            else:
+                # If no published date, include recent articles anyway
+                articles.append({
+                    'title': entry.title,
+                    'link': entry.link,
+                    'summary': entry.get('summary', '')[:200] + '...',
+                    'source': source_name,
+                    'published': 'Recent'
+                })
+        
+        return articles
+    
+    def fetch_source(self, source_name: str, feed_url: str, max_articles: int) -> List[Dict]:
+        """Fetch articles from the last 24 hours from a single RSS feed"""
+        return self._feed_articles(self._parse_feed(feed_url), source_name, max_articles)
+    
+    async def afetch_source(self, source_name: str, feed_url: str, max_articles: int) -> List[Dict]:
+        """Async version of fetch_source"""
+        return self._feed_articles(await self._aparse_feed(feed_url), source_name, max_articles)
+    
     def search_rss_feeds(self, max_articles: int = 10) -> List[Dict]:
         """Search AI news from RSS feeds"""
         articles = []
         
         for source_name, feed_url in self.news_sources.items():
             try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:max_articles//len(self.news_sources)]:
-                    # Get articles from last 24 hours
-                    if hasattr(entry, 'published_parsed'):
-                        pub_date = datetime(*entry.published_parsed[:6])
-                        if pub_date > datetime.now() - timedelta(days=1):
-                            articles.append({
-                                'title': entry.title,
-                                'link': entry.link,
-                                'summary': entry.get('summary', '')[:200] + '...',
-                                'source': source_name,
-                                'published': pub_date.strftime('%Y-%m-%d %H:%M')
-                            })
-                    else:
-                        # If no published date, include recent articles anyway
-                        articles.append({
-                            'title': entry.title,
-                            'link': entry.link,
-                            'summary': entry.get('summary', '')[:200] + '...',
-                            'source': source_name,
-                            'published': 'Recent'
-                        })
+                articles.extend(self.fetch_source(source_name, feed_url, max_articles//len(self.news_sources)))
             except Exception as e:
                 print(f"Error fetching from {source_name}: {e}")
         
         return sorted(articles, key=lambda x: x['published'], reverse=True)[:max_articles]
     
+    async def asearch_rss_feeds(self, max_articles: int = 10) -> List[Dict]:
+        """Search AI news from all RSS feeds concurrently"""
+        per_source = max_articles // len(self.news_sources)
+        results = await asyncio.gather(
+            *(self.afetch_source(name, url, per_source) for name, url in self.news_sources.items()),
+            return_exceptions=True
+        )
+        
+        articles = []
+        for source_name, result in zip(self.news_sources, results):
+            if isinstance(result, Exception):
+                print(f"Error fetching from {source_name}: {result}")
+            else:
+                articles.extend(result)
+        
+        return sorted(articles, key=lambda x: x['published'], reverse=True)[:max_articles]
+    
+    def google_news_url(self, query: str = "artificial intelligence") -> str:
+        """Build the Google News RSS search URL for a query"""
+        # URL encode the query to handle spaces and special characters
+        encoded_query = urllib.parse.quote_plus(query)
+        return f"https://news.google.com/rss/search?q={encoded_query}&hl=en&gl=US&ceid=US:en"
+    
+    def _google_articles(self, feed, max_results: int) -> List[Dict]:
+        """Get articles from a parsed Google News feed"""
+        return [
+            {
+                'title': entry.title,
+                'link': entry.link,
+                'summary': entry.get('summary', '')[:200] + '...',
+                'source': 'Google News',
+                'published': entry.get('published', 'Recent')
+            }
+            for entry in feed.entries[:max_results]
+        ]
+    
     def search_google_news(self, query: str = "artificial intelligence", max_results: int = 5) -> List[Dict]:
         """Search Google News for AI articles (alternative method)"""
         # Note: For production, consider using Google News API or News API
-        articles = []
         try:
-            # URL encode the query to handle spaces and special characters
-            encoded_query = urllib.parse.quote_plus(query)
-            search_url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en&gl=US&ceid=US:en"
+            search_url = self.google_news_url(query)
             
             print(f"Fetching from Google News: {search_url}")
-            feed = feedparser.parse(search_url)
+            return self._google_articles(self._parse_feed(search_url), max_results)
+        except Exception as e:
+            print(f"Error fetching from Google News: {e}")
+            return []
+    
+    async def asearch_google_news(self, query: str = "artificial intelligence", max_results: int = 5) -> List[Dict]:
+        """Async version of search_google_news"""
+        try:
+            search_url = self.google_news_url(query)
             
-            for entry in feed.entries[:max_results]:
-                articles.append({
-                    'title': entry.title,
-                    'link': entry.link,
-                    'summary': entry.get('summary', '')[:200] + '...',
-                    'source': 'Google News',
-                    'published': entry.get('published', 'Recent')
-                })
+            print(f"Fetching from Google News: {search_url}")
+            return self._google_articles(await self._aparse_feed(search_url), max_results)
         except Exception as e:
             print(f"Error fetching from Google News: {e}")
-        
-        return articles
+            return []
     
     def is_similar_title(self, title1: str, title2: str) -> bool:
         """Check if two titles are similar (basic duplicate detection)"""
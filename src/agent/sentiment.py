@@ -0,0 +1,165 @@
+"""
+Sentiment Module
+
+Batch lexicon-based sentiment scoring and topic tagging of articles. The
+whole batch is tokenized in one pass, mapped to a compiled lexicon and scored
+with sparse bag-of-words matrix operations.
+"""
+
+import re
+from itertools import repeat
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+
+POSITIVE_TERMS = {
+    'breakthrough': 2.0, 'launch': 0.5, 'launches': 0.5, 'improve': 1.0, 'improves': 1.0,
+    'improved': 1.0, 'improvement': 1.0, 'advance': 1.0, 'advances': 1.0, 'record': 1.0,
+    'raises': 1.0, 'growth': 1.0, 'grows': 1.0, 'success': 1.5, 'successful': 1.5,
+    'win': 1.5, 'wins': 1.5, 'best': 1.0, 'faster': 1.0, 'efficient': 1.0, 'powerful': 1.0,
+    'innovative': 1.5, 'innovation': 1.5, 'partnership': 1.0, 'boost': 1.0, 'boosts': 1.0,
+    'surge': 1.0, 'surges': 1.0, 'opportunity': 1.0, 'promising': 1.5, 'beneficial': 1.5,
+    'helps': 1.0, 'safe': 1.0, 'safer': 1.0, 'open': 0.5, 'gains': 1.0, 'strong': 1.0,
+    'excited': 1.5, 'exciting': 1.5, 'impressive': 1.5, 'milestone': 1.5, 'upgrade': 0.5,
+}
+
+NEGATIVE_TERMS = {
+    'lawsuit': -1.5, 'sues': -1.5, 'sued': -1.5, 'ban': -1.5, 'bans': -1.5, 'banned': -1.5,
+    'risk': -1.0, 'risks': -1.0, 'risky': -1.0, 'threat': -1.5, 'threats': -1.5,
+    'layoffs': -2.0, 'fired': -1.5, 'cuts': -1.0, 'decline': -1.0, 'declines': -1.0,
+    'fail': -1.5, 'fails': -1.5, 'failure': -1.5, 'flaw': -1.0, 'flaws': -1.0,
+    'bias': -1.0, 'biased': -1.0, 'misinformation': -1.5, 'deepfake': -1.0, 'deepfakes': -1.0,
+    'breach': -2.0, 'leak': -1.5, 'leaked': -1.5, 'hack': -1.5, 'hacked': -1.5,
+    'vulnerability': -1.5, 'scam': -2.0, 'fraud': -2.0, 'concern': -1.0, 'concerns': -1.0,
+    'warns': -1.0, 'warning': -1.0, 'crisis': -2.0, 'controversy': -1.5, 'probe': -1.0,
+    'investigation': -1.0, 'fined': -1.5, 'loss': -1.0, 'losses': -1.0,
+    'harm': -1.5, 'harmful': -1.5, 'dangerous': -1.5, 'outage': -1.5, 'delay': -1.0, 'delayed': -1.0,
+}
+
+TOPIC_TERMS = {
+    'LLMs': ['llm', 'llms', 'gpt', 'chatgpt', 'gemini', 'claude', 'llama', 'language', 'chatbot', 'chatbots'],
+    'Research': ['research', 'researchers', 'paper', 'study', 'benchmark', 'benchmarks', 'arxiv', 'dataset'],
+    'Funding': ['funding', 'raises', 'investment', 'investors', 'valuation', 'series', 'acquisition', 'acquires', 'ipo'],
+    'Policy': ['regulation', 'regulators', 'law', 'policy', 'congress', 'eu', 'act', 'ban', 'government', 'senate'],
+    'Safety': ['safety', 'alignment', 'risk', 'risks', 'misinformation', 'deepfake', 'deepfakes', 'bias', 'harm'],
+    'Hardware': ['chip', 'chips', 'gpu', 'gpus', 'nvidia', 'semiconductor', 'datacenter', 'compute', 'tpu'],
+    'Robotics': ['robot', 'robots', 'robotics', 'humanoid', 'autonomous', 'drone', 'drones'],
+    'Products': ['launch', 'launches', 'release', 'releases', 'app', 'feature', 'features', 'update', 'available'],
+    'Security': ['security', 'breach', 'hack', 'hacked', 'vulnerability', 'cyber', 'cybersecurity', 'leak'],
+}
+
+HTML_TAG = re.compile(r'<[^>]+>')
+DOCUMENT_SEPARATOR = '\x00'
+TOKEN = re.compile(r'[a-z]+|\x00')
+SEPARATOR_ID = -2
+
+
+class CompiledLexicon:
+    """Sentiment weights and topic membership indexed by vocabulary term"""
+    
+    def __init__(self, sentiment_terms: Dict[str, float], topic_terms: Dict[str, List[str]]):
+        vocabulary = sorted(set(sentiment_terms) | {term for terms in topic_terms.values() for term in terms})
+        self.index = {term: i for i, term in enumerate(vocabulary)}
+        self.topics = list(topic_terms)
+        
+        self.weights = np.zeros(len(vocabulary))
+        for term, weight in sentiment_terms.items():
+            self.weights[self.index[term]] = weight
+        
+        self.topic_matrix = np.zeros((len(vocabulary), len(self.topics)), dtype=np.float64)
+        for t, terms in enumerate(topic_terms.values()):
+            for term in terms:
+                self.topic_matrix[self.index[term], t] = 1.0
+        
+        # Token to term ID, with the document separator as a sentinel and -1 for other words
+        self.lookup = {**self.index, DOCUMENT_SEPARATOR: SEPARATOR_ID}
+
+
+DEFAULT_LEXICON = CompiledLexicon({**POSITIVE_TERMS, **NEGATIVE_TERMS}, TOPIC_TERMS)
+
+
+class SentimentTagger:
+    """Score sentiment and assign topic tags to a batch of articles in one pass"""
+    
+    def __init__(self, lexicon: CompiledLexicon = DEFAULT_LEXICON, threshold: float = 0.15,
+                 max_tags: int = 3):
+        self.lexicon = lexicon
+        self.threshold = threshold
+        self.max_tags = max_tags
+    
+    def term_matrix(self, texts: List[str]):
+        """Build the sparse document-term count matrix for the batch
+        
+        Returns (rows, cols) index arrays of every lexicon hit, or a SciPy CSR
+        matrix when SciPy is installed, plus the word count of each document.
+        """
+        # Tokenize the whole batch at once; separator tokens mark document boundaries
+        words = TOKEN.findall(DOCUMENT_SEPARATOR.join(texts).lower())
+        ids = np.fromiter(map(self.lexicon.lookup.get, words, repeat(-1)), dtype=np.int64, count=len(words))
+        
+        separators = ids == SEPARATOR_ID
+        documents = np.cumsum(separators)
+        word_counts = np.bincount(documents[~separators], minlength=len(texts))
+        
+        hits = ids >= 0
+        rows, cols = documents[hits], ids[hits]
+        
+        if sparse is not None:
+            shape = (len(texts), len(self.lexicon.index))
+            matrix = sparse.csr_matrix((np.ones(len(cols)), (rows, cols)), shape=shape)
+            return matrix, word_counts
+        return (rows, cols), word_counts
+    
+    def score(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return sentiment scores in [-1, 1] and per-topic hit counts for each text"""
+        n_docs, n_topics = len(texts), len(self.lexicon.topics)
+        if n_docs == 0:
+            return np.zeros(0), np.zeros((0, n_topics))
+        
+        matrix, word_counts = self.term_matrix(texts)
+        
+        if sparse is not None:
+            raw = matrix @ self.lexicon.weights
+            topic_counts = np.asarray(matrix @ self.lexicon.topic_matrix)
+        else:
+            rows, cols = matrix
+            raw = np.bincount(rows, weights=self.lexicon.weights[cols], minlength=n_docs)
+            hit_rows, hit_topics = np.nonzero(self.lexicon.topic_matrix[cols])
+            topic_counts = np.bincount(
+                rows[hit_rows] * n_topics + hit_topics, minlength=n_docs * n_topics
+            ).reshape(n_docs, n_topics).astype(np.float64)
+        
+        scores = np.tanh(raw / np.sqrt(np.maximum(word_counts, 1)))
+        return scores, topic_counts
+    
+    def annotate(self, articles: List[Dict]) -> List[Dict]:
+        """Return copies of the articles with 'sentiment', 'sentiment_label' and 'tags'"""
+        texts = [
+            f"{article.get('title', '')} {HTML_TAG.sub(' ', article.get('summary', ''))}"
+            for article in articles
+        ]
+        scores, topic_counts = self.score(texts)
+        
+        labels = np.where(scores > self.threshold, 'positive',
+                          np.where(scores < -self.threshold, 'negative', 'neutral'))
+        
+        # Top tags per article, most hits first, computed for the whole batch at once
+        order = np.argsort(-topic_counts, axis=1, kind='stable')[:, :self.max_tags]
+        present = np.take_along_axis(topic_counts, order, axis=1) > 0
+        topics = np.asarray(self.lexicon.topics, dtype=object)
+        
+        return [
+            {
+                **article,
+                'sentiment': round(float(score), 3),
+                'sentiment_label': str(label),
+                'tags': topics[tag_order[tag_present]].tolist(),
+            }
+            for article, score, label, tag_order, tag_present in zip(articles, scores, labels, order, present)
+        ]
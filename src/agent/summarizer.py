@@ -0,0 +1,113 @@
+"""
+Summarizer Module
+
+Local extractive summarization of news articles. Used as a low-latency
+alternative to Gemini, as its fallback, and to condense the Gemini prompt.
+"""
+
+import re
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from ..utils.helpers import clean_text
+
+
+STOP_WORDS = frozenset("""
+a an and are as at be been but by can for from has have how in into is it its
+new of on or says that the their this to was were what when which who will with
+""".split())
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+TRUNCATION = re.compile(r'\s*(?:\.\.\.|\u2026)$')
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+class ExtractiveSummarizer:
+    """Centroid-based extractive summarizer over article titles and summaries"""
+    
+    def __init__(self, max_sentences: int = 3, min_sentence_words: int = 4,
+                 redundancy_threshold: float = 0.6):
+        self.max_sentences = max_sentences
+        self.min_sentence_words = min_sentence_words
+        self.redundancy_threshold = redundancy_threshold
+    
+    def split_sentences(self, articles: List[Dict]) -> List[str]:
+        """Split article titles and summaries into candidate sentences"""
+        sentences = []
+        seen = set()
+        
+        for article in articles:
+            title = clean_text(article.get('title', ''))
+            summary = clean_text(article.get('summary', '')).strip()
+            
+            # Feed and enrichment summaries are cut off with an ellipsis; drop the unfinished tail
+            truncated = TRUNCATION.search(summary)
+            segments = SENTENCE_SPLIT.split(TRUNCATION.sub('', summary))
+            if truncated and not segments[-1].endswith(('.', '!', '?')):
+                segments.pop()
+            
+            candidates = [title] + segments
+            for sentence in candidates:
+                sentence = sentence.strip()
+                key = sentence.lower()
+                if len(sentence.split()) < self.min_sentence_words or key in seen:
+                    continue
+                seen.add(key)
+                if sentence[-1] not in '.!?':
+                    sentence += '.'
+                sentences.append(sentence)
+        
+        return sentences
+    
+    def _sentence_vectors(self, sentences: List[str]) -> np.ndarray:
+        """Build L2-normalized TF-IDF vectors, one row per sentence"""
+        vocabulary: Dict[str, int] = {}
+        rows, cols = [], []
+        
+        for i, sentence in enumerate(sentences):
+            for token in TOKEN_PATTERN.findall(sentence.lower()):
+                if token in STOP_WORDS:
+                    continue
+                rows.append(i)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+        
+        matrix = np.zeros((len(sentences), max(len(vocabulary), 1)))
+        if not vocabulary:
+            return matrix
+        
+        np.add.at(matrix, (np.array(rows), np.array(cols)), 1.0)
+        
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        matrix *= np.log((1 + len(sentences)) / (1 + document_frequency)) + 1.0
+        
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+    
+    def rank_sentences(self, sentences: List[str]) -> List[int]:
+        """Return sentence indices ordered by salience, skipping near-duplicates"""
+        if not sentences:
+            return []
+        
+        vectors = self._sentence_vectors(sentences)
+        centroid = vectors.mean(axis=0)
+        scores = vectors @ centroid
+        similarity = vectors @ vectors.T
+        
+        ranked = []
+        for index in np.argsort(-scores, kind='stable'):
+            if ranked and similarity[index, ranked].max() > self.redundancy_threshold:
+                continue
+            ranked.append(int(index))
+        
+        return ranked
+    
+    def condense(self, articles: List[Dict], max_sentences: int) -> List[str]:
+        """Select the most salient sentences, kept in their original order"""
+        sentences = self.split_sentences(articles)
+        selected = sorted(self.rank_sentences(sentences)[:max_sentences])
+        return [sentences[i] for i in selected]
+    
+    def summarize(self, articles: List[Dict], max_sentences: Optional[int] = None) -> str:
+        """Create a short extractive summary of the articles"""
+        return " ".join(self.condense(articles, max_sentences or self.max_sentences))
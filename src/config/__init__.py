@@ -4,9 +4,13 @@ Configuration Module
 Handles application settings and configuration management.
 """
 
-from .settings import get_settings, validate_config
+from .settings import Settings, get_settings, load_settings, validate_config
+from .reloader import SettingsReloader
 
 __all__ = [
+    "Settings",
     "get_settings",
-    "validate_config"
-] 
\ No newline at end of file
+    "load_settings",
+    "validate_config",
+    "SettingsReloader"
+]
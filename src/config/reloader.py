@@ -0,0 +1,105 @@
+"""
+Reloader Module
+
+Hot reloading of settings. The config file is polled for changes and SIGHUP
+requests an immediate reload; a new settings snapshot is validated first and
+then swapped in atomically, so long-lived objects (agent, HTTP pools, caches,
+scheduler) survive the change.
+"""
+
+import os
+import signal
+import threading
+from dataclasses import fields
+from typing import Callable, List, Optional, Tuple
+
+from .settings import Settings, load_settings, validate_config, replace_settings
+
+SettingsListener = Callable[[Settings, Settings], None]
+
+
+def changed_settings(old: Settings, new: Settings) -> List[str]:
+    """Names of the top-level settings that differ between two snapshots"""
+    return [f.name for f in fields(Settings) if getattr(old, f.name) != getattr(new, f.name)]
+
+
+class SettingsReloader:
+    """Hold the current settings and swap in new ones when the config changes"""
+    
+    def __init__(self, settings: Settings, loader: Callable[[Optional[str]], Settings] = load_settings):
+        self._settings = settings
+        self._loader = loader
+        self._listeners: List[SettingsListener] = []
+        self._requested = threading.Event()
+        self._lock = threading.Lock()
+        self._file_state = self._stat_config()
+    
+    @property
+    def current(self) -> Settings:
+        """The current settings; read this each time instead of keeping a copy"""
+        return self._settings
+    
+    def subscribe(self, listener: SettingsListener):
+        """Call listener(old, new) after every successful reload"""
+        self._listeners.append(listener)
+    
+    def _stat_config(self) -> Optional[Tuple[int, int]]:
+        if not self._settings.config_file:
+            return None
+        try:
+            stat = os.stat(self._settings.config_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def request_reload(self, *_):
+        """Ask for a reload on the next check; safe to use as a signal handler"""
+        self._requested.set()
+    
+    def install_signal_handler(self):
+        """Reload on SIGHUP where the platform has it"""
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, self.request_reload)
+    
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to `timeout` seconds, returning early when a reload is requested"""
+        return self._requested.wait(timeout)
+    
+    def check(self) -> bool:
+        """Reload if requested or the config file changed; returns True if settings changed"""
+        if not self._requested.is_set() and self._stat_config() == self._file_state:
+            return False
+        return self.reload()
+    
+    def reload(self) -> bool:
+        """Load, validate and swap in new settings; invalid settings leave the current ones in place"""
+        with self._lock:
+            self._requested.clear()
+            self._file_state = self._stat_config()
+            
+            try:
+                new = self._loader(self._settings.config_file)
+            except (OSError, ValueError) as e:
+                print(f"❌ Config reload failed, keeping current settings: {e}")
+                return False
+            
+            is_valid, error_msg = validate_config(new)
+            if not is_valid:
+                print(f"❌ Config reload rejected, keeping current settings: {error_msg}")
+                return False
+            
+            changed = changed_settings(self._settings, new)
+            if not changed:
+                return False
+            
+            old, self._settings = self._settings, new
+            replace_settings(new)
+            self._file_state = self._stat_config()
+        
+        print(f"🔄 Reloaded configuration: {', '.join(changed)}")
+        for listener in self._listeners:
+            try:
+                listener(old, new)
+            except Exception as e:
+                print(f"❌ Error applying new configuration: {e}")
+        return True
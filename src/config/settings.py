@@ -1,69 +1,304 @@
 """
 Settings Module
 
-Configuration management for the AI News Agent.
+Configuration management for the AI News Agent. Settings are an immutable,
+typed snapshot built from defaults, environment variables and an optional
+TOML config file, in that order of precedence.
 """
 
 import os
-from typing import Dict, Optional
+import re
+import threading
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Dict, List, Optional, Tuple, Union, get_args, get_origin, get_type_hints
 from dotenv import load_dotenv
 
+try:
+    import tomllib
+except ImportError:
+    # Python < 3.11
+    import tomli as tomllib
+
 load_dotenv()
 
+DEFAULT_CONFIG_FILE = 'config.toml'
+SCHEDULE_TIME = re.compile(r'^([01]\d|2[0-3]):[0-5]\d$')
+TRUE_VALUES = {'true', '1', 'yes', 'on'}
+
+
+def _split_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated environment variable into a list"""
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+
+@dataclass(frozen=True)
+class EmailConfig:
+    smtp_server: str = 'smtp.gmail.com'
+    smtp_port: int = 587
+    email: Optional[str] = None
+    password: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DeliveryConfig:
+    """Additional delivery channels (webhook URLs)"""
+    slack: Tuple[str, ...] = ()
+    discord: Tuple[str, ...] = ()
+    webhook: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class LLMBudgetConfig:
+    """LLM rate limits and budgets, shared by all processes using the same data_dir"""
+    requests_per_minute: float = 15.0
+    daily_requests: int = 1500
+    daily_tokens: int = 1_000_000
+
+
+@dataclass(frozen=True)
+class LLMConfig:
+    timeout: float = 30.0
+    hedge_after: Optional[float] = None
+    max_wait: float = 10.0
+    
+    def __post_init__(self):
+        # 0 disables hedging, as in LLM_HEDGE_AFTER=0
+        if not self.hedge_after:
+            object.__setattr__(self, 'hedge_after', None)
+
+
+@dataclass(frozen=True)
+class HTTPConfig:
+    timeout: float = 15.0
+    user_agent: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings; build new ones with load_settings() instead of mutating"""
+    
+    # Google Gemini API Configuration
+    gemini_api_key: Optional[str] = None
+    
+    # Email Configuration
+    email_config: EmailConfig = field(default_factory=EmailConfig)
+    
+    # Agent Configuration
+    recipients: Tuple[str, ...] = ()
+    run_mode: str = 'schedule'
+    schedule_time: str = '06:00'
+    max_articles: int = 10
+    summary_mode: str = 'llm'
+    enrich_content: bool = False
+    sentiment_analysis: bool = True
+    
+    # Storage and Ingestion Configuration
+    data_dir: str = 'data'
+    ingest_workers: int = 4
+    use_article_store: bool = False
+    archive_digests: bool = True
+    publish_snapshots: bool = True
+    checkpoint_runs: bool = True
+    checkpoint_max_age_hours: float = 48.0
+    
+    # Additional Delivery Channels
+    delivery_config: DeliveryConfig = field(default_factory=DeliveryConfig)
+    
+    # LLM Rate Limits, Budgets and Timeouts
+    llm_budget: LLMBudgetConfig = field(default_factory=LLMBudgetConfig)
+    llm_config: LLMConfig = field(default_factory=LLMConfig)
+    
+    # HTTP Configuration
+    http_config: HTTPConfig = field(default_factory=HTTPConfig)
+    
+    # File the settings were loaded from, watched for changes
+    config_file: Optional[str] = None
+
+
+# Setting path -> environment variable
+ENV_VARS = {
+    'gemini_api_key': 'GEMINI_API_KEY',
+    'email_config.email': 'SENDER_EMAIL',
+    'email_config.password': 'EMAIL_PASSWORD',
+    'recipients': 'RECIPIENT_EMAIL',
+    'run_mode': 'RUN_MODE',
+    'schedule_time': 'SCHEDULE_TIME',
+    'max_articles': 'MAX_ARTICLES',
+    'summary_mode': 'SUMMARY_MODE',
+    'enrich_content': 'ENRICH_CONTENT',
+    'sentiment_analysis': 'SENTIMENT_ANALYSIS',
+    'data_dir': 'DATA_DIR',
+    'ingest_workers': 'INGEST_WORKERS',
+    'use_article_store': 'USE_ARTICLE_STORE',
+    'archive_digests': 'ARCHIVE_DIGESTS',
+    'publish_snapshots': 'PUBLISH_SNAPSHOTS',
+    'checkpoint_runs': 'CHECKPOINT_RUNS',
+    'checkpoint_max_age_hours': 'CHECKPOINT_MAX_AGE_HOURS',
+    'delivery_config.slack': 'SLACK_WEBHOOK_URLS',
+    'delivery_config.discord': 'DISCORD_WEBHOOK_URLS',
+    'delivery_config.webhook': 'WEBHOOK_URLS',
+    'llm_budget.requests_per_minute': 'LLM_REQUESTS_PER_MINUTE',
+    'llm_budget.daily_requests': 'LLM_DAILY_REQUESTS',
+    'llm_budget.daily_tokens': 'LLM_DAILY_TOKENS',
+    'llm_config.timeout': 'LLM_TIMEOUT',
+    'llm_config.hedge_after': 'LLM_HEDGE_AFTER',
+    'llm_config.max_wait': 'LLM_MAX_WAIT',
+    'http_config.timeout': 'HTTP_TIMEOUT',
+    'http_config.user_agent': 'HTTP_USER_AGENT',
+}
 
-def get_settings() -> Dict:
-    """Get application settings from environment variables"""
-    return {
-        # Google Gemini API Configuration
-        'gemini_api_key': os.getenv('GEMINI_API_KEY'),
-        
-        # Email Configuration
-        'email_config': {
-            'smtp_server': 'smtp.gmail.com',
-            'smtp_port': 587,
-            'email': os.getenv('SENDER_EMAIL'),
-            'password': os.getenv('EMAIL_PASSWORD')
-        },
-        
-        # Agent Configuration
-        'recipient_email': os.getenv('RECIPIENT_EMAIL'),
-        'run_mode': os.getenv('RUN_MODE', 'schedule').lower(),
-        'schedule_time': os.getenv('SCHEDULE_TIME', '06:00'),
-        'max_articles': int(os.getenv('MAX_ARTICLES', '10'))
-    }
-
-
-def validate_config() -> tuple[bool, Optional[str]]:
+LOWERCASE_SETTINGS = {'run_mode', 'summary_mode'}
+
+
+def _coerce(value, hint):
+    """Convert an environment string or config file value to the setting's type"""
+    if get_origin(hint) is Union:
+        if value is None or value == '':
+            return None
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+    if get_origin(hint) is tuple:
+        items = _split_list(value) if isinstance(value, str) else value
+        if not isinstance(items, (list, tuple)):
+            raise TypeError(f"expected a list, got {type(items).__name__}")
+        return tuple(str(item).strip() for item in items)
+    if hint is bool:
+        return value.strip().lower() in TRUE_VALUES if isinstance(value, str) else bool(value)
+    if hint in (int, float) and isinstance(value, bool):
+        raise TypeError("expected a number")
+    return hint(value)
+
+
+def _build(cls, raw: Dict, prefix: str = ''):
+    """Create a settings dataclass from a nested dict of raw values"""
+    if not isinstance(raw, dict):
+        raise ValueError(f"Setting {prefix.rstrip('.')} must be a table")
+    
+    hints = get_type_hints(cls)
+    unknown = sorted(set(raw) - set(hints))
+    if unknown:
+        raise ValueError(f"Unknown setting: {prefix}{unknown[0]}")
+    
+    values = {}
+    for f in fields(cls):
+        if f.name not in raw:
+            continue
+        path = f"{prefix}{f.name}"
+        hint = hints[f.name]
+        if is_dataclass(hint):
+            values[f.name] = _build(hint, raw[f.name], f"{path}.")
+            continue
+        try:
+            value = _coerce(raw[f.name], hint)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for {ENV_VARS.get(path, path)}: {raw[f.name]!r}") from None
+        values[f.name] = value.lower() if f.name in LOWERCASE_SETTINGS else value
+    return cls(**values)
+
+
+def _merge(base: Dict, overrides: Dict) -> Dict:
+    """Recursively merge config file tables over environment values"""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_settings(config_file: Optional[str] = None, environ: Optional[Dict[str, str]] = None) -> Settings:
+    """Read a fresh settings snapshot from environment variables and the config file
+    
+    The config file is CONFIG_FILE, or config.toml when it exists. Values in
+    the file take precedence over the environment so they can be changed
+    while the agent is running. Raises ValueError for unknown or invalid
+    settings and OSError if an explicitly named file cannot be read.
+    """
+    environ = os.environ if environ is None else environ
+    
+    raw: Dict = {}
+    for path, env_var in ENV_VARS.items():
+        if env_var in environ:
+            *tables, key = path.split('.')
+            target = raw
+            for table in tables:
+                target = target.setdefault(table, {})
+            target[key] = environ[env_var]
+    
+    config_file = config_file or environ.get('CONFIG_FILE')
+    if not config_file and os.path.exists(DEFAULT_CONFIG_FILE):
+        config_file = DEFAULT_CONFIG_FILE
+    
+    if config_file:
+        with open(config_file, 'rb') as f:
+            try:
+                raw = _merge(raw, tomllib.load(f))
+            except tomllib.TOMLDecodeError as e:
+                raise ValueError(f"Invalid config file {config_file}: {e}") from None
+        raw['config_file'] = os.path.abspath(config_file)
+    
+    return _build(Settings, raw)
+
+
+_current: Optional[Settings] = None
+_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """Get the current application settings, loading them on first use"""
+    global _current
+    settings = _current
+    if settings is None:
+        with _lock:
+            if _current is None:
+                _current = load_settings()
+            settings = _current
+    return settings
+
+
+def replace_settings(settings: Settings) -> Settings:
+    """Atomically make `settings` the current settings; returns the previous ones"""
+    global _current
+    with _lock:
+        previous, _current = _current, settings
+    return previous
+
+
+def validate_config(settings: Optional[Settings] = None) -> tuple[bool, Optional[str]]:
     """Validate that all required configuration is present"""
-    settings = get_settings()
+    settings = settings or get_settings()
     
     required_fields = [
-        ('gemini_api_key', 'GEMINI_API_KEY'),
-        ('email_config.email', 'SENDER_EMAIL'),
-        ('email_config.password', 'EMAIL_PASSWORD'),
-        ('recipient_email', 'RECIPIENT_EMAIL')
+        (settings.gemini_api_key, 'GEMINI_API_KEY'),
+        (settings.email_config.email, 'SENDER_EMAIL'),
+        (settings.email_config.password, 'EMAIL_PASSWORD'),
+        (settings.recipients, 'RECIPIENT_EMAIL')
     ]
     
-    missing_fields = []
+    # Ingest workers only fetch feeds, so they need no credentials
+    if settings.run_mode == 'ingest':
+        required_fields = []
     
-    for field_path, env_var in required_fields:
-        # Navigate nested dictionaries
-        value = settings
-        for key in field_path.split('.'):
-            value = value.get(key) if isinstance(value, dict) else None
-            if value is None:
-                break
-        
-        if not value:
-            missing_fields.append(env_var)
+    missing_fields = [env_var for value, env_var in required_fields if not value]
     
     if missing_fields:
         error_msg = f"Missing required environment variables: {', '.join(missing_fields)}"
         return False, error_msg
     
     # Validate run mode
-    if settings['run_mode'] not in ['once', 'schedule']:
-        return False, "RUN_MODE must be either 'once' or 'schedule'"
+    if settings.run_mode not in ['once', 'schedule', 'ingest']:
+        return False, "RUN_MODE must be one of 'once', 'schedule' or 'ingest'"
+    
+    # Validate summary mode
+    if settings.summary_mode not in ['llm', 'extractive']:
+        return False, "SUMMARY_MODE must be either 'llm' or 'extractive'"
+    
+    # Validate schedule
+    if not SCHEDULE_TIME.match(settings.schedule_time):
+        return False, "SCHEDULE_TIME must be a 24-hour time in HH:MM format"
+    
+    if settings.max_articles < 1:
+        return False, "MAX_ARTICLES must be at least 1"
     
     return True, None
 
@@ -75,8 +310,10 @@ def print_config_help():
     print("GEMINI_API_KEY - Your Google Gemini API key")
     print("SENDER_EMAIL - Your Gmail address")
     print("EMAIL_PASSWORD - Your Gmail App Password (not regular password)")
-    print("RECIPIENT_EMAIL - Email address to send digest to")
+    print("RECIPIENT_EMAIL - Email address to send digest to (comma-separate several)")
+    print("\nSettings can also be kept in a TOML file (config.toml or CONFIG_FILE);")
+    print("edit it or send SIGHUP to apply changes without restarting.")
     print("\n📧 Gmail Setup Instructions:")
     print("1. Enable 2-Factor Authentication on your Google account")
     print("2. Generate an App Password: https://myaccount.google.com/apppasswords")
-    print("3. Use the 16-character app password as EMAIL_PASSWORD")
\ No newline at end of file
+    print("3. Use the 16-character app password as EMAIL_PASSWORD")
@@ -0,0 +1,11 @@
+"""
+Server Module
+
+HTTP API serving precomputed digest snapshots.
+"""
+
+from .digest_server import DigestServer
+
+__all__ = [
+    "DigestServer"
+]
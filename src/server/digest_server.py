@@ -0,0 +1,202 @@
+"""
+Digest Server Module
+
+Lightweight HTTP API serving precomputed digest snapshots as JSON and HTML.
+Requests never trigger feed fetches or LLM calls; they only read snapshots
+written at generation time.
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Tuple
+
+from ..storage.snapshot_store import SnapshotStore, Representation, FORMATS, LATEST_POINTER
+
+ROUTE = re.compile(r'^/digests/(?P<id>[0-9A-Za-z-]+)(?:\.(?P<fmt>json|html))?$')
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+LATEST_CACHE = 'public, max-age=60'
+
+
+class SnapshotCache:
+    """In-memory cache of loaded snapshots; snapshots never change once written"""
+    
+    def __init__(self, store: SnapshotStore, max_entries: int = 256):
+        self.store = store
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Representation]" = OrderedDict()
+        self._index: Optional[Representation] = None
+        self._pointer_state = None
+        self._lock = threading.Lock()
+    
+    def _check_pointer(self):
+        """Drop the cached index when a new snapshot has been published"""
+        try:
+            stat = os.stat(self.store.root / LATEST_POINTER)
+            state = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            state = None
+        if state != self._pointer_state:
+            self._pointer_state = state
+            self._index = None
+    
+    def get(self, snapshot_id: str, fmt: str) -> Optional[Representation]:
+        key = (snapshot_id, fmt)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        
+        representation = self.store.load(snapshot_id, fmt)
+        if representation is None:
+            return None
+        
+        with self._lock:
+            self._entries[key] = representation
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return representation
+    
+    def latest_id(self) -> Optional[str]:
+        return self.store.latest_id()
+    
+    def index(self) -> Representation:
+        """JSON listing of all snapshots, rebuilt only after a new publish"""
+        with self._lock:
+            self._check_pointer()
+            if self._index is not None:
+                return self._index
+        
+        digests = []
+        for snapshot_id in self.store.list_ids():
+            snapshot = self.get(snapshot_id, 'json')
+            if snapshot is None:
+                continue
+            document = json.loads(snapshot.body)
+            digests.append({
+                'id': snapshot_id,
+                'created_at': document['created_at'],
+                'subject': document['subject'],
+                'article_count': len(document['articles']),
+                'json': f"/digests/{snapshot_id}.json",
+                'html': f"/digests/{snapshot_id}.html",
+            })
+        
+        body = json.dumps({'latest': self.latest_id(), 'digests': digests}, ensure_ascii=False).encode('utf-8')
+        index = Representation(body, gzip.compress(body, mtime=0), FORMATS['json'],
+                               f'"index-{self._pointer_state and self._pointer_state[0]}"')
+        with self._lock:
+            self._index = index
+        return index
+
+
+class DigestRequestHandler(BaseHTTPRequestHandler):
+    """Serve /digests, /digests/latest[.json|.html] and /digests/<id>[.json|.html]"""
+    
+    server_version = "AINewsDigestServer/1.0"
+    cache: SnapshotCache = None
+    
+    def do_HEAD(self):
+        self._handle(send_body=False)
+    
+    def do_GET(self):
+        self._handle(send_body=True)
+    
+    def _handle(self, send_body: bool):
+        path = self.path.split('?', 1)[0].rstrip('/') or '/'
+        
+        if path == '/':
+            path = '/digests/latest.html'
+        
+        if path == '/digests':
+            self._send(self.cache.index(), LATEST_CACHE, send_body)
+            return
+        
+        match = ROUTE.match(path)
+        if not match:
+            self._send_error(404, "Not found", send_body)
+            return
+        
+        snapshot_id = match.group('id')
+        fmt = match.group('fmt') or 'json'
+        cache_control = IMMUTABLE_CACHE
+        
+        if snapshot_id == 'latest':
+            snapshot_id = self.cache.latest_id()
+            cache_control = LATEST_CACHE
+            if snapshot_id is None:
+                self._send_error(404, "No digests published yet", send_body)
+                return
+        
+        representation = self.cache.get(snapshot_id, fmt)
+        if representation is None:
+            self._send_error(404, "Digest not found", send_body)
+            return
+        
+        self._send(representation, cache_control, send_body)
+    
+    def _accepts_gzip(self) -> bool:
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+    
+    def _send(self, representation: Representation, cache_control: str, send_body: bool):
+        etag = representation.etag
+        if_none_match = self.headers.get('If-None-Match', '')
+        if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        
+        body = representation.body
+        self.send_response(200)
+        self.send_header('Content-Type', representation.content_type)
+        if self._accepts_gzip():
+            body = representation.gzipped
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+    
+    def _send_error(self, status: int, message: str, send_body: bool):
+        body = json.dumps({'error': message}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', FORMATS['json'])
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class DigestServer:
+    """Threaded HTTP server for precomputed digest snapshots"""
+    
+    def __init__(self, store: SnapshotStore, host: str = '127.0.0.1', port: int = 8080):
+        handler = type('BoundDigestRequestHandler', (DigestRequestHandler,), {'cache': SnapshotCache(store)})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+    
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+    
+    def serve_forever(self):
+        self.httpd.serve_forever()
+    
+    def shutdown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,21 @@
+"""
+Storage Module
+
+SQLite-backed stores shared between runs and worker processes.
+"""
+
+from .article_store import ArticleStore
+from .lease_coordinator import SourceLeaseCoordinator
+from .digest_archive import DigestArchive
+from .snapshot_store import SnapshotStore
+from .llm_budget import LLMBudget
+from .checkpoint_store import CheckpointStore
+
+__all__ = [
+    "ArticleStore",
+    "SourceLeaseCoordinator",
+    "DigestArchive",
+    "SnapshotStore",
+    "LLMBudget",
+    "CheckpointStore"
+]
@@ -0,0 +1,87 @@
+"""
+Article Store Module
+
+Shared SQLite store for ingested articles.
+"""
+
+import threading
+import time
+from typing import List, Dict, Optional
+
+from .sqlite import connect
+
+
+class ArticleStore:
+    """Common article store written to by ingest workers and read by the digest"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn = connect(db_path)
+        self._lock = threading.Lock()
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                link TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                summary TEXT NOT NULL DEFAULT '',
+                source TEXT NOT NULL,
+                published TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_fetched_at ON articles(fetched_at);
+        """)
+    
+    def add_articles(self, articles: List[Dict]) -> int:
+        """Insert articles, ignoring links already stored; returns the number added"""
+        now = time.time()
+        rows = [
+            (art['link'], art['title'], art.get('summary', ''), art['source'], art.get('published', 'Recent'), now)
+            for art in articles
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO articles (link, title, summary, source, published, fetched_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    rows
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            return self._conn.total_changes - before
+    
+    def recent_articles(self, max_age_hours: float = 24, limit: Optional[int] = None) -> List[Dict]:
+        """Get articles fetched within the last max_age_hours, most recently fetched first
+        
+        Ordered by fetch time rather than the free-form `published` string,
+        which mixes date formats and placeholders such as "Recent".
+        """
+        cutoff = time.time() - max_age_hours * 3600
+        query = ('SELECT title, link, summary, source, published FROM articles '
+                 'WHERE fetched_at >= ? ORDER BY fetched_at DESC, rowid DESC')
+        params: tuple = (cutoff,)
+        if limit is not None:
+            query += ' LIMIT ?'
+            params += (limit,)
+        
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+    
+    def prune(self, max_age_hours: float) -> int:
+        """Delete articles fetched more than max_age_hours ago; returns the number deleted"""
+        cutoff = time.time() - max_age_hours * 3600
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                deleted = self._conn.execute('DELETE FROM articles WHERE fetched_at < ?', (cutoff,)).rowcount
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            return deleted
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,89 @@
+"""
+Checkpoint Store Module
+
+Per-stage checkpoints of digest runs, so a failed run can continue from its
+last completed stage instead of fetching feeds and calling Gemini again.
+Each checkpoint is gzip-compressed compact JSON in a directory per run.
+"""
+
+import gzip
+import json
+import os
+import re
+import secrets
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional
+
+RUN_ID = re.compile(r'^\d{8}T\d{6}-[0-9a-f]{6}$')
+STAGE_NAME = re.compile(r'^[a-z_]+$')
+
+
+class CheckpointStore:
+    """Stage outputs of digest runs, one subdirectory per run ID"""
+    
+    def __init__(self, root: str, max_age_hours: float = 48.0):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_age_hours = max_age_hours
+    
+    @staticmethod
+    def new_run_id() -> str:
+        return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{secrets.token_hex(3)}"
+    
+    def _path(self, run_id: str, stage: str) -> Path:
+        if not RUN_ID.match(run_id) or not STAGE_NAME.match(stage):
+            raise ValueError(f"Invalid checkpoint {run_id}/{stage}")
+        return self.root / run_id / f"{stage}.json.gz"
+    
+    def save(self, run_id: str, stage: str, data: Any):
+        """Write a stage's output atomically"""
+        path = self._path(run_id, stage)
+        path.parent.mkdir(exist_ok=True)
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{stage}-", dir=path.parent)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(gzip.compress(payload, compresslevel=6, mtime=0))
+        os.replace(tmp_path, path)
+    
+    def load(self, run_id: str, stage: str) -> Optional[Any]:
+        """Read a stage's output, or None if the stage has not completed"""
+        path = self._path(run_id, stage)
+        try:
+            return json.loads(gzip.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            print(f"Ignoring unreadable checkpoint {run_id}/{stage}: {e}")
+            return None
+    
+    def list_runs(self) -> List[str]:
+        """List run IDs with checkpoints, newest first"""
+        return sorted((p.name for p in self.root.iterdir() if RUN_ID.match(p.name)), reverse=True)
+    
+    def latest_run(self) -> Optional[str]:
+        """Get the most recent run that has not finished"""
+        runs = self.list_runs()
+        return runs[0] if runs else None
+    
+    def discard(self, run_id: str):
+        """Delete all checkpoints of a run"""
+        if RUN_ID.match(run_id):
+            shutil.rmtree(self.root / run_id, ignore_errors=True)
+    
+    def cleanup(self) -> int:
+        """Delete runs not touched for max_age_hours; returns the number deleted"""
+        cutoff = time.time() - self.max_age_hours * 3600
+        removed = 0
+        for run_id in self.list_runs():
+            try:
+                if (self.root / run_id).stat().st_mtime < cutoff:
+                    self.discard(run_id)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
@@ -0,0 +1,188 @@
+"""
+Digest Archive Module
+
+Persists every sent digest with its articles and provides full-text search
+over the archived articles and digest subjects and summaries using SQLite FTS5.
+"""
+
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Union
+
+from .sqlite import connect
+
+DateLike = Union[datetime, str, None]
+
+QUERY_TERM = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def _to_timestamp(value: DateLike, end_of_day: bool = False) -> Optional[float]:
+    """Convert a datetime or YYYY-MM-DD string to an epoch timestamp"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.strptime(value, '%Y-%m-%d')
+        if end_of_day:
+            value += timedelta(days=1)
+    return value.timestamp()
+
+
+def build_match_query(query: str, phrase: bool = False) -> str:
+    """Build an FTS5 MATCH expression; quoted segments are matched as phrases"""
+    if phrase:
+        return '"' + query.replace('"', '""') + '"'
+    
+    terms = []
+    for quoted, word in QUERY_TERM.findall(query):
+        term = quoted or word
+        terms.append('"' + term.replace('"', '""') + '"')
+    return ' '.join(terms)
+
+
+class DigestArchive:
+    """Archive of past digests with a full-text search index"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn = connect(db_path)
+        self._lock = threading.Lock()
+        index_digests = not self._has_table('digests_fts')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS digests (
+                id INTEGER PRIMARY KEY,
+                created_at REAL NOT NULL,
+                subject TEXT NOT NULL DEFAULT '',
+                summary TEXT NOT NULL DEFAULT ''
+            );
+            CREATE TABLE IF NOT EXISTS archived_articles (
+                id INTEGER PRIMARY KEY,
+                digest_id INTEGER NOT NULL REFERENCES digests(id),
+                position INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                link TEXT NOT NULL,
+                summary TEXT NOT NULL DEFAULT '',
+                source TEXT NOT NULL DEFAULT '',
+                published TEXT NOT NULL DEFAULT '',
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_archived_articles_created_at ON archived_articles(created_at);
+            CREATE INDEX IF NOT EXISTS idx_archived_articles_digest ON archived_articles(digest_id);
+            CREATE VIRTUAL TABLE IF NOT EXISTS archived_articles_fts USING fts5(
+                title, summary, content='archived_articles', content_rowid='id',
+                tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS archived_articles_ai AFTER INSERT ON archived_articles BEGIN
+                INSERT INTO archived_articles_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+            END;
+            CREATE VIRTUAL TABLE IF NOT EXISTS digests_fts USING fts5(
+                subject, summary, content='digests', content_rowid='id',
+                tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS digests_ai AFTER INSERT ON digests BEGIN
+                INSERT INTO digests_fts(rowid, subject, summary) VALUES (new.id, new.subject, new.summary);
+            END;
+        """)
+        if index_digests:
+            # Archives created before digests were indexed
+            self._conn.execute("INSERT INTO digests_fts(digests_fts) VALUES ('rebuild')")
+    
+    def _has_table(self, name: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone() is not None
+    
+    def save_digest(self, articles: List[Dict], summary: str = "", subject: str = "",
+                    created_at: Optional[datetime] = None) -> int:
+        """Persist a digest and its articles; returns the digest ID"""
+        timestamp = (created_at or datetime.now()).timestamp()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                digest_id = self._conn.execute(
+                    'INSERT INTO digests (created_at, subject, summary) VALUES (?, ?, ?)',
+                    (timestamp, subject, summary)
+                ).lastrowid
+                self._conn.executemany(
+                    'INSERT INTO archived_articles '
+                    '(digest_id, position, title, link, summary, source, published, created_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    [
+                        (digest_id, i, art['title'], art['link'], art.get('summary', ''),
+                         art.get('source', ''), art.get('published', ''), timestamp)
+                        for i, art in enumerate(articles)
+                    ]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return digest_id
+    
+    def search(self, query: str, phrase: bool = False, since: DateLike = None,
+               until: DateLike = None, limit: int = 20) -> List[Dict]:
+        """Search archived articles and digest subjects and summaries, best matches first
+        
+        Results have `type` 'article' or 'digest'; digest results use the
+        subject as title and have no link. Dates may be datetimes or
+        YYYY-MM-DD strings; `until` dates are inclusive.
+        """
+        match = build_match_query(query, phrase)
+        if not match:
+            return []
+        
+        since_ts = _to_timestamp(since)
+        until_ts = _to_timestamp(until, end_of_day=True)
+        date_filter = ''
+        date_params: list = []
+        if since_ts is not None:
+            date_filter += ' AND {0}.created_at >= ?'
+            date_params.append(since_ts)
+        if until_ts is not None:
+            date_filter += ' AND {0}.created_at < ?'
+            date_params.append(until_ts)
+        
+        # bm25 ranks from both indexes are merged into one best-first list
+        sql = ("SELECT 'article' AS type, a.digest_id, a.title, a.link, a.summary, a.source, a.published, "
+               "a.created_at, snippet(archived_articles_fts, 1, '[', ']', '...', 16) AS snippet, "
+               'archived_articles_fts.rank AS score '
+               'FROM archived_articles_fts JOIN archived_articles a ON a.id = archived_articles_fts.rowid '
+               'WHERE archived_articles_fts MATCH ?' + date_filter.format('a') + ' '
+               "UNION ALL SELECT 'digest', d.id, d.subject, '', d.summary, '', '', d.created_at, "
+               "snippet(digests_fts, -1, '[', ']', '...', 16), digests_fts.rank "
+               'FROM digests_fts JOIN digests d ON d.id = digests_fts.rowid '
+               'WHERE digests_fts MATCH ?' + date_filter.format('d') + ' '
+               'ORDER BY score LIMIT ?')
+        params = [match, *date_params, match, *date_params, limit]
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        
+        results = []
+        for row in rows:
+            result = dict(row)
+            del result['score']
+            result['sent'] = datetime.fromtimestamp(result.pop('created_at')).strftime('%Y-%m-%d %H:%M')
+            results.append(result)
+        return results
+    
+    def get_digest(self, digest_id: int) -> Optional[Dict]:
+        """Get an archived digest with its articles"""
+        with self._lock:
+            digest = self._conn.execute(
+                'SELECT id, created_at, subject, summary FROM digests WHERE id = ?', (digest_id,)
+            ).fetchone()
+            if digest is None:
+                return None
+            articles = self._conn.execute(
+                'SELECT title, link, summary, source, published FROM archived_articles '
+                'WHERE digest_id = ? ORDER BY position', (digest_id,)
+            ).fetchall()
+        
+        result = dict(digest)
+        result['articles'] = [dict(article) for article in articles]
+        return result
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
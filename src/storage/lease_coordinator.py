@@ -0,0 +1,102 @@
+"""
+Lease Coordinator Module
+
+Partitions feed sources between ingest workers using leases in a shared
+SQLite database. Expired leases (e.g. from a crashed worker) are picked up
+again by the next worker that asks for work.
+"""
+
+import threading
+import time
+from typing import List, Dict, Tuple
+
+from .sqlite import connect
+
+
+class SourceLeaseCoordinator:
+    """Lease feed sources to worker processes with heartbeats and expiry"""
+    
+    def __init__(self, db_path: str, lease_ttl: float = 60.0, refresh_interval: float = 900.0):
+        self.db_path = db_path
+        self.lease_ttl = lease_ttl
+        self.refresh_interval = refresh_interval
+        self._conn = connect(db_path)
+        self._lock = threading.Lock()
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS source_leases (
+                source_name TEXT PRIMARY KEY,
+                feed_url TEXT NOT NULL,
+                lease_owner TEXT,
+                lease_expires REAL NOT NULL DEFAULT 0,
+                last_completed REAL NOT NULL DEFAULT 0
+            )
+        """)
+    
+    def _write(self, statements: List[Tuple[str, tuple]]) -> int:
+        """Run write statements in one IMMEDIATE transaction; returns rows changed"""
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            return self._conn.total_changes - before
+    
+    def register_sources(self, sources: Dict[str, str]):
+        """Add or update the sources to be partitioned"""
+        self._write([
+            ('INSERT INTO source_leases (source_name, feed_url) VALUES (?, ?) '
+             'ON CONFLICT(source_name) DO UPDATE SET feed_url = excluded.feed_url', (name, url))
+            for name, url in sources.items()
+        ])
+    
+    def acquire(self, worker_id: str, limit: int = 1) -> List[Tuple[str, str]]:
+        """Lease up to `limit` due sources that are not leased by a live worker"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = self._conn.execute(
+                    'SELECT source_name, feed_url FROM source_leases '
+                    'WHERE lease_expires < ? AND last_completed <= ? '
+                    'ORDER BY last_completed, source_name LIMIT ?',
+                    (now, now - self.refresh_interval, limit)
+                ).fetchall()
+                self._conn.executemany(
+                    'UPDATE source_leases SET lease_owner = ?, lease_expires = ? WHERE source_name = ?',
+                    [(worker_id, now + self.lease_ttl, row['source_name']) for row in rows]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return [(row['source_name'], row['feed_url']) for row in rows]
+    
+    def heartbeat(self, worker_id: str) -> int:
+        """Extend every lease held by the worker; returns the number extended"""
+        return self._write([
+            ('UPDATE source_leases SET lease_expires = ? WHERE lease_owner = ? AND lease_expires > 0',
+             (time.time() + self.lease_ttl, worker_id))
+        ])
+    
+    def complete(self, worker_id: str, source_name: str) -> bool:
+        """Mark a leased source as ingested and release it"""
+        return self._write([
+            ('UPDATE source_leases SET lease_owner = NULL, lease_expires = 0, last_completed = ? '
+             'WHERE source_name = ? AND lease_owner = ?', (time.time(), source_name, worker_id))
+        ]) > 0
+    
+    def release(self, worker_id: str, source_name: str) -> bool:
+        """Give a leased source back without marking it ingested"""
+        return self._write([
+            ('UPDATE source_leases SET lease_owner = NULL, lease_expires = 0 '
+             'WHERE source_name = ? AND lease_owner = ?', (source_name, worker_id))
+        ]) > 0
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,163 @@
+"""
+LLM Budget Module
+
+Rate limiting and daily budgets for LLM calls, kept in a shared SQLite
+database so every digest run and process draws from the same token bucket.
+Successful summaries are cached by prompt so repeated runs over the same
+articles do not spend the budget again.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Tuple
+
+from .sqlite import connect
+
+
+class LLMBudget:
+    """Cross-process token bucket with per-day request and token budgets
+    
+    Budgets are counted per UTC day. Token counts are estimates made before
+    each call and corrected afterwards with `adjust_tokens`.
+    """
+    
+    def __init__(self, db_path: str, requests_per_minute: float = 15.0, burst: int = 3,
+                 daily_requests: int = 1500, daily_tokens: int = 1_000_000,
+                 cache_ttl: float = 7 * 24 * 3600):
+        self.db_path = db_path
+        self.rate = requests_per_minute / 60.0
+        self.burst = burst
+        self.daily_requests = daily_requests
+        self.daily_tokens = daily_tokens
+        self.cache_ttl = cache_ttl
+        self._conn = connect(db_path)
+        self._lock = threading.Lock()
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS llm_bucket (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS llm_usage (
+                day TEXT PRIMARY KEY,
+                requests INTEGER NOT NULL DEFAULT 0,
+                tokens INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS llm_summary_cache (
+                prompt_key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                created REAL NOT NULL
+            );
+        """)
+    
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    
+    def _write(self, statements: List[Tuple[str, tuple]]):
+        """Run write statements in one IMMEDIATE transaction"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+    
+    def try_acquire(self, estimated_tokens: int) -> Optional[float]:
+        """Take one request from the bucket and charge the daily budget
+        
+        Returns 0 when granted, the seconds to wait before the bucket has a
+        request available, or None when today's budget is exhausted.
+        """
+        now = time.time()
+        day = self._today()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                usage = self._conn.execute(
+                    'SELECT requests, tokens FROM llm_usage WHERE day = ?', (day,)
+                ).fetchone()
+                requests, tokens = (usage['requests'], usage['tokens']) if usage else (0, 0)
+                if requests + 1 > self.daily_requests or tokens + estimated_tokens > self.daily_tokens:
+                    self._conn.execute('COMMIT')
+                    return None
+                
+                bucket = self._conn.execute(
+                    "SELECT tokens, updated FROM llm_bucket WHERE name = 'llm'"
+                ).fetchone()
+                available = self.burst if bucket is None else \
+                    min(self.burst, bucket['tokens'] + max(0.0, now - bucket['updated']) * self.rate)
+                if available < 1.0:
+                    self._conn.execute('COMMIT')
+                    return (1.0 - available) / self.rate
+                
+                self._conn.execute(
+                    "INSERT INTO llm_bucket (name, tokens, updated) VALUES ('llm', ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                    (available - 1.0, now)
+                )
+                self._conn.execute(
+                    'INSERT INTO llm_usage (day, requests, tokens) VALUES (?, 1, ?) '
+                    'ON CONFLICT(day) DO UPDATE SET requests = requests + 1, tokens = tokens + excluded.tokens',
+                    (day, estimated_tokens)
+                )
+                self._conn.execute('COMMIT')
+                return 0.0
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+    
+    def acquire(self, estimated_tokens: int, max_wait: float = 10.0) -> bool:
+        """Wait up to `max_wait` seconds for a request; False if over budget or the wait is too long"""
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait = self.try_acquire(estimated_tokens)
+            if wait == 0.0:
+                return True
+            if wait is None or time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+    
+    def adjust_tokens(self, delta: int):
+        """Correct today's token count once the real usage of a call is known"""
+        self._write([
+            ('INSERT INTO llm_usage (day, tokens) VALUES (?, ?) '
+             'ON CONFLICT(day) DO UPDATE SET tokens = MAX(0, tokens + excluded.tokens)',
+             (self._today(), delta))
+        ])
+    
+    def usage(self) -> Dict:
+        """Get today's request and token counts"""
+        day = self._today()
+        with self._lock:
+            row = self._conn.execute('SELECT requests, tokens FROM llm_usage WHERE day = ?', (day,)).fetchone()
+        return {'day': day, 'requests': row['requests'] if row else 0, 'tokens': row['tokens'] if row else 0}
+    
+    def cached_summary(self, prompt_key: str) -> Optional[str]:
+        """Get a summary generated earlier for the same prompt"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT summary FROM llm_summary_cache WHERE prompt_key = ? AND created > ?',
+                (prompt_key, time.time() - self.cache_ttl)
+            ).fetchone()
+        return row['summary'] if row else None
+    
+    def store_summary(self, prompt_key: str, summary: str):
+        """Cache a generated summary and drop expired ones"""
+        now = time.time()
+        # Usage rows are only needed for the current day; keep a month for inspection
+        oldest_day = datetime.fromtimestamp(now - 30 * 86400, timezone.utc).strftime('%Y-%m-%d')
+        self._write([
+            ('INSERT OR REPLACE INTO llm_summary_cache (prompt_key, summary, created) VALUES (?, ?, ?)',
+             (prompt_key, summary, now)),
+            ('DELETE FROM llm_summary_cache WHERE created <= ?', (now - self.cache_ttl,)),
+            ('DELETE FROM llm_usage WHERE day < ?', (oldest_day,)),
+        ])
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
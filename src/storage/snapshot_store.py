@@ -0,0 +1,103 @@
+"""
+Snapshot Store Module
+
+Immutable on-disk snapshots of generated digests, precomputed at generation
+time as JSON and HTML with gzip-compressed copies, for serving over HTTP.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional, NamedTuple
+
+SNAPSHOT_ID = re.compile(r'^\d{8}T\d{6}-[0-9a-f]{8}$')
+LATEST_POINTER = 'LATEST'
+
+FORMATS = {
+    'json': 'application/json; charset=utf-8',
+    'html': 'text/html; charset=utf-8',
+}
+
+
+class Representation(NamedTuple):
+    """One precomputed encoding of a snapshot"""
+    body: bytes
+    gzipped: bytes
+    content_type: str
+    etag: str
+
+
+class SnapshotStore:
+    """Write-once digest snapshots in a directory, one subdirectory per digest"""
+    
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def publish(self, articles: List[Dict], summary: str, html: str, subject: str = "",
+                created_at: Optional[datetime] = None) -> str:
+        """Write a new immutable snapshot and point LATEST at it; returns its ID"""
+        created_at = created_at or datetime.now()
+        document = {
+            'created_at': created_at.isoformat(timespec='seconds'),
+            'subject': subject,
+            'summary': summary,
+            'articles': articles,
+        }
+        payload = json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        snapshot_id = f"{created_at.strftime('%Y%m%dT%H%M%S')}-{hashlib.sha1(payload).hexdigest()[:8]}"
+        document = {'id': snapshot_id, **document}
+        
+        bodies = {
+            'json': json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+            'html': html.encode('utf-8'),
+        }
+        
+        # Build the snapshot in a temporary directory and rename it into place atomically
+        target = self.root / snapshot_id
+        if not target.exists():
+            staging = Path(tempfile.mkdtemp(prefix='.staging-', dir=self.root))
+            for fmt, body in bodies.items():
+                (staging / f"digest.{fmt}").write_bytes(body)
+                (staging / f"digest.{fmt}.gz").write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+            os.rename(staging, target)
+        
+        self._write_pointer(snapshot_id)
+        return snapshot_id
+    
+    def _write_pointer(self, snapshot_id: str):
+        fd, tmp_path = tempfile.mkstemp(prefix='.latest-', dir=self.root)
+        with os.fdopen(fd, 'w') as f:
+            f.write(snapshot_id)
+        os.replace(tmp_path, self.root / LATEST_POINTER)
+    
+    def latest_id(self) -> Optional[str]:
+        """Get the ID of the most recently published snapshot"""
+        try:
+            snapshot_id = (self.root / LATEST_POINTER).read_text().strip()
+        except FileNotFoundError:
+            return None
+        return snapshot_id if SNAPSHOT_ID.match(snapshot_id) else None
+    
+    def list_ids(self) -> List[str]:
+        """List snapshot IDs, newest first"""
+        return sorted((p.name for p in self.root.iterdir() if SNAPSHOT_ID.match(p.name)), reverse=True)
+    
+    def load(self, snapshot_id: str, fmt: str) -> Optional[Representation]:
+        """Load a precomputed representation of a snapshot"""
+        if not SNAPSHOT_ID.match(snapshot_id) or fmt not in FORMATS:
+            return None
+        
+        directory = self.root / snapshot_id
+        try:
+            body = (directory / f"digest.{fmt}").read_bytes()
+            gzipped = (directory / f"digest.{fmt}.gz").read_bytes()
+        except FileNotFoundError:
+            return None
+        
+        return Representation(body, gzipped, FORMATS[fmt], f'"{snapshot_id}-{fmt}"')
@@ -0,0 +1,21 @@
+"""
+SQLite Helpers Module
+
+Connection setup shared by the SQLite-backed stores.
+"""
+
+import sqlite3
+from pathlib import Path
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """Open a SQLite database safe to share between threads and processes"""
+    if db_path != ':memory:':
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    # Autocommit mode; callers open explicit transactions where they need atomicity
+    conn = sqlite3.connect(db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
@@ -5,9 +5,11 @@ Helper functions and utilities for the AI News Agent.
 """
 
 from .helpers import format_timestamp, clean_text, truncate_text
+from .profiling import RunProfiler
 
 __all__ = [
     "format_timestamp",
     "clean_text",
-    "truncate_text"
+    "truncate_text",
+    "RunProfiler"
 ] 
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Profiling Module
+
+CPU and memory profiling of digest runs, one profile per pipeline stage.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Optional
+
+
+class StackSampler:
+    """Sampling profiler producing folded stacks for flame graph tools"""
+    
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @staticmethod
+    def _fold(frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+            frame = frame.f_back
+        return ';'.join(reversed(stack))
+    
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.samples[self._fold(frame)] += 1
+    
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+    
+    def write_folded(self, path: Path):
+        """Write samples in the folded format read by flamegraph.pl and speedscope"""
+        with open(path, 'w') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RunProfiler:
+    """Collect cProfile stats and tracemalloc allocations per pipeline stage
+    
+    cProfile only covers the thread running the pipeline; enable sampling to
+    also see time spent in worker threads (e.g. delivery and content fetches).
+    """
+    
+    def __init__(self, output_dir: str, sample_interval: Optional[float] = None, top_n: int = 5):
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self.sampler = StackSampler(sample_interval) if sample_interval else None
+        self.stages: List[Dict] = []
+    
+    def start(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tracemalloc.start(10)
+        if self.sampler:
+            self.sampler.start()
+    
+    def stop(self):
+        if self.sampler:
+            self.sampler.stop()
+        tracemalloc.stop()
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Profile one pipeline stage"""
+        profile = cProfile.Profile()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            
+            profile.dump_stats(str(self.output_dir / f"{len(self.stages):02d}_{name}.prof"))
+            
+            allocations = after.compare_to(before, 'lineno')[:self.top_n]
+            with open(self.output_dir / f"{len(self.stages):02d}_{name}_alloc.txt", 'w') as f:
+                for stat in after.compare_to(before, 'traceback')[:self.top_n * 4]:
+                    f.write(f"{stat}\n")
+                    for line in stat.traceback.format():
+                        f.write(f"    {line}\n")
+            
+            self.stages.append({
+                'name': name,
+                'seconds': elapsed,
+                'peak_bytes': peak,
+                'stats': pstats.Stats(profile),
+                'allocations': allocations,
+            })
+    
+    def report(self) -> str:
+        """Build a short hot-spot report, also written to report.txt"""
+        lines = ["Stage timings:"]
+        total = sum(stage['seconds'] for stage in self.stages) or 1.0
+        for stage in self.stages:
+            lines.append(f"  {stage['name']:<12} {stage['seconds'] * 1000:9.1f} ms "
+                         f"({stage['seconds'] / total:5.1%})  peak {stage['peak_bytes'] / 1024:9.1f} KiB")
+        
+        for stage in self.stages:
+            lines.append(f"\n[{stage['name']}] top functions by cumulative time:")
+            stream = io.StringIO()
+            stage['stats'].stream = stream
+            stage['stats'].sort_stats('cumulative').print_stats(self.top_n)
+            body = stream.getvalue().splitlines()
+            header = next((i for i, line in enumerate(body) if line.lstrip().startswith('ncalls')), None)
+            if header is not None:
+                lines.extend(f"  {line}" for line in body[header:] if line.strip())
+            
+            lines.append(f"[{stage['name']}] top allocations:")
+            for stat in stage['allocations']:
+                lines.append(f"  {stat}")
+        
+        if self.sampler:
+            self.sampler.write_folded(self.output_dir / 'samples.folded')
+            lines.append(f"\nFolded stacks for flame graphs: {self.output_dir / 'samples.folded'}")
+        
+        report = "\n".join(lines)
+        (self.output_dir / 'report.txt').write_text(report)
+        return report
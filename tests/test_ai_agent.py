@@ -2,9 +2,16 @@
 Unit tests for the main AI agent module.
 """
 
+import asyncio
+import sqlite3
+from pathlib import Path
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from src.agent.ai_agent import AINewsAgent
+from src.storage.llm_budget import LLMBudget
+from src.storage.checkpoint_store import CheckpointStore
+from src.utils.profiling import RunProfiler
 
 
 class TestAINewsAgent:
@@ -19,6 +26,19 @@ class TestAINewsAgent:
             'email': 'test@gmail.com',
             'password': 'test_password'
         }
+        self.articles = [
+            {'title': 'Test Article', 'source': 'Test', 'published': '2023-12-01', 'summary': 'Test summary', 'link': 'http://test.com'}
+        ]
+    
+    def stub_digest_run(self, mock_news_searcher, mock_email_sender, mock_llm, articles=None, email_sent=True):
+        """Make the patched searcher return one test article, and stub email delivery and Gemini"""
+        mock_searcher_instance = mock_news_searcher.return_value
+        mock_searcher_instance.asearch_rss_feeds = AsyncMock(return_value=articles or self.articles)
+        mock_searcher_instance.asearch_google_news = AsyncMock(return_value=[])
+        mock_searcher_instance.is_similar_title.return_value = False
+        mock_email_sender.return_value.asend_email = AsyncMock(return_value=email_sent)
+        mock_llm.return_value.ainvoke = AsyncMock(return_value=Mock(content="Summary."))
+        return mock_searcher_instance
     
     @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
     @patch('src.agent.ai_agent.AINewsSearcher')
@@ -74,6 +94,27 @@ class TestAINewsAgent:
         assert 'https://example.com/1' in html
         assert 'https://example.com/2' in html
     
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_create_html_digest_sentiment_and_tags(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test sentiment labels and topic tags are rendered when present"""
+        agent = AINewsAgent(self.gemini_api_key, self.email_config)
+        articles = agent.tagger.annotate([
+            {
+                'title': 'OpenAI launches breakthrough GPT model',
+                'source': 'TechCrunch',
+                'published': '2023-12-01 10:00',
+                'summary': 'Researchers report impressive benchmark gains.',
+                'link': 'https://example.com/1'
+            }
+        ])
+        
+        html = agent._create_html_digest(articles)
+        
+        assert 'Sentiment: <span class="positive">positive</span>' in html
+        assert '<span class="tag">Research</span>' in html
+    
     @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
     @patch('src.agent.ai_agent.AINewsSearcher')
     @patch('src.agent.ai_agent.EmailSender')
@@ -107,19 +148,19 @@ class TestAINewsAgent:
         """Test successful digest generation and sending"""
         # Mock components
         mock_searcher_instance = mock_news_searcher.return_value
-        mock_searcher_instance.search_rss_feeds.return_value = [
+        mock_searcher_instance.asearch_rss_feeds = AsyncMock(return_value=[
             {'title': 'Test Article', 'source': 'Test', 'published': '2023-12-01', 'summary': 'Test summary', 'link': 'http://test.com'}
-        ]
-        mock_searcher_instance.search_google_news.return_value = []
+        ])
+        mock_searcher_instance.asearch_google_news = AsyncMock(return_value=[])
         mock_searcher_instance.is_similar_title.return_value = False
         
         mock_sender_instance = mock_email_sender.return_value
-        mock_sender_instance.send_email.return_value = True
+        mock_sender_instance.asend_email = AsyncMock(return_value=True)
         
         mock_llm_instance = mock_llm.return_value
         mock_response = Mock()
         mock_response.content = "This is an AI-generated summary."
-        mock_llm_instance.invoke.return_value = mock_response
+        mock_llm_instance.ainvoke = AsyncMock(return_value=mock_response)
         
         agent = AINewsAgent(self.gemini_api_key, self.email_config)
         
@@ -127,8 +168,8 @@ class TestAINewsAgent:
         agent.generate_and_send_digest("recipient@email.com")
         
         # Verify email was sent
-        mock_sender_instance.send_email.assert_called_once()
-        args = mock_sender_instance.send_email.call_args
+        mock_sender_instance.asend_email.assert_called_once()
+        args = mock_sender_instance.asend_email.call_args
         assert args[0][0] == "recipient@email.com"  # recipient
         assert "AI News Digest" in args[0][1]  # subject
         assert isinstance(args[0][2], str)  # HTML body
@@ -140,8 +181,8 @@ class TestAINewsAgent:
         """Test behavior when no articles are found"""
         # Mock empty results
         mock_searcher_instance = mock_news_searcher.return_value
-        mock_searcher_instance.search_rss_feeds.return_value = []
-        mock_searcher_instance.search_google_news.return_value = []
+        mock_searcher_instance.asearch_rss_feeds = AsyncMock(return_value=[])
+        mock_searcher_instance.asearch_google_news = AsyncMock(return_value=[])
         
         mock_sender_instance = mock_email_sender.return_value
         
@@ -151,4 +192,354 @@ class TestAINewsAgent:
         agent.generate_and_send_digest("recipient@email.com")
         
         # Verify no email was sent
-        mock_sender_instance.send_email.assert_not_called() 
\ No newline at end of file
+        mock_sender_instance.asend_email.assert_not_called()
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_summary_falls_back_to_extractive(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test that an LLM failure falls back to the extractive summary"""
+        mock_llm.return_value.ainvoke = AsyncMock(side_effect=Exception("Quota exceeded"))
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config)
+        articles = [
+            {'title': 'OpenAI releases new GPT model', 'summary': 'The model improves reasoning on benchmarks.'}
+        ]
+        
+        summary = asyncio.run(agent._agenerate_summary(articles))
+        
+        assert 'OpenAI releases new GPT model' in summary
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_summary_reuses_cached_summary(self, mock_email_sender, mock_news_searcher, mock_llm, tmp_path):
+        """Test a repeated prompt is answered from the summary cache"""
+        mock_llm.return_value.ainvoke = AsyncMock(return_value=Mock(content="Gemini summary."))
+        budget = LLMBudget(str(tmp_path / 'llm.db'))
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, llm_budget=budget)
+        articles = [
+            {'title': 'OpenAI releases new GPT model', 'summary': 'The model improves reasoning on benchmarks.'}
+        ]
+        
+        assert asyncio.run(agent._agenerate_summary(articles)) == "Gemini summary."
+        assert asyncio.run(agent._agenerate_summary(articles)) == "Gemini summary."
+        mock_llm.return_value.ainvoke.assert_called_once()
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_summary_over_budget_uses_extractive(self, mock_email_sender, mock_news_searcher, mock_llm, tmp_path):
+        """Test an exhausted budget degrades to the extractive summary without calling Gemini"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'), daily_requests=0)
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, llm_budget=budget)
+        articles = [
+            {'title': 'OpenAI releases new GPT model', 'summary': 'The model improves reasoning on benchmarks.'}
+        ]
+        
+        summary = asyncio.run(agent._agenerate_summary(articles))
+        
+        assert 'OpenAI releases new GPT model' in summary
+        mock_llm.return_value.ainvoke.assert_not_called()
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_summary_survives_summary_cache_errors(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test a locked summary cache is skipped instead of failing the digest"""
+        mock_llm.return_value.ainvoke = AsyncMock(return_value=Mock(content="Gemini summary."))
+        budget = Mock(spec=LLMBudget)
+        budget.try_acquire.return_value = 0.0
+        budget.cached_summary.side_effect = sqlite3.OperationalError("database is locked")
+        budget.store_summary.side_effect = sqlite3.OperationalError("database is locked")
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, llm_budget=budget)
+        articles = [
+            {'title': 'OpenAI releases new GPT model', 'summary': 'The model improves reasoning on benchmarks.'}
+        ]
+        
+        assert asyncio.run(agent._agenerate_summary(articles)) == "Gemini summary."
+        
+        # Without the budget the LLM is skipped and the extractive summary is used
+        budget.try_acquire.side_effect = sqlite3.OperationalError("database is locked")
+        summary = asyncio.run(agent._agenerate_summary(articles))
+        
+        assert 'OpenAI releases new GPT model' in summary
+        mock_llm.return_value.ainvoke.assert_called_once()
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_summary_extractive_mode(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test that extractive mode never calls the LLM"""
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, summary_mode="extractive")
+        articles = [
+            {'title': 'OpenAI releases new GPT model', 'summary': 'The model improves reasoning on benchmarks.'}
+        ]
+        
+        summary = asyncio.run(agent._agenerate_summary(articles))
+        
+        assert summary
+        mock_llm.return_value.ainvoke.assert_not_called()
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_fetch_articles_from_store(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test articles are read from the shared store when one is configured"""
+        mock_store = Mock()
+        mock_store.recent_articles.return_value = [
+            {'title': 'Stored Article', 'source': 'RSS', 'published': '2023-12-01', 'summary': 'Stored', 'link': 'http://stored.com'}
+        ]
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, article_store=mock_store)
+        articles = agent._fetch_articles()
+        
+        assert articles[0]['title'] == 'Stored Article'
+        mock_store.recent_articles.assert_called_once_with(max_age_hours=24, limit=50)
+        mock_news_searcher.return_value.asearch_rss_feeds.assert_not_called()
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_and_send_digest_archives(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test sent digests are persisted to the archive"""
+        self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm)
+        mock_archive = Mock()
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, digest_archive=mock_archive)
+        agent.generate_and_send_digest("recipient@email.com")
+        
+        mock_archive.save_digest.assert_called_once()
+        args, kwargs = mock_archive.save_digest.call_args
+        assert args[0][0]['title'] == 'Test Article'
+        assert kwargs['summary'] == "Summary."
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_and_send_digest_publishes_snapshot(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test the rendered digest is published as a snapshot"""
+        self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm, email_sent=False)
+        mock_snapshots = Mock()
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, snapshot_store=mock_snapshots)
+        agent.generate_and_send_digest("recipient@email.com")
+        
+        # Snapshots are published at generation time, independent of delivery
+        mock_snapshots.publish.assert_called_once()
+        args, kwargs = mock_snapshots.publish.call_args
+        assert args[1] == "Summary."
+        assert 'Test Article' in args[2]
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_generate_and_send_digest_profiled_stages(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test each pipeline stage is profiled when a profiler is attached"""
+        self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm)
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config)
+        stages = []
+        agent.profiler = Mock()
+        agent.profiler.stage.side_effect = lambda name: stages.append(name) or MagicMock()
+        
+        agent.generate_and_send_digest("recipient@email.com")
+        
+        assert stages == ['fetch', 'dedup', 'tag', 'summarize', 'render', 'publish', 'deliver', 'archive']
+    
+    @patch('src.agent.ai_agent.ArticleContentExtractor')
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_tagging_uses_enriched_content(self, mock_email_sender, mock_news_searcher, mock_llm, mock_extractor):
+        """Test articles are tagged after enrichment, from the full-article text"""
+        self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm)
+        mock_extractor.return_value.enrich_articles.side_effect = lambda articles: [
+            {**article, 'summary': 'The company faces a lawsuit after a data breach.'} for article in articles
+        ]
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, enrich_content=True)
+        stages = []
+        agent.profiler = Mock()
+        agent.profiler.stage.side_effect = lambda name: stages.append(name) or MagicMock()
+        
+        with patch.object(agent, '_create_html_digest', wraps=agent._create_html_digest) as render:
+            agent.generate_and_send_digest("recipient@email.com")
+        
+        assert stages[:4] == ['fetch', 'dedup', 'enrich', 'tag']
+        assert render.call_args[0][0][0]['sentiment_label'] == 'negative'
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_profiled_render_stage_covers_html(self, mock_email_sender, mock_news_searcher, mock_llm, tmp_path):
+        """Test HTML rendering is visible in the render stage's cProfile stats"""
+        self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm)
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, summary_mode='extractive')
+        agent.profiler = RunProfiler(str(tmp_path))
+        agent.profiler.start()
+        try:
+            agent.generate_and_send_digest("recipient@email.com")
+        finally:
+            agent.profiler.stop()
+        
+        render = next(stage for stage in agent.profiler.stages if stage['name'] == 'render')
+        assert '_create_html_digest' in {function for _, _, function in render['stats'].stats}
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_profiled_fetch_stage_covers_feed_parsing(self, mock_email_sender, mock_llm, tmp_path):
+        """Test feed parsing is visible in the fetch stage's cProfile stats"""
+        feed_xml = (Path(__file__).parent / 'fixtures' / 'ai_feed.xml').read_bytes()
+        mock_email_sender.return_value.asend_email = AsyncMock(return_value=True)
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, summary_mode='extractive')
+        agent.transport.afetch = AsyncMock(return_value=feed_xml)
+        agent.profiler = RunProfiler(str(tmp_path))
+        agent.profiler.start()
+        try:
+            agent.generate_and_send_digest("recipient@email.com")
+        finally:
+            agent.profiler.stop()
+        
+        fetch = next(stage for stage in agent.profiler.stages if stage['name'] == 'fetch')
+        assert any(function == 'parse' and path.endswith('feedparser/api.py')
+                   for path, _, function in fetch['stats'].stats)
+    
+    @pytest.mark.asyncio
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    async def test_agenerate_and_send_digest(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test the async API fetches RSS and Google News concurrently inside a running event loop"""
+        google_started = asyncio.Event()
+        
+        async def rss(max_articles):
+            # Only completes if Google News is fetched at the same time
+            await asyncio.wait_for(google_started.wait(), 1.0)
+            return [{'title': 'RSS Article', 'source': 'Test', 'published': '2023-12-01', 'summary': 'Test summary', 'link': 'http://rss.com'}]
+        
+        async def google(max_results):
+            google_started.set()
+            return [{'title': 'Google Story', 'source': 'Google News', 'published': 'Recent', 'summary': 'Other', 'link': 'http://google.com'}]
+        
+        mock_searcher_instance = mock_news_searcher.return_value
+        mock_searcher_instance.asearch_rss_feeds = rss
+        mock_searcher_instance.asearch_google_news = google
+        mock_searcher_instance.is_similar_title.return_value = False
+        mock_email_sender.return_value.asend_email = AsyncMock(return_value=True)
+        mock_llm.return_value.ainvoke = AsyncMock(return_value=Mock(content="Async summary."))
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config)
+        await agent.agenerate_and_send_digest("recipient@email.com")
+        
+        args = mock_email_sender.return_value.asend_email.call_args[0]
+        assert args[0] == "recipient@email.com"
+        assert 'Async summary.' in args[2]
+        assert 'RSS Article' in args[2] and 'Google Story' in args[2]
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_resume_after_failed_delivery(self, mock_email_sender, mock_news_searcher, mock_llm, tmp_path):
+        """Test a resumed run skips fetching and summarizing and cleans up after delivery"""
+        mock_searcher_instance = self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm)
+        mock_email_sender.return_value.asend_email = AsyncMock(side_effect=[False, True])
+        checkpoints = CheckpointStore(str(tmp_path))
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, checkpoint_store=checkpoints)
+        agent.generate_and_send_digest("recipient@email.com")
+        
+        run_id = checkpoints.latest_run()
+        assert checkpoints.load(run_id, 'summary') == "Summary."
+        assert checkpoints.load(run_id, 'deliver') == {'email': False, 'email_recipients': {'recipient@email.com': False}}
+        
+        agent.generate_and_send_digest("recipient@email.com", resume=True)
+        
+        mock_searcher_instance.asearch_rss_feeds.assert_called_once()
+        mock_llm.return_value.ainvoke.assert_called_once()
+        assert mock_email_sender.return_value.asend_email.call_count == 2
+        assert 'Summary.' in mock_email_sender.return_value.asend_email.call_args[0][2]
+        assert checkpoints.list_runs() == []
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_resume_only_failed_recipients(self, mock_email_sender, mock_news_searcher, mock_llm, tmp_path):
+        """Test a resumed run only emails the recipients that were refused"""
+        self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm)
+        mock_email_sender.return_value.asend_bulk = AsyncMock(return_value={'a@x.com': True, 'b@x.com': False})
+        checkpoints = CheckpointStore(str(tmp_path))
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, checkpoint_store=checkpoints)
+        agent.generate_and_send_digest(['a@x.com', 'b@x.com'])
+        
+        run_id = checkpoints.latest_run()
+        assert checkpoints.load(run_id, 'deliver')['email_recipients'] == {'a@x.com': True, 'b@x.com': False}
+        
+        agent.generate_and_send_digest(['a@x.com', 'b@x.com'], resume=True)
+        
+        mock_email_sender.return_value.asend_bulk.assert_called_once()
+        mock_email_sender.return_value.asend_email.assert_called_once()
+        assert mock_email_sender.return_value.asend_email.call_args[0][0] == 'b@x.com'
+        assert checkpoints.list_runs() == []
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_new_run_without_resume(self, mock_email_sender, mock_news_searcher, mock_llm, tmp_path):
+        """Test runs start fresh unless resume is requested"""
+        mock_searcher_instance = self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm, email_sent=False)
+        checkpoints = CheckpointStore(str(tmp_path))
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, checkpoint_store=checkpoints)
+        agent.generate_and_send_digest("recipient@email.com")
+        agent.generate_and_send_digest("recipient@email.com")
+        
+        assert mock_searcher_instance.asearch_rss_feeds.call_count == 2
+        assert len(checkpoints.list_runs()) == 2
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_reconfigure_keeps_transport(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test reconfiguring applies new settings without replacing pools or clients"""
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, sentiment_analysis=False)
+        transport, llm_client = agent.transport, agent.llm_client
+        
+        agent.reconfigure(max_articles=3, summary_mode='extractive', sentiment_analysis=True,
+                          delivery_config={'slack': ['https://hooks.slack.com/1']},
+                          llm_config={'timeout': 5.0})
+        
+        assert agent.max_articles == 3
+        assert agent.summary_mode == 'extractive'
+        assert agent.tagger is not None
+        assert [channel.name for channel in agent.channels] == ['slack']
+        assert agent.channels[0].session is transport.session
+        assert agent.transport is transport
+        assert agent.llm_client is llm_client and llm_client.timeout == 5.0
+    
+    @patch('src.agent.ai_agent.ChatGoogleGenerativeAI')
+    @patch('src.agent.ai_agent.AINewsSearcher')
+    @patch('src.agent.ai_agent.EmailSender')
+    def test_multiple_recipients_and_max_articles(self, mock_email_sender, mock_news_searcher, mock_llm):
+        """Test a recipient list is sent in one batch limited to max_articles"""
+        mock_searcher_instance = self.stub_digest_run(mock_news_searcher, mock_email_sender, mock_llm, articles=[
+            {'title': f'Article {i}', 'source': 'Test', 'published': '2023-12-01', 'summary': 'Summary', 'link': f'http://test.com/{i}'}
+            for i in range(5)
+        ])
+        mock_email_sender.return_value.asend_bulk = AsyncMock(
+            return_value={'a@email.com': True, 'b@email.com': True}
+        )
+        
+        agent = AINewsAgent(self.gemini_api_key, self.email_config, summary_mode='extractive', max_articles=2)
+        agent.generate_and_send_digest(('a@email.com', 'b@email.com'))
+        
+        mock_searcher_instance.asearch_rss_feeds.assert_called_once_with(max_articles=2)
+        recipients, subject, html = mock_email_sender.return_value.asend_bulk.call_args[0]
+        assert recipients == ['a@email.com', 'b@email.com']
+        assert 'Article 1' in html and 'Article 2' not in html
@@ -0,0 +1,66 @@
+"""
+Unit tests for the article store module.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from src.storage.article_store import ArticleStore
+
+
+class TestArticleStore:
+    """Test cases for ArticleStore class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.articles = [
+            {'title': 'Article 1', 'link': 'https://example.com/1', 'summary': 'One', 'source': 'a', 'published': '2023-12-01 10:00'},
+            {'title': 'Article 2', 'link': 'https://example.com/2', 'summary': 'Two', 'source': 'b', 'published': '2023-12-01 11:00'}
+        ]
+    
+    def test_add_articles_ignores_duplicates(self, tmp_path):
+        """Test articles already stored by link are not added again"""
+        store = ArticleStore(str(tmp_path / 'news.db'))
+        
+        assert store.add_articles(self.articles) == 2
+        assert store.add_articles(self.articles) == 0
+        assert len(store.recent_articles()) == 2
+    
+    def test_recent_articles_order_and_limit(self, tmp_path):
+        """Test recent articles are returned newest first"""
+        store = ArticleStore(str(tmp_path / 'news.db'))
+        store.add_articles(self.articles)
+        
+        recent = store.recent_articles(limit=1)
+        
+        assert len(recent) == 1
+        assert recent[0]['title'] == 'Article 2'
+        assert set(recent[0]) == {'title', 'link', 'summary', 'source', 'published'}
+    
+    def test_recent_articles_ordered_by_fetch_time(self, tmp_path):
+        """Test placeholder published values do not jump ahead of newer fetches"""
+        store = ArticleStore(str(tmp_path / 'news.db'))
+        with patch('src.storage.article_store.time.time', return_value=1_000_000.0):
+            store.add_articles([{**self.articles[0], 'published': 'Recent'}])
+        store.add_articles([self.articles[1]])
+        
+        assert [article['title'] for article in store.recent_articles(max_age_hours=1e6)] == ['Article 2', 'Article 1']
+    
+    def test_prune_deletes_old_articles(self, tmp_path):
+        """Test pruning removes only articles fetched before the retention window"""
+        store = ArticleStore(str(tmp_path / 'news.db'))
+        with patch('src.storage.article_store.time.time', return_value=1_000_000.0):
+            store.add_articles([self.articles[0]])
+        store.add_articles([self.articles[1]])
+        
+        assert store.prune(max_age_hours=24) == 1
+        assert [article['title'] for article in store.recent_articles(max_age_hours=1e6)] == ['Article 2']
+        # Pruned links can be stored again
+        assert store.add_articles([self.articles[0]]) == 1
+    
+    def test_recent_articles_max_age(self, tmp_path):
+        """Test old articles are excluded"""
+        store = ArticleStore(str(tmp_path / 'news.db'))
+        store.add_articles(self.articles)
+        
+        assert store.recent_articles(max_age_hours=-1) == []
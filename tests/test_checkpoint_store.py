@@ -0,0 +1,73 @@
+"""
+Unit tests for the checkpoint store module.
+"""
+
+import gzip
+import os
+import time
+
+import pytest
+from src.storage.checkpoint_store import CheckpointStore
+
+
+class TestCheckpointStore:
+    """Test cases for CheckpointStore class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.articles = [
+            {'title': 'OpenAI releases new model', 'link': 'https://example.com/1', 'summary': 'Résumé of the model'}
+        ]
+    
+    def test_save_and_load(self, tmp_path):
+        """Test stage outputs round-trip through compressed checkpoints"""
+        store = CheckpointStore(str(tmp_path))
+        run_id = store.new_run_id()
+        
+        store.save(run_id, 'fetch', self.articles)
+        
+        assert store.load(run_id, 'fetch') == self.articles
+        assert store.load(run_id, 'summary') is None
+        raw = (tmp_path / run_id / 'fetch.json.gz').read_bytes()
+        assert b'", "' not in gzip.decompress(raw)
+    
+    def test_latest_run_and_discard(self, tmp_path):
+        """Test the newest unfinished run is found and discarded runs disappear"""
+        store = CheckpointStore(str(tmp_path))
+        store.save('20240101T060000-aaaaaa', 'fetch', [])
+        store.save('20240102T060000-bbbbbb', 'fetch', [])
+        
+        assert store.latest_run() == '20240102T060000-bbbbbb'
+        
+        store.discard('20240102T060000-bbbbbb')
+        
+        assert store.list_runs() == ['20240101T060000-aaaaaa']
+    
+    def test_cleanup_removes_expired_runs(self, tmp_path):
+        """Test runs older than max_age_hours are deleted"""
+        store = CheckpointStore(str(tmp_path), max_age_hours=1)
+        store.save('20240101T060000-aaaaaa', 'fetch', [])
+        store.save('20240102T060000-bbbbbb', 'fetch', [])
+        old = time.time() - 2 * 3600
+        os.utime(tmp_path / '20240101T060000-aaaaaa', (old, old))
+        
+        assert store.cleanup() == 1
+        assert store.list_runs() == ['20240102T060000-bbbbbb']
+    
+    def test_corrupt_checkpoint_is_ignored(self, tmp_path):
+        """Test an unreadable checkpoint counts as a stage that has not completed"""
+        store = CheckpointStore(str(tmp_path))
+        run_id = store.new_run_id()
+        store.save(run_id, 'summary', 'Summary.')
+        (tmp_path / run_id / 'summary.json.gz').write_bytes(b'not gzip')
+        
+        assert store.load(run_id, 'summary') is None
+    
+    def test_invalid_names_rejected(self, tmp_path):
+        """Test run IDs and stage names cannot escape the checkpoint directory"""
+        store = CheckpointStore(str(tmp_path))
+        
+        with pytest.raises(ValueError):
+            store.save('../outside', 'fetch', [])
+        with pytest.raises(ValueError):
+            store.load(store.new_run_id(), '../fetch')
@@ -0,0 +1,142 @@
+"""
+Unit tests for the content extractor module.
+"""
+
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+from src.agent.content_extractor import ArticleContentExtractor
+
+
+ARTICLE_HTML = b"""
+<html>
+<head><script>var tracking = true;</script></head>
+<body>
+    <nav><p>Home | Tech | AI | Subscribe to our newsletter for more</p></nav>
+    <article>
+        <h1>OpenAI releases new model</h1>
+        <p>OpenAI has released a new language model with improved reasoning abilities.</p>
+        <p>The model is available to developers through the API starting today.</p>
+    </article>
+    <footer><p>Copyright notice and other links that should never be extracted</p></footer>
+</body>
+</html>
+"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves fixture pages and records request concurrency"""
+    
+    requests_seen = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+    
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests_seen.append(self.path)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            if self.path.startswith('/slow'):
+                time.sleep(0.1)
+            if self.path == '/large':
+                body = b'<html><body><p>' + b'x' * 100000 + b'</p></body></html>'
+            elif self.path == '/missing':
+                self.send_error(404)
+                return
+            else:
+                body = ARTICLE_HTML
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestArticleContentExtractor:
+    """Test cases for ArticleContentExtractor class"""
+    
+    @classmethod
+    def setup_class(cls):
+        """Start a local HTTP server serving fixture pages"""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+    
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        FixtureHandler.requests_seen = []
+        FixtureHandler.max_active = 0
+        self.extractor = ArticleContentExtractor(timeout=5.0)
+    
+    def test_extract_text(self):
+        """Test main text extraction skips boilerplate"""
+        text = self.extractor.extract_text(ARTICLE_HTML)
+        
+        assert 'improved reasoning abilities' in text
+        assert 'available to developers' in text
+        assert 'newsletter' not in text
+        assert 'Copyright' not in text
+        assert 'tracking' not in text
+    
+    def test_fetch_text_is_cached(self):
+        """Test repeated URLs are only fetched once"""
+        url = f"{self.base_url}/article"
+        
+        first = self.extractor.fetch_text(url)
+        second = self.extractor.fetch_text(url)
+        
+        assert first == second
+        assert 'improved reasoning' in first
+        assert FixtureHandler.requests_seen == ['/article']
+    
+    def test_fetch_text_byte_cap(self):
+        """Test page downloads stop at max_bytes"""
+        extractor = ArticleContentExtractor(max_bytes=1000)
+        text = extractor.fetch_text(f"{self.base_url}/large")
+        
+        assert 0 < len(text) <= 1000
+    
+    def test_fetch_text_error_handling(self):
+        """Test HTTP errors return empty text"""
+        assert self.extractor.fetch_text(f"{self.base_url}/missing") == ""
+    
+    def test_enrich_articles(self):
+        """Test summaries are replaced with extracted text"""
+        articles = [
+            {'title': 'Article', 'link': f"{self.base_url}/article", 'summary': 'Short...'},
+            {'title': 'Missing', 'link': f"{self.base_url}/missing", 'summary': 'Kept...'}
+        ]
+        
+        enriched = self.extractor.enrich_articles(articles, summary_length=60)
+        
+        assert enriched[0]['summary'].startswith('OpenAI has released')
+        assert len(enriched[0]['summary']) <= 63
+        assert enriched[1]['summary'] == 'Kept...'
+        # Input articles are not modified
+        assert articles[0]['summary'] == 'Short...'
+    
+    def test_per_host_limit(self):
+        """Test concurrent requests to one host respect per_host_limit"""
+        extractor = ArticleContentExtractor(max_workers=8, per_host_limit=2)
+        articles = [{'title': str(i), 'link': f"{self.base_url}/slow/{i}", 'summary': ''} for i in range(6)]
+        
+        extractor.enrich_articles(articles)
+        
+        assert len(FixtureHandler.requests_seen) == 6
+        assert FixtureHandler.max_active <= 2
@@ -0,0 +1,268 @@
+"""
+Unit tests for the delivery module.
+"""
+
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+from src.agent.delivery import (
+    TokenBucket, parse_retry_after, EmailChannel, WebhookChannel, SlackChannel,
+    DiscordChannel, DeliveryDispatcher, DeliveryChannel, build_channels
+)
+
+
+class WebhookStubHandler(BaseHTTPRequestHandler):
+    """Records posted webhook bodies; /limited answers 429 once"""
+    
+    posts = []
+    rate_limited = set()
+    lock = threading.Lock()
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        cls = type(self)
+        with cls.lock:
+            if self.path.startswith('/limited') and self.path not in cls.rate_limited:
+                cls.rate_limited.add(self.path)
+                self.send_response(429)
+                self.send_header('Retry-After', '1')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            cls.posts.append((self.path, time.monotonic(), json.loads(body)))
+        
+        status = 400 if self.path.startswith('/bad') else 204
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class"""
+    
+    def test_burst_then_rate(self):
+        """Test the bucket allows a burst and then refills at its rate"""
+        bucket = TokenBucket(rate=20.0, capacity=2)
+        
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+        
+        # Two tokens are immediate, the next two take 1/20 s each
+        assert 0.08 <= elapsed < 0.5
+    
+    def test_pause(self):
+        """Test pause blocks acquisition for the given time"""
+        bucket = TokenBucket(rate=100.0, capacity=5)
+        bucket.pause(0.2)
+        
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.19
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After in seconds, HTTP date and invalid forms"""
+        assert parse_retry_after('3') == 3.0
+        assert parse_retry_after(None, default=5.0) == 5.0
+        assert parse_retry_after('garbage', default=2.0) == 2.0
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+class TestWebhookChannels:
+    """Test cases for webhook channels against a local HTTP stub"""
+    
+    @classmethod
+    def setup_class(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), WebhookStubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+    
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        WebhookStubHandler.posts = []
+        WebhookStubHandler.rate_limited = set()
+        self.digest = {
+            'subject': 'AI News Digest',
+            'summary': 'AI summary.',
+            'html': '<html></html>',
+            'articles': [
+                {'title': f"Article {i}", 'link': f"https://example.com/{i}", 'summary': 'Summary', 'source': 'Test'}
+                for i in range(12)
+            ]
+        }
+    
+    def test_discord_batches_embeds(self):
+        """Test Discord messages are split into batches of 10 embeds"""
+        channel = DiscordChannel([f"{self.base_url}/discord"], rate=100, burst=10)
+        
+        assert channel.send(self.digest)
+        
+        bodies = [body for _, _, body in WebhookStubHandler.posts]
+        assert [len(body['embeds']) for body in bodies] == [10, 2]
+        assert 'AI summary.' in bodies[0]['content']
+        assert bodies[1]['content'] == ''
+    
+    def test_slack_payload(self):
+        """Test Slack messages use blocks"""
+        channel = SlackChannel([f"{self.base_url}/slack"], rate=100, burst=10)
+        
+        assert channel.send(self.digest)
+        
+        (_, _, body), = WebhookStubHandler.posts
+        assert body['text'] == 'AI News Digest'
+        assert body['blocks'][0]['type'] == 'header'
+        assert len(body['blocks']) == 14
+    
+    def test_slack_escapes_mrkdwn(self):
+        """Test Slack control characters in feed text cannot break links or ping the channel"""
+        channel = SlackChannel([f"{self.base_url}/slack"])
+        digest = {**self.digest, 'summary': 'R&D <!channel>', 'articles': [
+            {'title': 'Q&A: a <b> > c', 'link': 'https://example.com/?a=1&b=2', 'summary': '', 'source': '<!here>'}
+        ]}
+        
+        message = channel.render_message(digest, digest['articles'], first=True)
+        
+        assert message['blocks'][1]['text']['text'] == 'R&amp;D &lt;!channel&gt;'
+        assert message['blocks'][2]['text']['text'] == (
+            '*<https://example.com/?a=1&amp;b=2|Q&amp;A: a &lt;b&gt; &gt; c>*\n_&lt;!here&gt;_'
+        )
+    
+    def test_render_once_for_all_targets(self):
+        """Test the payload is rendered once and posted to every URL"""
+        urls = [f"{self.base_url}/hook/{i}" for i in range(3)]
+        channel = WebhookChannel(urls, rate=100, burst=10)
+        channel.render_message = Mock(wraps=channel.render_message)
+        
+        assert channel.send(self.digest)
+        
+        assert channel.render_message.call_count == 1
+        assert sorted(path for path, _, _ in WebhookStubHandler.posts) == sorted(f"/hook/{i}" for i in range(3))
+    
+    def test_retry_after_is_honored(self):
+        """Test a 429 pauses the channel for Retry-After before retrying"""
+        channel = WebhookChannel([f"{self.base_url}/limited"], rate=100, burst=10)
+        
+        start = time.monotonic()
+        assert channel.send(self.digest)
+        
+        (path, posted_at, _), = WebhookStubHandler.posts
+        assert posted_at - start >= 0.95
+    
+    def test_long_retry_after_gives_up(self):
+        """Test a Retry-After beyond max_retry_wait fails the channel instead of waiting"""
+        channel = WebhookChannel([f"{self.base_url}/limited"], rate=100, burst=10, max_retry_wait=0.5)
+        
+        start = time.monotonic()
+        assert not channel.send(self.digest)
+        
+        assert time.monotonic() - start < 0.5
+        assert WebhookStubHandler.posts == []
+    
+    def test_client_error_fails_without_retry(self):
+        """Test 4xx responses other than 429 are not retried"""
+        channel = WebhookChannel([f"{self.base_url}/bad"], rate=100, burst=10)
+        
+        assert not channel.send(self.digest)
+        assert len(WebhookStubHandler.posts) == 1
+    
+    def test_build_channels(self):
+        """Test channels are created only for configured URL lists"""
+        channels = build_channels({'slack': ['https://hooks.slack.com/x'], 'discord': [], 'webhook': ['https://a']})
+        
+        assert [channel.name for channel in channels] == ['slack', 'webhook']
+
+
+class TestDeliveryDispatcher:
+    """Test cases for DeliveryDispatcher class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.digest = {'subject': 'Subject', 'summary': 'Summary', 'html': '<html></html>', 'articles': []}
+    
+    def test_email_channel(self):
+        """Test the email channel sends the rendered HTML to all recipients in one batch"""
+        sender = Mock()
+        sender.send_bulk.return_value = {'a@example.com': True, 'b@example.com': True}
+        
+        results = DeliveryDispatcher([EmailChannel(sender, ['a@example.com', 'b@example.com'])]).dispatch(self.digest)
+        
+        assert results == {'email': True}
+        sender.send_bulk.assert_called_once_with(['a@example.com', 'b@example.com'], 'Subject', '<html></html>')
+        sender.send_email.assert_not_called()
+    
+    def test_email_channel_partial_failure(self):
+        """Test the email channel fails when any recipient was not delivered"""
+        sender = Mock()
+        sender.send_bulk.return_value = {'a@example.com': True, 'b@example.com': False}
+        
+        channel = EmailChannel(sender, ['a@example.com', 'b@example.com'])
+        results = DeliveryDispatcher([channel]).dispatch(self.digest)
+        
+        assert results == {'email': False}
+        assert channel.results == {'a@example.com': True, 'b@example.com': False}
+    
+    def test_slow_channel_does_not_delay_email(self):
+        """Test email delivery completes while a slow channel is still running"""
+        sent_at = {}
+        sender = Mock()
+        sender.send_email.side_effect = lambda *args: sent_at.setdefault('email', time.monotonic()) and True
+        
+        slow = Mock(spec=DeliveryChannel)
+        slow.name = 'slow'
+        slow.send.side_effect = lambda digest: time.sleep(0.5) or True
+        
+        start = time.monotonic()
+        results = DeliveryDispatcher([slow, EmailChannel(sender, ['a@example.com'])]).dispatch(self.digest)
+        
+        assert results == {'slow': True, 'email': True}
+        assert sent_at['email'] - start < 0.2
+        assert time.monotonic() - start >= 0.5
+    
+    def test_failing_channel_is_isolated(self):
+        """Test an exception in one channel does not affect the others"""
+        broken = Mock(spec=DeliveryChannel)
+        broken.name = 'broken'
+        broken.send.side_effect = Exception("Boom")
+        sender = Mock()
+        sender.send_email.return_value = True
+        
+        results = DeliveryDispatcher([broken, EmailChannel(sender, ['a@example.com'])]).dispatch(self.digest)
+        
+        assert results == {'broken': False, 'email': True}
+    
+    @pytest.mark.asyncio
+    async def test_adispatch(self):
+        """Test async dispatch sends email natively and runs blocking channels in threads"""
+        sender = Mock()
+        sender.asend_bulk = AsyncMock(return_value={'a@example.com': True, 'b@example.com': True})
+        
+        class BlockingChannel(DeliveryChannel):
+            name = 'blocking'
+            
+            def send(self, digest):
+                time.sleep(0.2)
+                return True
+        
+        broken = Mock(spec=DeliveryChannel)
+        broken.name = 'broken'
+        broken.asend = AsyncMock(side_effect=Exception("Boom"))
+        
+        channels = [BlockingChannel(), broken, EmailChannel(sender, ['a@example.com', 'b@example.com'])]
+        results = await DeliveryDispatcher(channels).adispatch(self.digest)
+        
+        assert results == {'blocking': True, 'broken': False, 'email': True}
+        sender.asend_bulk.assert_awaited_once_with(['a@example.com', 'b@example.com'], 'Subject', '<html></html>')
+        sender.send_bulk.assert_not_called()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the digest archive module.
+"""
+
+from datetime import datetime
+
+import pytest
+from src.storage.digest_archive import DigestArchive, build_match_query
+
+
+class TestDigestArchive:
+    """Test cases for DigestArchive class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.november_articles = [
+            {'title': 'OpenAI releases large language model', 'link': 'https://example.com/1',
+             'summary': 'The large language model improves reasoning.', 'source': 'techcrunch_ai', 'published': '2023-11-10 09:00'},
+            {'title': 'Robotics startup raises funding', 'link': 'https://example.com/2',
+             'summary': 'Warehouse robots get a language interface.', 'source': 'ai_news', 'published': '2023-11-10 10:00'}
+        ]
+        self.december_articles = [
+            {'title': 'Google updates Gemini language models', 'link': 'https://example.com/3',
+             'summary': 'Gemini models gain longer context.', 'source': 'Google News', 'published': '2023-12-05 08:00'}
+        ]
+    
+    def make_archive(self, tmp_path):
+        archive = DigestArchive(str(tmp_path / 'archive.db'))
+        archive.save_digest(self.november_articles, summary='November summary', subject='Nov digest',
+                            created_at=datetime(2023, 11, 10, 6, 0))
+        archive.save_digest(self.december_articles, summary='December summary', subject='Dec digest',
+                            created_at=datetime(2023, 12, 5, 6, 0))
+        return archive
+    
+    def test_search_terms(self, tmp_path):
+        """Test term search across titles and summaries with stemming"""
+        archive = self.make_archive(tmp_path)
+        
+        results = archive.search('language')
+        
+        assert {result['link'] for result in results} == {
+            'https://example.com/1', 'https://example.com/2', 'https://example.com/3'
+        }
+        assert results[0]['sent'] in ('2023-11-10 06:00', '2023-12-05 06:00')
+        assert '[' in results[0]['snippet']
+    
+    def test_search_phrase(self, tmp_path):
+        """Test phrase search only matches adjacent terms"""
+        archive = self.make_archive(tmp_path)
+        
+        assert [r['link'] for r in archive.search('large language model', phrase=True)] == ['https://example.com/1']
+        assert [r['link'] for r in archive.search('"language model" openai')] == ['https://example.com/1']
+        assert archive.search('model language', phrase=True) == []
+    
+    def test_search_date_range(self, tmp_path):
+        """Test since/until filters with inclusive end dates"""
+        archive = self.make_archive(tmp_path)
+        
+        assert [r['link'] for r in archive.search('language', since='2023-12-01')] == ['https://example.com/3']
+        assert len(archive.search('language', until='2023-11-10')) == 2
+        assert archive.search('language', since='2023-11-11', until='2023-12-04') == []
+    
+    def test_search_digest_summaries(self, tmp_path):
+        """Test digest subjects and summaries are searchable alongside articles"""
+        archive = self.make_archive(tmp_path)
+        
+        results = archive.search('december')
+        
+        assert [(r['type'], r['digest_id'], r['title']) for r in results] == [('digest', 2, 'Dec digest')]
+        assert results[0]['snippet'] == '[December] summary'
+        assert [r['title'] for r in archive.search('digest', until='2023-11-30')] == ['Nov digest']
+        assert {r['type'] for r in archive.search('language')} == {'article'}
+    
+    def test_existing_digests_indexed_on_open(self, tmp_path):
+        """Test digests archived before the summary index existed are indexed"""
+        archive = self.make_archive(tmp_path)
+        archive._conn.executescript('DROP TABLE digests_fts; DROP TRIGGER digests_ai;')
+        archive.close()
+        
+        reopened = DigestArchive(str(tmp_path / 'archive.db'))
+        
+        assert [r['digest_id'] for r in reopened.search('november')] == [1]
+    
+    def test_search_special_characters(self, tmp_path):
+        """Test FTS syntax characters in queries do not raise"""
+        archive = self.make_archive(tmp_path)
+        
+        assert archive.search('OR AND "unbalanced') == []
+        assert archive.search('') == []
+    
+    def test_get_digest(self, tmp_path):
+        """Test digests are returned with their articles in order"""
+        archive = self.make_archive(tmp_path)
+        
+        digest = archive.get_digest(1)
+        
+        assert digest['summary'] == 'November summary'
+        assert [article['link'] for article in digest['articles']] == ['https://example.com/1', 'https://example.com/2']
+        assert archive.get_digest(99) is None
+    
+    def test_build_match_query(self):
+        """Test query quoting"""
+        assert build_match_query('gpt model') == '"gpt" "model"'
+        assert build_match_query('"gpt model" openai') == '"gpt model" "openai"'
+        assert build_match_query('say "hi"', phrase=True) == '"say ""hi"""'
@@ -0,0 +1,93 @@
+"""
+Unit tests for the digest server module.
+"""
+
+import gzip
+import threading
+from datetime import datetime
+
+import pytest
+import requests
+from src.storage.snapshot_store import SnapshotStore
+from src.server.digest_server import DigestServer
+
+
+class TestDigestServer:
+    """Test cases for DigestServer class"""
+    
+    def setup_method(self):
+        """Start a server on a fresh snapshot store"""
+        self.articles = [
+            {'title': 'Test AI News', 'link': 'https://example.com/1', 'summary': 'Summary', 'source': 'Test', 'published': 'Recent'}
+        ]
+    
+    def start_server(self, tmp_path):
+        self.store = SnapshotStore(str(tmp_path))
+        self.server = DigestServer(self.store, port=0)
+        host, port = self.server.address
+        self.base_url = f"http://{host}:{port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def teardown_method(self):
+        if hasattr(self, 'server'):
+            self.server.shutdown()
+    
+    def test_no_digests_yet(self, tmp_path):
+        """Test latest returns 404 before anything is published"""
+        self.start_server(tmp_path)
+        
+        response = requests.get(f"{self.base_url}/digests/latest")
+        assert response.status_code == 404
+    
+    def test_latest_json_and_html(self, tmp_path):
+        """Test the latest digest is served as JSON and HTML"""
+        self.start_server(tmp_path)
+        snapshot_id = self.store.publish(self.articles, 'AI summary', '<html>digest</html>')
+        
+        response = requests.get(f"{self.base_url}/digests/latest.json")
+        assert response.status_code == 200
+        assert response.json()['id'] == snapshot_id
+        assert response.headers['Cache-Control'] == 'public, max-age=60'
+        
+        response = requests.get(f"{self.base_url}/")
+        assert response.text == '<html>digest</html>'
+        assert response.headers['Content-Type'].startswith('text/html')
+    
+    def test_gzip_and_etag(self, tmp_path):
+        """Test pre-gzipped bodies and conditional requests"""
+        self.start_server(tmp_path)
+        snapshot_id = self.store.publish(self.articles, 'AI summary', '<html>digest</html>')
+        url = f"{self.base_url}/digests/{snapshot_id}.html"
+        
+        response = requests.get(url, headers={'Accept-Encoding': 'gzip'}, stream=True)
+        raw = response.raw.read(decode_content=False)
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(raw) == b'<html>digest</html>'
+        assert 'immutable' in response.headers['Cache-Control']
+        
+        etag = response.headers['ETag']
+        response = requests.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.content == b''
+    
+    def test_index_updates_after_publish(self, tmp_path):
+        """Test the digest listing picks up new snapshots"""
+        self.start_server(tmp_path)
+        first = self.store.publish(self.articles, 'a', '<html/>', created_at=datetime(2023, 12, 1))
+        
+        index = requests.get(f"{self.base_url}/digests").json()
+        assert [digest['id'] for digest in index['digests']] == [first]
+        
+        second = self.store.publish(self.articles, 'b', '<html/>', created_at=datetime(2023, 12, 2))
+        index = requests.get(f"{self.base_url}/digests").json()
+        assert index['latest'] == second
+        assert [digest['id'] for digest in index['digests']] == [second, first]
+        assert index['digests'][0]['article_count'] == 1
+    
+    def test_unknown_paths(self, tmp_path):
+        """Test unknown routes and snapshots return 404"""
+        self.start_server(tmp_path)
+        
+        assert requests.get(f"{self.base_url}/digests/20231201T060000-deadbeef").status_code == 404
+        assert requests.get(f"{self.base_url}/digests/../secret").status_code == 404
+        assert requests.get(f"{self.base_url}/other").status_code == 404
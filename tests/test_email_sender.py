@@ -4,7 +4,9 @@ Unit tests for the email sender module.
 
 import pytest
 import smtplib
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+
+import aiosmtplib
 from src.agent.email_sender import EmailSender
 
 
@@ -111,4 +113,65 @@ class TestEmailSender:
         
         # Verify success
         assert result == True
-        mock_server.sendmail.assert_called_once() 
\ No newline at end of file
+        mock_server.sendmail.assert_called_once() 
+    
+    @patch('smtplib.SMTP')
+    def test_send_email_uses_prepared_message(self, mock_smtp):
+        """Test the message is sent as prepared bytes with 8BITMIME when the server supports it"""
+        mock_server = MagicMock()
+        mock_server.has_extn.return_value = True
+        mock_smtp.return_value = mock_server
+        
+        self.sender.send_email('recipient@example.com', 'Test Subject', '<html><body>Test</body></html>')
+        
+        args, kwargs = mock_server.sendmail.call_args
+        assert args[0] == 'test@gmail.com'
+        assert args[1] == 'recipient@example.com'
+        assert args[2].startswith(b'To: recipient@example.com\r\n')
+        assert b'Subject: Test Subject' in args[2]
+        assert kwargs['mail_options'] == ['BODY=8BITMIME']
+    
+    @patch('smtplib.SMTP')
+    def test_send_bulk_single_session(self, mock_smtp):
+        """Test bulk sending logs in once and reports each recipient"""
+        mock_server = MagicMock()
+        mock_server.sendmail.side_effect = [{}, smtplib.SMTPRecipientsRefused({'b@example.com': (550, b'No')}), {}]
+        mock_smtp.return_value = mock_server
+        
+        results = self.sender.send_bulk(['a@example.com', 'b@example.com', 'c@example.com'], 'Subject', '<p>Hi</p>')
+        
+        assert results == {'a@example.com': True, 'b@example.com': False, 'c@example.com': True}
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.sendmail.call_count == 3
+        mock_server.quit.assert_called_once()
+    
+    @pytest.mark.asyncio
+    @patch('aiosmtplib.SMTP')
+    async def test_asend_email_success(self, mock_smtp):
+        """Test async email sending with STARTTLS and login"""
+        mock_server = mock_smtp.return_value.__aenter__.return_value
+        mock_server.login = AsyncMock()
+        mock_server.sendmail = AsyncMock()
+        mock_server.supports_extension = Mock(return_value=False)
+        
+        result = await self.sender.asend_email('recipient@example.com', 'Test Subject', '<html><body>Test</body></html>')
+        
+        assert result == True
+        assert mock_smtp.call_args.kwargs == {'hostname': 'smtp.gmail.com', 'port': 587, 'start_tls': True}
+        mock_server.login.assert_awaited_once_with('test@gmail.com', 'test_password')
+        args, kwargs = mock_server.sendmail.call_args
+        assert args[1] == ['recipient@example.com']
+        assert args[2].startswith(b'To: recipient@example.com\r\n')
+        assert kwargs['mail_options'] == []
+    
+    @pytest.mark.asyncio
+    @patch('aiosmtplib.SMTP')
+    async def test_asend_email_auth_failure(self, mock_smtp):
+        """Test async email sending with authentication failure"""
+        mock_server = mock_smtp.return_value.__aenter__.return_value
+        mock_server.login = AsyncMock(side_effect=aiosmtplib.SMTPAuthenticationError(535, 'Authentication failed'))
+        
+        result = await self.sender.asend_email('recipient@example.com', 'Subject', 'Body')
+        
+        assert result == False
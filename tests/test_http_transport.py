@@ -0,0 +1,162 @@
+"""
+Unit tests for the HTTP transport module.
+"""
+
+import asyncio
+import gzip
+import threading
+from pathlib import Path
+from unittest.mock import patch
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import aiohttp
+import feedparser
+import pytest
+import requests
+from src.agent.http_transport import HTTPTransport
+from src.agent.news_searcher import AINewsSearcher
+
+
+FEED_XML = (Path(__file__).parent / 'fixtures' / 'ai_feed.xml').read_bytes()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serves fixture feeds over keep-alive connections"""
+    
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+    requests_seen = []
+    
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        type(self).requests_seen.append((self.path, dict(self.headers)))
+        
+        if self.path.startswith('/missing'):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        body = FEED_XML
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHTTPTransport:
+    """Test cases for HTTPTransport class"""
+    
+    @classmethod
+    def setup_class(cls):
+        """Start a local HTTP server serving fixture feeds"""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+    
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        FeedHandler.connections = set()
+        FeedHandler.requests_seen = []
+        self.transport = HTTPTransport(timeout=5.0, user_agent='TestAgent/1.0')
+    
+    def teardown_method(self):
+        self.transport.close()
+    
+    def test_fetch_decompresses_gzip(self):
+        """Test gzip is negotiated and bodies are returned decoded"""
+        body = self.transport.fetch(f"{self.base_url}/feed")
+        
+        assert body == FEED_XML
+        headers = FeedHandler.requests_seen[0][1]
+        assert 'gzip' in headers['Accept-Encoding']
+        assert headers['User-Agent'] == 'TestAgent/1.0'
+    
+    def test_connection_reuse(self):
+        """Test several feeds on one host share a single connection"""
+        for i in range(3):
+            self.transport.fetch(f"{self.base_url}/feed/{i}")
+        
+        assert len(FeedHandler.requests_seen) == 3
+        assert len(FeedHandler.connections) == 1
+    
+    def test_fetch_http_error(self):
+        """Test HTTP errors are raised"""
+        with pytest.raises(requests.HTTPError):
+            self.transport.fetch(f"{self.base_url}/missing")
+    
+    def test_searcher_parses_fixture_feeds(self):
+        """Test AINewsSearcher fetches and parses feeds through the transport"""
+        searcher = AINewsSearcher(transport=self.transport)
+        searcher.news_sources = {
+            'fixture_a': f"{self.base_url}/a",
+            'fixture_b': f"{self.base_url}/b",
+        }
+        
+        articles = searcher.search_rss_feeds(max_articles=4)
+        
+        assert len(articles) == 4
+        assert {article['source'] for article in articles} == {'fixture_a', 'fixture_b'}
+        assert articles[0]['title'] in ('OpenAI releases new reasoning model', 'Robotics startup raises Series B')
+        assert len(FeedHandler.connections) == 1
+    
+    @pytest.mark.asyncio
+    async def test_afetch_decompresses_gzip(self):
+        """Test async fetches negotiate gzip, share a connection and raise HTTP errors"""
+        bodies = await asyncio.gather(*(self.transport.afetch(f"{self.base_url}/feed/{i}") for i in range(2)))
+        bodies.append(await self.transport.afetch(f"{self.base_url}/feed/2"))
+        
+        assert bodies == [FEED_XML] * 3
+        headers = FeedHandler.requests_seen[0][1]
+        assert 'gzip' in headers['Accept-Encoding']
+        assert headers['User-Agent'] == 'TestAgent/1.0'
+        
+        with pytest.raises(aiohttp.ClientResponseError):
+            await self.transport.afetch(f"{self.base_url}/missing")
+        await self.transport.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_searcher_fetches_feeds_concurrently(self):
+        """Test the async searcher fetches all feeds through the async transport"""
+        searcher = AINewsSearcher(transport=self.transport)
+        searcher.news_sources = {
+            'fixture_a': f"{self.base_url}/a",
+            'fixture_b': f"{self.base_url}/b",
+            'broken': f"{self.base_url}/missing",
+        }
+        
+        articles = await searcher.asearch_rss_feeds(max_articles=6)
+        await self.transport.aclose()
+        
+        assert {article['source'] for article in articles} == {'fixture_a', 'fixture_b'}
+        assert {path for path, _ in FeedHandler.requests_seen} == {'/a', '/b', '/missing'}
+    
+    @pytest.mark.asyncio
+    async def test_async_feed_parsing_runs_off_the_event_loop(self):
+        """Test feeds fetched asynchronously are parsed in a worker thread"""
+        searcher = AINewsSearcher(transport=self.transport)
+        parse_threads = []
+        parse = feedparser.parse
+        
+        def recording_parse(body):
+            parse_threads.append(threading.get_ident())
+            return parse(body)
+        
+        with patch('src.agent.news_searcher.feedparser.parse', side_effect=recording_parse):
+            feed = await searcher._aparse_feed(f"{self.base_url}/a")
+        await self.transport.aclose()
+        
+        assert feed.entries
+        assert parse_threads and threading.get_ident() not in parse_threads
@@ -0,0 +1,98 @@
+"""
+Unit tests for the ingest worker module.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from src.agent.ingest_worker import IngestWorker
+from src.storage.article_store import ArticleStore
+from src.storage.lease_coordinator import SourceLeaseCoordinator
+
+
+def fake_fetch_source(source_name, feed_url, max_articles):
+    """Return one article per source, failing for the broken source"""
+    if source_name == 'broken':
+        raise Exception("Network error")
+    return [{'title': f"{source_name} article", 'link': f"{feed_url}/1", 'summary': '', 'source': source_name, 'published': 'Recent'}]
+
+
+class TestIngestWorker:
+    """Test cases for IngestWorker class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.sources = {f"source_{i}": f"https://example.com/{i}" for i in range(10)}
+        self.searcher = Mock()
+        self.searcher.fetch_source.side_effect = fake_fetch_source
+    
+    def make_worker(self, db_path, worker_id):
+        coordinator = SourceLeaseCoordinator(db_path, refresh_interval=3600)
+        return IngestWorker(self.searcher, coordinator, ArticleStore(db_path), worker_id=worker_id)
+    
+    def test_run_once_ingests_all_sources(self, tmp_path):
+        """Test a single worker ingests every due source into the store"""
+        db_path = str(tmp_path / 'news.db')
+        worker = self.make_worker(db_path, 'worker-a')
+        worker.coordinator.register_sources(self.sources)
+        
+        assert worker.run_once() == 10
+        assert len(worker.store.recent_articles()) == 10
+        # Nothing is due until the next refresh
+        assert worker.run_once() == 0
+    
+    def test_run_once_prunes_old_articles(self, tmp_path):
+        """Test each pass removes articles older than the retention window"""
+        db_path = str(tmp_path / 'news.db')
+        worker = self.make_worker(db_path, 'worker-a')
+        worker.coordinator.register_sources(self.sources)
+        worker.run_once()
+        
+        worker.retention_hours = -1
+        worker.run_once()
+        
+        assert worker.store.recent_articles(max_age_hours=1e6) == []
+    
+    def test_failed_source_does_not_stop_worker(self, tmp_path):
+        """Test fetch errors are contained to their source"""
+        db_path = str(tmp_path / 'news.db')
+        worker = self.make_worker(db_path, 'worker-a')
+        worker.coordinator.register_sources({**self.sources, 'broken': 'https://broken.example.com'})
+        
+        assert worker.run_once() == 10
+        assert worker.coordinator.acquire('worker-b', limit=20) == []
+    
+    def test_workers_share_sources(self, tmp_path):
+        """Test concurrent workers fetch each source exactly once"""
+        db_path = str(tmp_path / 'news.db')
+        workers = [self.make_worker(db_path, f"worker-{i}") for i in range(3)]
+        workers[0].coordinator.register_sources(self.sources)
+        
+        threads = [threading.Thread(target=worker.run_once) for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        fetched = [call.args[0] for call in self.searcher.fetch_source.call_args_list]
+        assert sorted(fetched) == sorted(self.sources)
+        assert len(workers[0].store.recent_articles()) == 10
+    
+    def test_stop_event_releases_leases(self, tmp_path):
+        """Test sources leased but not processed are released on stop"""
+        db_path = str(tmp_path / 'news.db')
+        worker = self.make_worker(db_path, 'worker-a')
+        worker.coordinator.register_sources(self.sources)
+        worker.batch_size = 5
+        stop_event = threading.Event()
+        
+        def fetch_then_stop(*args):
+            stop_event.set()
+            return fake_fetch_source(*args)
+        
+        self.searcher.fetch_source.side_effect = fetch_then_stop
+        worker.run_once(stop_event)
+        
+        assert self.searcher.fetch_source.call_count == 1
+        assert len(worker.coordinator.acquire('worker-b', limit=20)) == 9
@@ -0,0 +1,103 @@
+"""
+Unit tests for the lease coordinator module.
+"""
+
+import time
+import threading
+
+import pytest
+from src.storage.lease_coordinator import SourceLeaseCoordinator
+
+
+class TestSourceLeaseCoordinator:
+    """Test cases for SourceLeaseCoordinator class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.sources = {f"source_{i}": f"https://example.com/feed/{i}" for i in range(4)}
+    
+    def make_coordinator(self, tmp_path, **kwargs):
+        coordinator = SourceLeaseCoordinator(str(tmp_path / 'news.db'), **kwargs)
+        coordinator.register_sources(self.sources)
+        return coordinator
+    
+    def test_acquire_partitions_sources(self, tmp_path):
+        """Test two workers never lease the same source"""
+        coordinator = self.make_coordinator(tmp_path)
+        
+        first = coordinator.acquire('worker-a', limit=2)
+        second = coordinator.acquire('worker-b', limit=10)
+        
+        assert len(first) == 2
+        assert len(second) == 2
+        assert not set(first) & set(second)
+        assert coordinator.acquire('worker-c', limit=10) == []
+    
+    def test_completed_sources_wait_for_refresh(self, tmp_path):
+        """Test completed sources are not leased again before refresh_interval"""
+        coordinator = self.make_coordinator(tmp_path, refresh_interval=3600)
+        
+        for name, _ in coordinator.acquire('worker-a', limit=10):
+            assert coordinator.complete('worker-a', name)
+        
+        assert coordinator.acquire('worker-b', limit=10) == []
+    
+    def test_expired_lease_is_reacquired(self, tmp_path):
+        """Test sources leased by a crashed worker are picked up after expiry"""
+        coordinator = self.make_coordinator(tmp_path, lease_ttl=0.05)
+        
+        leased = coordinator.acquire('crashed-worker', limit=10)
+        assert coordinator.acquire('worker-b', limit=10) == []
+        
+        time.sleep(0.1)
+        assert sorted(coordinator.acquire('worker-b', limit=10)) == sorted(leased)
+        # The crashed worker no longer owns its leases
+        assert not coordinator.complete('crashed-worker', leased[0][0])
+    
+    def test_heartbeat_extends_lease(self, tmp_path):
+        """Test heartbeats keep leases from expiring"""
+        coordinator = self.make_coordinator(tmp_path, lease_ttl=0.2)
+        
+        coordinator.acquire('worker-a', limit=10)
+        for _ in range(3):
+            time.sleep(0.1)
+            assert coordinator.heartbeat('worker-a') == len(self.sources)
+        
+        assert coordinator.acquire('worker-b', limit=10) == []
+    
+    def test_release_returns_source(self, tmp_path):
+        """Test released sources can be leased again immediately"""
+        coordinator = self.make_coordinator(tmp_path, refresh_interval=3600)
+        
+        (name, url), = coordinator.acquire('worker-a', limit=1)
+        assert coordinator.release('worker-a', name)
+        
+        assert (name, url) in coordinator.acquire('worker-b', limit=10)
+    
+    def test_concurrent_acquire_across_connections(self, tmp_path):
+        """Test concurrent workers with separate connections split the sources"""
+        db_path = str(tmp_path / 'news.db')
+        SourceLeaseCoordinator(db_path).register_sources(
+            {f"source_{i}": f"https://example.com/{i}" for i in range(50)}
+        )
+        results = {}
+        
+        def worker(worker_id):
+            coordinator = SourceLeaseCoordinator(db_path)
+            leased = []
+            while True:
+                batch = coordinator.acquire(worker_id, limit=3)
+                if not batch:
+                    break
+                leased.extend(batch)
+            results[worker_id] = leased
+        
+        threads = [threading.Thread(target=worker, args=(f"worker-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        all_leased = [source for leased in results.values() for source in leased]
+        assert len(all_leased) == 50
+        assert len(set(all_leased)) == 50
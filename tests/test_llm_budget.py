@@ -0,0 +1,71 @@
+"""
+Unit tests for the LLM budget module.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from src.storage.llm_budget import LLMBudget
+
+
+class TestLLMBudget:
+    """Test cases for LLMBudget class"""
+    
+    def test_bucket_allows_burst_then_waits(self, tmp_path):
+        """Test the bucket hands out `burst` requests and then asks callers to wait"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'), requests_per_minute=60, burst=2)
+        
+        assert budget.try_acquire(10) == 0.0
+        assert budget.try_acquire(10) == 0.0
+        wait = budget.try_acquire(10)
+        assert 0 < wait <= 1.0
+    
+    def test_bucket_shared_between_instances(self, tmp_path):
+        """Test separate connections (as in separate processes) share one bucket"""
+        first = LLMBudget(str(tmp_path / 'llm.db'), requests_per_minute=1, burst=1)
+        second = LLMBudget(str(tmp_path / 'llm.db'), requests_per_minute=1, burst=1)
+        
+        assert first.acquire(10, max_wait=0)
+        assert not second.acquire(10, max_wait=0)
+    
+    def test_daily_request_budget(self, tmp_path):
+        """Test requests are refused once the daily request budget is used"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'), requests_per_minute=6000, burst=10, daily_requests=2)
+        
+        assert budget.acquire(10)
+        assert budget.acquire(10)
+        assert budget.try_acquire(10) is None
+        assert budget.usage()['requests'] == 2
+    
+    def test_daily_token_budget(self, tmp_path):
+        """Test requests are refused when the estimate would exceed the token budget"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'), burst=10, daily_tokens=1000)
+        
+        assert budget.acquire(600)
+        assert budget.try_acquire(600) is None
+        
+        # Correcting an overestimate frees budget again
+        budget.adjust_tokens(-300)
+        assert budget.usage()['tokens'] == 300
+        assert budget.acquire(600)
+    
+    def test_acquire_waits_for_refill(self, tmp_path):
+        """Test acquire sleeps until the bucket refills when the wait is short enough"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'), requests_per_minute=600, burst=1)
+        assert budget.acquire(10)
+        
+        start = time.monotonic()
+        assert budget.acquire(10, max_wait=1.0)
+        assert time.monotonic() - start >= 0.05
+    
+    def test_summary_cache(self, tmp_path):
+        """Test summaries are cached by prompt key and expire"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'), cache_ttl=60)
+        budget.store_summary('key', 'Cached summary.')
+        
+        assert budget.cached_summary('key') == 'Cached summary.'
+        assert budget.cached_summary('other') is None
+        
+        with patch('src.storage.llm_budget.time.time', return_value=time.time() + 120):
+            assert budget.cached_summary('key') is None
@@ -0,0 +1,108 @@
+"""
+Unit tests for the LLM client module.
+"""
+
+import asyncio
+import sqlite3
+import time
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+from src.agent.llm_client import GuardedLLM, estimate_tokens
+from src.storage.llm_budget import LLMBudget
+
+
+class TestGuardedLLM:
+    """Test cases for GuardedLLM class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.llm = Mock()
+        self.llm.ainvoke = AsyncMock(return_value=Mock(content="A summary."))
+    
+    @pytest.mark.asyncio
+    async def test_ainvoke_returns_content(self):
+        """Test a call returns the reply text"""
+        client = GuardedLLM(self.llm)
+        
+        assert await client.ainvoke("Summarize this") == "A summary."
+        self.llm.ainvoke.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_ainvoke_returns_none_on_error(self):
+        """Test failures are reported as None"""
+        self.llm.ainvoke = AsyncMock(side_effect=Exception("Quota exceeded"))
+        client = GuardedLLM(self.llm)
+        
+        assert await client.ainvoke("Summarize this") is None
+    
+    @pytest.mark.asyncio
+    async def test_ainvoke_skips_when_budget_exhausted(self, tmp_path):
+        """Test no call is made when the daily budget is used up"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'), daily_requests=0)
+        client = GuardedLLM(self.llm, budget=budget)
+        
+        assert await client.ainvoke("Summarize this") is None
+        self.llm.ainvoke.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_ainvoke_budget_errors(self):
+        """Test a locked budget database skips the call but keeps a reply already received"""
+        budget = Mock(spec=LLMBudget)
+        budget.try_acquire.return_value = 0.0
+        budget.adjust_tokens.side_effect = sqlite3.OperationalError("database is locked")
+        client = GuardedLLM(self.llm, budget=budget)
+        
+        assert await client.ainvoke("Summarize this") == "A summary."
+        
+        budget.try_acquire.side_effect = sqlite3.OperationalError("database is locked")
+        assert await client.ainvoke("Summarize this") is None
+        self.llm.ainvoke.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_ainvoke_records_token_usage(self, tmp_path):
+        """Test token usage is corrected to the estimate of prompt plus reply"""
+        budget = LLMBudget(str(tmp_path / 'llm.db'))
+        client = GuardedLLM(self.llm, budget=budget)
+        
+        await client.ainvoke("Summarize this")
+        
+        assert budget.usage() == {
+            'day': budget.usage()['day'],
+            'requests': 1,
+            'tokens': estimate_tokens("Summarize this") + estimate_tokens("A summary.")
+        }
+    
+    @pytest.mark.asyncio
+    async def test_ainvoke_times_out_and_cancels(self):
+        """Test slow async calls are cancelled after the timeout"""
+        cancelled = asyncio.Event()
+        
+        async def slow(messages):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        self.llm.ainvoke = slow
+        client = GuardedLLM(self.llm, timeout=0.1)
+        
+        assert await client.ainvoke("Summarize this") is None
+        await asyncio.wait_for(cancelled.wait(), 1.0)
+    
+    @pytest.mark.asyncio
+    async def test_ahedged_request_wins(self):
+        """Test the async hedged request answers when the first is slow"""
+        calls = []
+        
+        async def invoke(messages):
+            calls.append(time.monotonic())
+            await asyncio.sleep(5 if len(calls) == 1 else 0)
+            return Mock(content="slow" if len(calls) == 1 else "fast")
+        
+        self.llm.ainvoke = invoke
+        client = GuardedLLM(self.llm, timeout=3.0, hedge_after=0.05)
+        
+        assert await client.ainvoke("Summarize this") == "fast"
+        assert len(calls) == 2
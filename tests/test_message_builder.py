@@ -0,0 +1,132 @@
+"""
+Unit tests for the message builder module.
+"""
+
+from email import message_from_bytes
+from email.policy import default
+
+from src.agent.message_builder import (
+    minify_css, minify_html, fold_markup, html_to_text, build_message, MAX_LINE_LENGTH
+)
+
+
+HTML = """
+        <html>
+        <head>
+            <style>
+                /* digest styles */
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .title { font-size: 18px; color: #2c3e50; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>AI News Daily Digest</h1>
+                <div class="summary" style="margin-top: 15px; font-style: italic;">Models got faster.</div>
+            </div>
+            <div class="article">
+                <div class="title">1. Model launch</div>
+                <div class="meta">Source: Test Source <span class="tag">LLMs</span></div>
+                <div class="summary"><p>A long article summary.</p></div>
+                <p><a href="https://example.com/1" class="link">Read full article →</a></p>
+            </div>
+            <div class="footer"><p>Generated by your AI News Agent</p></div>
+        </body>
+        </html>
+        """
+
+
+class TestMessageBuilder:
+    """Test cases for the message builder"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        build_message.cache_clear()
+    
+    def test_minify_css(self):
+        """Test comments and whitespace are stripped from stylesheets"""
+        css = "/* x */ body { margin: 20px; }\n  .a > .b { color: red; }"
+        assert minify_css(css) == "body{margin:20px}.a>.b{color:red}"
+    
+    def test_minify_html(self):
+        """Test layout whitespace is removed and styles and class attributes are minified"""
+        compact = minify_html(HTML)
+        
+        assert compact.startswith('<html><head><style>body{font-family:Arial,sans-serif;margin:20px}')
+        assert '\n' not in compact
+        assert '/*' not in compact
+        assert '<div class=title>1. Model launch</div>' in compact
+        assert 'style="margin-top:15px;font-style:italic;"' in compact
+        assert '<a href="https://example.com/1" class=link>' in compact
+    
+    def test_fold_markup(self):
+        """Test long markup is broken into short lines only between tags"""
+        html = '<p>' + '</p><p>'.join('x' * 300 for _ in range(10)) + '</p>'
+        folded = fold_markup(html)
+        
+        assert folded.replace('\n', '') == html
+        assert all(len(line) <= MAX_LINE_LENGTH and line.startswith('<') for line in folded.splitlines())
+    
+    def test_html_to_text(self):
+        """Test the text alternative keeps headings, summary, titles and links only"""
+        text = html_to_text(HTML)
+        
+        assert text.splitlines() == [
+            'AI News Daily Digest',
+            'Models got faster.',
+            '1. Model launch',
+            'https://example.com/1',
+        ]
+    
+    def test_build_message_structure(self):
+        """Test the message is multipart/alternative with text and HTML parts"""
+        prepared = build_message('sender@example.com', 'Digest', HTML)
+        msg = message_from_bytes(prepared.for_recipient('to@example.com'), policy=default)
+        
+        assert msg['To'] == 'to@example.com'
+        assert msg['From'] == 'sender@example.com'
+        assert msg['Subject'] == 'Digest'
+        assert msg.get_content_type() == 'multipart/alternative'
+        assert [part.get_content_type() for part in msg.iter_parts()] == ['text/plain', 'text/html']
+        assert msg.get_body(('plain',)).get_content().splitlines()[-2:] == ['1. Model launch', 'https://example.com/1']
+        assert msg.get_body(('html',)).get_content().splitlines() == minify_html(HTML).splitlines()
+    
+    def test_build_message_smaller_than_source(self):
+        """Test the encoded message is smaller than the unminified HTML plus the text part"""
+        prepared = build_message('sender@example.com', 'Digest', HTML * 20)
+        assert len(prepared) < len((HTML * 20).encode('utf-8'))
+    
+    def test_build_message_cached(self):
+        """Test the same digest is only built once"""
+        first = build_message('sender@example.com', 'Digest', HTML)
+        second = build_message('sender@example.com', 'Digest', HTML)
+        
+        assert first is second
+        assert build_message.cache_info().hits == 1
+    
+    def test_eight_bit_and_fallback(self):
+        """Test 8bit bodies when allowed and quoted-printable otherwise"""
+        eight_bit = build_message('sender@example.com', 'Digest', HTML)
+        seven_bit = build_message('sender@example.com', 'Digest', HTML, allow_8bit=False)
+        
+        assert eight_bit.mail_options == ['BODY=8BITMIME']
+        assert b'Content-Transfer-Encoding: 8bit' in eight_bit.body
+        assert seven_bit.mail_options == []
+        assert b'Content-Transfer-Encoding: quoted-printable' in seven_bit.body
+        assert max(seven_bit.body) < 128
+    
+    def test_long_lines_fall_back_to_quoted_printable(self):
+        """Test lines over the SMTP limit are never sent as 8bit"""
+        prepared = build_message('sender@example.com', 'Digest', f"<p>{'x' * (MAX_LINE_LENGTH + 1)}</p>")
+        
+        assert not prepared.eight_bit
+        assert all(len(line) <= MAX_LINE_LENGTH for line in prepared.body.split(b'\r\n'))
+    
+    def test_for_recipient(self):
+        """Test each recipient only changes the To header"""
+        prepared = build_message('sender@example.com', 'Digest', HTML)
+        a = prepared.for_recipient('a@example.com')
+        b = prepared.for_recipient('b@example.com')
+        
+        assert a.startswith(b'To: a@example.com\r\n')
+        assert a.split(b'\r\n', 1)[1] == b.split(b'\r\n', 1)[1]
@@ -12,7 +12,9 @@ class TestAINewsSearcher:
     
     def setup_method(self):
         """Set up test fixtures"""
-        self.searcher = AINewsSearcher()
+        self.transport = Mock()
+        self.transport.fetch.return_value = b''
+        self.searcher = AINewsSearcher(transport=self.transport)
     
     def test_init(self):
         """Test initialization of AINewsSearcher"""
@@ -51,7 +53,8 @@ class TestAINewsSearcher:
         
         # Verify results
         assert isinstance(articles, list)
-        # Should have called parse for each news source
+        # Should have fetched and parsed each news source
+        assert self.transport.fetch.call_count == len(self.searcher.news_sources)
         assert mock_parse.call_count == len(self.searcher.news_sources)
     
     @patch('feedparser.parse')
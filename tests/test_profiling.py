@@ -0,0 +1,72 @@
+"""
+Unit tests for the profiling module.
+"""
+
+import time
+
+import pytest
+from src.utils.profiling import RunProfiler
+
+
+def busy_work():
+    """Allocate and compute something measurable"""
+    data = [str(i) * 10 for i in range(20000)]
+    return sorted(data)
+
+
+class TestRunProfiler:
+    """Test cases for RunProfiler class"""
+    
+    def test_stage_artifacts_and_report(self, tmp_path):
+        """Test each stage writes stats and allocations and appears in the report"""
+        profiler = RunProfiler(str(tmp_path / 'run'))
+        profiler.start()
+        try:
+            with profiler.stage('fetch'):
+                busy_work()
+            with profiler.stage('render'):
+                time.sleep(0.01)
+        finally:
+            profiler.stop()
+        
+        report = profiler.report()
+        
+        assert [stage['name'] for stage in profiler.stages] == ['fetch', 'render']
+        assert (tmp_path / 'run' / '00_fetch.prof').exists()
+        assert (tmp_path / 'run' / '01_render_alloc.txt').exists()
+        assert (tmp_path / 'run' / 'report.txt').read_text() == report
+        assert 'busy_work' in report
+        assert profiler.stages[0]['peak_bytes'] > 0
+        assert profiler.stages[1]['seconds'] >= 0.01
+    
+    def test_stage_records_on_exception(self, tmp_path):
+        """Test a failing stage is still recorded"""
+        profiler = RunProfiler(str(tmp_path))
+        profiler.start()
+        try:
+            with pytest.raises(ValueError):
+                with profiler.stage('summarize'):
+                    raise ValueError("LLM failure")
+        finally:
+            profiler.stop()
+        
+        assert profiler.stages[0]['name'] == 'summarize'
+    
+    def test_flamegraph_samples(self, tmp_path):
+        """Test sampling writes folded stacks"""
+        profiler = RunProfiler(str(tmp_path), sample_interval=0.001)
+        profiler.start()
+        try:
+            with profiler.stage('dedup'):
+                deadline = time.perf_counter() + 0.1
+                while time.perf_counter() < deadline:
+                    busy_work()
+        finally:
+            profiler.stop()
+        profiler.report()
+        
+        folded = (tmp_path / 'samples.folded').read_text().splitlines()
+        assert folded
+        assert any('busy_work' in line for line in folded)
+        stack, count = folded[0].rsplit(' ', 1)
+        assert int(count) > 0
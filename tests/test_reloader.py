@@ -0,0 +1,109 @@
+"""
+Unit tests for the settings reloader module.
+"""
+
+import os
+import signal
+
+import pytest
+from src.config import settings as settings_module
+from src.config.settings import load_settings, get_settings, replace_settings
+from src.config.reloader import SettingsReloader, changed_settings
+
+ENVIRON = {
+    'GEMINI_API_KEY': 'key',
+    'SENDER_EMAIL': 'sender@example.com',
+    'EMAIL_PASSWORD': 'secret',
+    'RECIPIENT_EMAIL': 'a@example.com'
+}
+
+
+class TestSettingsReloader:
+    """Test cases for SettingsReloader class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.changes = []
+        self.previous_settings = settings_module._current
+    
+    def teardown_method(self):
+        """Restore the process-wide settings"""
+        replace_settings(self.previous_settings)
+    
+    def _reloader(self, config):
+        reloader = SettingsReloader(load_settings(str(config), environ=ENVIRON),
+                                    loader=lambda path: load_settings(path, environ=ENVIRON))
+        reloader.subscribe(lambda old, new: self.changes.append((old, new)))
+        return reloader
+    
+    def _edit(self, config, text):
+        config.write_text(text)
+        # Make sure the change is visible even on coarse mtime resolution
+        stat = os.stat(config)
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    def test_reload_on_file_change(self, tmp_path):
+        """Test an edited config file is swapped in and listeners see old and new settings"""
+        config = tmp_path / 'config.toml'
+        config.write_text('schedule_time = "06:00"\nmax_articles = 10\n')
+        reloader = self._reloader(config)
+        
+        assert reloader.check() is False
+        
+        self._edit(config, 'schedule_time = "08:15"\nmax_articles = 25\n')
+        assert reloader.check() is True
+        
+        assert reloader.current.schedule_time == '08:15'
+        assert reloader.current.max_articles == 25
+        assert get_settings() is reloader.current
+        old, new = self.changes[0]
+        assert changed_settings(old, new) == ['schedule_time', 'max_articles']
+    
+    def test_invalid_config_keeps_current(self, tmp_path):
+        """Test unparseable or invalid settings leave the current settings in place"""
+        config = tmp_path / 'config.toml'
+        config.write_text('schedule_time = "06:00"\n')
+        reloader = self._reloader(config)
+        current = reloader.current
+        
+        self._edit(config, 'schedule_time = \n')
+        assert reloader.check() is False
+        
+        self._edit(config, 'schedule_time = "25:00"\n')
+        assert reloader.check() is False
+        
+        assert reloader.current is current
+        assert self.changes == []
+    
+    def test_unchanged_settings_do_not_notify(self, tmp_path):
+        """Test a reload that changes nothing does not call listeners"""
+        config = tmp_path / 'config.toml'
+        config.write_text('max_articles = 10\n')
+        reloader = self._reloader(config)
+        
+        self._edit(config, '# just a comment\nmax_articles = 10\n')
+        
+        assert reloader.check() is False
+        assert self.changes == []
+    
+    @pytest.mark.skipif(not hasattr(signal, 'SIGHUP'), reason="SIGHUP is not available")
+    def test_sighup_requests_reload(self, tmp_path):
+        """Test SIGHUP wakes the reloader and reloads the config"""
+        config = tmp_path / 'config.toml'
+        config.write_text('max_articles = 10\n')
+        reloader = self._reloader(config)
+        previous = signal.getsignal(signal.SIGHUP)
+        try:
+            reloader.install_signal_handler()
+            # Same size and mtime, so only the signal can trigger the reload
+            stat = os.stat(config)
+            config.write_text('max_articles = 30\n')
+            os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            
+            os.kill(os.getpid(), signal.SIGHUP)
+            assert reloader.wait(5) is True
+            assert reloader.check() is True
+        finally:
+            signal.signal(signal.SIGHUP, previous)
+        
+        assert reloader.current.max_articles == 30
@@ -0,0 +1,95 @@
+"""
+Unit tests for the sentiment module.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+from src.agent.sentiment import SentimentTagger, CompiledLexicon
+
+
+class TestSentimentTagger:
+    """Test cases for SentimentTagger class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.tagger = SentimentTagger()
+        self.articles = [
+            {
+                'title': 'OpenAI launches breakthrough GPT model',
+                'summary': '<p>Researchers report impressive benchmark gains.</p>',
+                'link': 'https://example.com/1'
+            },
+            {
+                'title': 'AI startup faces lawsuit over data breach',
+                'summary': 'Regulators warn of security risks.',
+                'link': 'https://example.com/2'
+            },
+            {
+                'title': 'Weekly roundup',
+                'summary': '',
+                'link': 'https://example.com/3'
+            }
+        ]
+    
+    def test_annotate_labels_and_tags(self):
+        """Test sentiment labels and topic tags are added to each article"""
+        annotated = self.tagger.annotate(self.articles)
+        
+        assert [article['sentiment_label'] for article in annotated] == ['positive', 'negative', 'neutral']
+        assert annotated[0]['sentiment'] > 0 > annotated[1]['sentiment']
+        assert annotated[2]['sentiment'] == 0.0
+        assert 'Research' in annotated[0]['tags']
+        assert 'Security' in annotated[1]['tags']
+        assert annotated[2]['tags'] == []
+    
+    def test_annotate_keeps_original_fields(self):
+        """Test annotation returns copies and leaves the input untouched"""
+        annotated = self.tagger.annotate(self.articles)
+        
+        assert annotated[0]['link'] == 'https://example.com/1'
+        assert 'sentiment' not in self.articles[0]
+    
+    def test_annotate_empty_batch(self):
+        """Test an empty batch"""
+        assert self.tagger.annotate([]) == []
+    
+    def test_whole_words_only(self):
+        """Test lexicon terms inside longer words are not counted"""
+        scores, topic_counts = self.tagger.score(['Bandwidth and finesse', 'A ban and a fine'])
+        
+        assert scores[0] == 0.0
+        assert scores[1] < 0
+    
+    def test_fine_tuning_is_not_negative(self):
+        """Test fine-tuning headlines are not scored as penalties"""
+        scores, topic_counts = self.tagger.score(['Meta releases fine-tuning toolkit', 'Regulator fined the company'])
+        
+        assert scores[0] == 0.0
+        assert scores[1] < 0
+    
+    def test_max_tags(self):
+        """Test at most max_tags tags are assigned, most hits first"""
+        tagger = SentimentTagger(max_tags=1)
+        annotated = tagger.annotate([{'title': 'GPU chips for LLM research', 'summary': 'Nvidia GPU chips'}])
+        
+        assert annotated[0]['tags'] == ['Hardware']
+    
+    def test_custom_lexicon(self):
+        """Test a custom lexicon"""
+        tagger = SentimentTagger(CompiledLexicon({'good': 1.0, 'bad': -1.0}, {'Quality': ['good', 'bad']}))
+        scores, topic_counts = tagger.score(['good good', 'bad', 'neither'])
+        
+        assert scores[0] > scores[1]
+        np.testing.assert_array_equal(topic_counts[:, 0], [2, 1, 0])
+    
+    def test_numpy_fallback_matches(self):
+        """Test the NumPy-only path gives the same results as the SciPy path"""
+        texts = [f"{a['title']} {a['summary']}" for a in self.articles] * 3
+        
+        with patch('src.agent.sentiment.sparse', None):
+            fallback_scores, fallback_topics = self.tagger.score(texts)
+        scores, topics = self.tagger.score(texts)
+        
+        np.testing.assert_allclose(scores, fallback_scores)
+        np.testing.assert_allclose(topics, fallback_topics)
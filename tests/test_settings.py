@@ -0,0 +1,108 @@
+"""
+Unit tests for the settings module.
+"""
+
+import dataclasses
+
+import pytest
+from src.config.settings import Settings, load_settings, validate_config
+
+
+class TestSettings:
+    """Test cases for loading and validating settings"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.environ = {
+            'GEMINI_API_KEY': 'key',
+            'SENDER_EMAIL': 'sender@example.com',
+            'EMAIL_PASSWORD': 'secret',
+            'RECIPIENT_EMAIL': 'a@example.com, b@example.com',
+            'MAX_ARTICLES': '15',
+            'RUN_MODE': 'ONCE',
+            'ENRICH_CONTENT': 'true',
+            'SLACK_WEBHOOK_URLS': 'https://hooks.slack.com/1,https://hooks.slack.com/2',
+            'LLM_HEDGE_AFTER': '0'
+        }
+    
+    def test_defaults(self):
+        """Test settings without any configuration use the defaults"""
+        settings = load_settings(environ={})
+        
+        assert settings == Settings()
+        assert settings.schedule_time == '06:00'
+        assert settings.email_config.smtp_server == 'smtp.gmail.com'
+        assert settings.config_file is None
+    
+    def test_from_environment(self):
+        """Test environment variables are parsed into typed values"""
+        settings = load_settings(environ=self.environ)
+        
+        assert settings.recipients == ('a@example.com', 'b@example.com')
+        assert settings.max_articles == 15
+        assert settings.run_mode == 'once'
+        assert settings.enrich_content is True
+        assert settings.email_config.email == 'sender@example.com'
+        assert settings.delivery_config.slack == ('https://hooks.slack.com/1', 'https://hooks.slack.com/2')
+        assert settings.llm_config.hedge_after is None
+    
+    def test_immutable(self):
+        """Test settings cannot be changed in place"""
+        settings = load_settings(environ=self.environ)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.max_articles = 5
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.email_config.email = 'other@example.com'
+    
+    def test_config_file_overrides_environment(self, tmp_path):
+        """Test values in the config file take precedence over the environment"""
+        config = tmp_path / 'config.toml'
+        config.write_text(
+            'schedule_time = "07:30"\n'
+            'recipients = ["c@example.com"]\n'
+            '[llm_config]\n'
+            'timeout = 5\n'
+        )
+        
+        settings = load_settings(str(config), environ=self.environ)
+        
+        assert settings.schedule_time == '07:30'
+        assert settings.recipients == ('c@example.com',)
+        assert settings.llm_config.timeout == 5.0
+        assert settings.llm_config.max_wait == 10.0
+        assert settings.max_articles == 15
+        assert settings.config_file == str(config)
+    
+    def test_config_file_from_environment(self, tmp_path):
+        """Test CONFIG_FILE names the config file"""
+        config = tmp_path / 'agent.toml'
+        config.write_text('max_articles = 20\n')
+        
+        settings = load_settings(environ={**self.environ, 'CONFIG_FILE': str(config)})
+        
+        assert settings.max_articles == 20
+    
+    def test_invalid_values(self, tmp_path):
+        """Test invalid values and unknown settings are reported"""
+        with pytest.raises(ValueError, match='MAX_ARTICLES'):
+            load_settings(environ={'MAX_ARTICLES': 'many'})
+        
+        config = tmp_path / 'config.toml'
+        config.write_text('[llm_config]\ntimeout_seconds = 5\n')
+        with pytest.raises(ValueError, match='llm_config.timeout_seconds'):
+            load_settings(str(config), environ={})
+        
+        config.write_text('schedule_time = \n')
+        with pytest.raises(ValueError, match='Invalid config file'):
+            load_settings(str(config), environ={})
+    
+    def test_validate_config(self):
+        """Test validation of required and well-formed settings"""
+        settings = load_settings(environ=self.environ)
+        
+        assert validate_config(settings) == (True, None)
+        assert validate_config(dataclasses.replace(settings, recipients=()))[0] is False
+        assert validate_config(dataclasses.replace(settings, schedule_time='7am'))[0] is False
+        assert validate_config(dataclasses.replace(settings, max_articles=0))[0] is False
+        assert validate_config(Settings(run_mode='ingest')) == (True, None)
@@ -0,0 +1,59 @@
+"""
+Unit tests for the snapshot store module.
+"""
+
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+from src.storage.snapshot_store import SnapshotStore
+
+
+class TestSnapshotStore:
+    """Test cases for SnapshotStore class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.articles = [
+            {'title': 'Test AI News', 'link': 'https://example.com/1', 'summary': 'Summary', 'source': 'Test', 'published': 'Recent'}
+        ]
+    
+    def test_publish_writes_all_representations(self, tmp_path):
+        """Test a snapshot contains JSON, HTML and their gzipped copies"""
+        store = SnapshotStore(str(tmp_path))
+        
+        snapshot_id = store.publish(self.articles, 'AI summary', '<html>digest</html>', subject='Digest',
+                                    created_at=datetime(2023, 12, 1, 6, 0))
+        
+        assert snapshot_id.startswith('20231201T060000-')
+        assert store.latest_id() == snapshot_id
+        
+        json_rep = store.load(snapshot_id, 'json')
+        document = json.loads(json_rep.body)
+        assert document['id'] == snapshot_id
+        assert document['summary'] == 'AI summary'
+        assert document['articles'] == self.articles
+        assert gzip.decompress(json_rep.gzipped) == json_rep.body
+        
+        html_rep = store.load(snapshot_id, 'html')
+        assert html_rep.body == b'<html>digest</html>'
+        assert html_rep.content_type.startswith('text/html')
+        assert html_rep.etag != json_rep.etag
+    
+    def test_list_ids_newest_first(self, tmp_path):
+        """Test snapshots are listed newest first"""
+        store = SnapshotStore(str(tmp_path))
+        older = store.publish(self.articles, 'a', '<html/>', created_at=datetime(2023, 12, 1))
+        newer = store.publish(self.articles, 'b', '<html/>', created_at=datetime(2023, 12, 2))
+        
+        assert store.list_ids() == [newer, older]
+        assert store.latest_id() == newer
+    
+    def test_load_rejects_invalid_ids(self, tmp_path):
+        """Test path traversal and unknown snapshots return None"""
+        store = SnapshotStore(str(tmp_path))
+        
+        assert store.load('../etc', 'json') is None
+        assert store.load('20231201T060000-deadbeef', 'json') is None
+        assert store.latest_id() is None
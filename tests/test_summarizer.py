@@ -0,0 +1,90 @@
+"""
+Unit tests for the extractive summarizer module.
+"""
+
+import pytest
+from src.agent.summarizer import ExtractiveSummarizer
+
+
+class TestExtractiveSummarizer:
+    """Test cases for ExtractiveSummarizer class"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.summarizer = ExtractiveSummarizer(max_sentences=2)
+        self.articles = [
+            {
+                'title': 'OpenAI releases new GPT model for developers',
+                'summary': '<p>The new GPT model improves reasoning. Developers can access the GPT model today.</p>...'
+            },
+            {
+                'title': 'Google announces Gemini model update for developers',
+                'summary': 'The Gemini model update adds longer context. It ships to developers next week.'
+            },
+            {
+                'title': 'Robotics startup raises funding round',
+                'summary': 'The startup builds warehouse robots.'
+            }
+        ]
+    
+    def test_split_sentences(self):
+        """Test sentence extraction from titles and summaries"""
+        sentences = self.summarizer.split_sentences(self.articles)
+        
+        assert 'OpenAI releases new GPT model for developers.' in sentences
+        assert 'The new GPT model improves reasoning.' in sentences
+        # HTML is stripped and short fragments are dropped
+        assert not any('<p>' in sentence for sentence in sentences)
+        assert all(len(sentence.split()) >= 4 for sentence in sentences)
+    
+    def test_split_sentences_drops_truncated_tail(self):
+        """Test the cut-off end of a truncated summary is not used as a sentence"""
+        articles = [
+            {'title': 'Chip maker unveils new accelerator', 'summary': 'The accelerator doubles throughput per watt. '
+             'It needs less compute than previous generations of the compa...'},
+            {'title': 'Lab publishes open model weights', 'summary': 'The weights are released under a permissive license....'}
+        ]
+        
+        sentences = self.summarizer.split_sentences(articles)
+        
+        assert 'The accelerator doubles throughput per watt.' in sentences
+        assert 'The weights are released under a permissive license.' in sentences
+        assert not any('compa' in sentence for sentence in sentences)
+    
+    def test_split_sentences_skips_duplicates(self):
+        """Test that repeated sentences are only kept once"""
+        sentences = self.summarizer.split_sentences(self.articles + self.articles)
+        assert len(sentences) == len(set(sentences))
+    
+    def test_rank_sentences_skips_redundant(self):
+        """Test that near-identical sentences are not both selected"""
+        sentences = [
+            'OpenAI releases new GPT model today.',
+            'OpenAI releases new GPT model today!',
+            'Robotics startup raises large funding round.'
+        ]
+        ranked = self.summarizer.rank_sentences(sentences)
+        
+        assert len(ranked) == 2
+        assert 2 in ranked
+    
+    def test_summarize(self):
+        """Test summary length and content"""
+        summary = self.summarizer.summarize(self.articles)
+        
+        assert isinstance(summary, str)
+        assert 0 < summary.count('.') <= 2
+        assert 'model' in summary
+    
+    def test_condense_keeps_original_order(self):
+        """Test condensed sentences preserve their input order"""
+        sentences = self.summarizer.split_sentences(self.articles)
+        condensed = self.summarizer.condense(self.articles, max_sentences=3)
+        
+        positions = [sentences.index(sentence) for sentence in condensed]
+        assert positions == sorted(positions)
+    
+    def test_empty_input(self):
+        """Test summarizing no articles"""
+        assert self.summarizer.summarize([]) == ""
+        assert self.summarizer.rank_sentences([]) == []